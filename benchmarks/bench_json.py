@@ -0,0 +1,68 @@
+"""This is the module that benchmarks the json serializer backends on large themes.
+
+Command:
+    PYTHONPATH=src python benchmarks/bench_json.py
+"""
+
+import timeit
+from logging import getLogger
+
+from lib.common.file import JSON_SERIALIZERS, dumps_json, loads_json
+from lib.common.metrics import format_table
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+
+def make_theme(n_pages: int = 500, n_keys: int = 20) -> dict[str, dict[str, object]]:
+    """Makes large theme data.
+
+    Args:
+        n_pages (int): The number of pages.
+        n_keys (int): The number of keys per page.
+
+    Returns:
+        dict[str, dict[str, object]]: theme data.
+    """
+    return {
+        f'CTkWidget{i}': {
+            **{f'fg_color_{j}': ['#112233', '#445566'] for j in range(n_keys)},
+            'corner_radius': 6,
+            'macOS': {'family': 'SF Display', 'size': 13, 'weight': 'normal'},
+        } for i in range(n_pages)
+    }
+
+
+def main(number: int = 20) -> None:
+    """Main.
+
+    Args:
+        number (int): The number of calls.
+    """
+    data = make_theme()
+    size = len(dumps_json(data=data, indent=2, backend='json'))
+    rows = []
+    for backend in JSON_SERIALIZERS:
+        raw = dumps_json(data=data, indent=2, backend=backend)
+        dumps_sec = timeit.timeit(
+            stmt=lambda: dumps_json(data=data, indent=2, backend=backend),  # noqa: B023
+            number=number,
+        ) / number
+        loads_sec = timeit.timeit(
+            stmt=lambda: loads_json(raw=raw, backend=backend),  # noqa: B023
+            number=number,
+        ) / number
+        rows.append([
+            backend,
+            f'{dumps_sec * 1e3:.3f}',
+            f'{loads_sec * 1e3:.3f}',
+            f'{size / dumps_sec / 1e6:.1f}',
+        ])
+    print(f'theme size: {size / 1e6:.2f} MB')
+    header = ['backend', 'dumps (ms)', 'loads (ms)', 'dumps MB/s']
+    print(format_table(header=header, rows=rows))
+
+
+if __name__ == '__main__':
+    main()
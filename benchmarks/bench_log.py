@@ -0,0 +1,59 @@
+"""This is the module that benchmarks the debug logging with the level disabled.
+
+Command:
+    PYTHONPATH=src python benchmarks/bench_log.py
+"""
+
+import logging
+import timeit
+from logging import DEBUG, getLogger
+
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+
+def make_theme(n_pages: int = 50, n_keys: int = 20) -> dict[str, dict[str, list[str]]]:
+    """Makes large theme data.
+
+    Args:
+        n_pages (int): The number of pages.
+        n_keys (int): The number of keys per page.
+
+    Returns:
+        dict[str, dict[str, list[str]]]: theme data.
+    """
+    return {
+        f'CTkWidget{i}': {
+            f'fg_color_{j}': ['#112233', '#445566'] for j in range(n_keys)
+        } for i in range(n_pages)
+    }
+
+
+def main(number: int = 10000) -> None:
+    """Main.
+
+    Args:
+        number (int): The number of calls.
+    """
+    LOGGER.setLevel(level=logging.INFO)
+    data = make_theme()
+
+    def eager() -> None:
+        LOGGER.debug(f'{data=}')
+
+    def guarded() -> None:
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(f'{data=}')
+
+    def args() -> None:
+        LOGGER.debug('data=%r', data)
+
+    for name, func in [('f-string', eager), ('guarded', guarded), ('args', args)]:
+        sec = timeit.timeit(stmt=func, number=number)
+        print(f'{name:<12}: {sec / number * 1e6:>10.3f} usec/call')
+
+
+if __name__ == '__main__':
+    main()
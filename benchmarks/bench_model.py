@@ -0,0 +1,118 @@
+"""This is the module that benchmarks the memory and copy costs of the theme model.
+
+Command:
+    PYTHONPATH=src python benchmarks/bench_model.py
+"""
+
+import copy
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from logging import getLogger
+from typing import Any
+
+from lib.common.metrics import format_table
+from lib.common.types import ColorTable, ParamLog, ThemeModel
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+
+def make_library(
+        n_themes: int = 200,
+        n_pages: int = 20,
+        n_keys: int = 8,
+    ) -> list[dict[str, dict[str, Any]]]:
+    """Makes a large theme library.
+
+        *   The colors are taken from a small palette per theme, as in real themes.
+
+    Args:
+        n_themes (int): The number of themes.
+        n_pages (int): The number of pages per theme.
+        n_keys (int): The number of color keys per page.
+
+    Returns:
+        list[dict[str, dict[str, Any]]]: theme data list.
+    """
+    return [
+        {
+            f'CTkWidget{i}': {
+                **{
+                    f'fg_color_{j}': [
+                        f'#{(t * 31 + j) % 256:02x}3355',
+                        f'#{(t * 17 + j) % 256:02x}6688',
+                    ] for j in range(n_keys)
+                },
+                'text_color': 'gray14',
+                'corner_radius': 6,
+            } for i in range(n_pages)
+        } for t in range(n_themes)
+    ]
+
+
+def measure(func: Callable[[], Any]) -> tuple[Any, int]:
+    """Measures the memory allocated by a function.
+
+    Args:
+        func (Callable[[], Any]): function.
+
+    Returns:
+        tuple[Any, int]: The result and the allocated memory. (bytes)
+    """
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main(number: int = 5) -> None:
+    """Main.
+
+    Args:
+        number (int): The number of calls.
+    """
+    library, dict_size = measure(func=make_library)
+    table = ColorTable()
+    models, model_size = measure(
+        func=lambda: [ThemeModel.from_data(data=data, table=table) for data in library],
+    )
+    if [model.to_data() for model in models] != library:
+        LOGGER.error('The theme models do not round-trip to the theme data.')
+        raise ValueError
+
+    def copy_dicts() -> list:
+        return [
+            {key: dict(val) for key, val in data.items()} for data in library
+        ]
+
+    rows = [
+        [
+            'dict (shallow pages)',
+            f'{dict_size / 1e6:.2f}',
+            f'{timeit.timeit(stmt=copy_dicts, number=number) / number * 1e3:.1f}',
+        ],
+        [
+            'dict (deepcopy)',
+            f'{dict_size / 1e6:.2f}',
+            f'{timeit.timeit(
+                stmt=lambda: copy.deepcopy(library),
+                number=number,
+            ) / number * 1e3:.1f}',
+        ],
+        [
+            'ThemeModel',
+            f'{model_size / 1e6:.2f}',
+            f'{timeit.timeit(
+                stmt=lambda: [model.copy() for model in models],
+                number=number,
+            ) / number * 1e3:.1f}',
+        ],
+    ]
+    print(f'themes: {len(library)}, unique colors: {len(table.names)}')
+    print(format_table(header=['form', 'memory (MB)', 'copy (ms)'], rows=rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""This is the module that benchmarks the generation of theme variants without the GUI.
+
+Command:
+    PYTHONPATH=src python benchmarks/bench_palette.py
+"""
+
+import time
+from logging import getLogger
+from pathlib import Path
+
+import customtkinter as ctk
+
+from lib.common import palette
+from lib.common.file import dumps_json, load_json
+from lib.common.metrics import format_table
+from lib.common.palette import PaletteTransformer, Variant
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+
+def main(n_variants: int = 2000) -> None:
+    """Main.
+
+    Args:
+        n_variants (int): The number of variants.
+    """
+    data = load_json(fpath=Path(ctk.__file__).parent / 'assets/themes/blue.json')
+    variants = [
+        Variant(
+            name=f'v{i}',
+            hue=i * 360 / n_variants,
+            lightness=(i % 5 - 2) * 0.05,
+            dark_from_light=i % 2 == 1,
+        ) for i in range(n_variants)
+    ]
+    transformer = PaletteTransformer()
+    backends = {'numpy': palette.np, 'python': None}
+    rows = []
+    for backend, np_module in backends.items():
+        if backend == 'numpy' and np_module is None:
+            continue
+        default = palette.np
+        palette.np = np_module
+        try:
+            start_time = time.perf_counter()
+            for _, variant_data in transformer.transform_many(
+                data=data,
+                variants=variants,
+            ):
+                dumps_json(data=variant_data, indent=2)
+            elapsed = time.perf_counter() - start_time
+        finally:
+            palette.np = default
+        rows.append([
+            backend,
+            f'{elapsed * 1e3 / n_variants:.3f}',
+            f'{n_variants / elapsed * 60:.0f}',
+        ])
+    header = ['backend', 'ms/variant', 'variants/min']
+    print(format_table(header=header, rows=rows))
+
+
+if __name__ == '__main__':
+    main()
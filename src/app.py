@@ -8,16 +8,20 @@ from typing import TYPE_CHECKING, Any
 
 import customtkinter as ctk
 
+from lib.common.color import ColorResolver
+from lib.common.contrast import ContrastAuditor
 from lib.common.decorator import process_time, save_params_log
-from lib.common.file import load_yaml
+from lib.common.file import ThemeCache, dump_json, load_yaml
 from lib.common.log import SetLogging
+from lib.common.palette import PaletteTransformer
+from lib.common.store import ThemeStore
 from lib.common.types import THEME_DATA_TYPE, ParamLog, SideBarFrameName
 from lib.common.types import EventName as E
 from lib.common.types import ParamKey as K
-from lib.components.base import EventBus
+from lib.components.base import EventBus, PageContext
 from lib.components.home import FIRST_PAGE_NAME, HomePage
 from lib.components.sample import SamplePage
-from lib.components.setting import SettingPage
+from lib.components.setting import SettingPage, merge_change_conf
 from lib.components.sidebar import SideBar
 
 if TYPE_CHECKING:
@@ -41,7 +45,21 @@ class App(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure((1, 2), weight=1)
 
-        self.event_bus = EventBus()
+        self.event_bus = EventBus(master=self)
+        # [Attention]
+        # A burst of setting changes (e.g., pasting a value) is merged per widget and
+        # applied to the sample page once per Tk idle cycle.
+        self.event_bus.set_coalesce(
+            event_name=E.CHANGE_CONF,
+            key='item_name',
+            merge=merge_change_conf,
+        )
+        # [Attention]
+        # Worker threads post events with EventBus.post, which are run here.
+        self.event_bus.start_polling()
+        if params.get(K.PROFILE):
+            self.event_bus.enable_profiling()
+            self.bind(sequence='<Control-p>', func=self.on_log_profile)
 
         self.sidebar = SideBar(master=self, event_bus=self.event_bus)
         self.sidebar.grid(row=0, column=0, sticky=ctk.NS)
@@ -51,13 +69,52 @@ class App(ctk.CTk):
         self.sample_page = SamplePage(master=self, event_bus=self.event_bus)
         self.sample_page.grid(row=0, column=2, sticky=ctk.NSEW)
 
+        # [Attention]
+        # In the lazy page mode, each settings page is built on its first display.
+        # Until then, its data is kept in self.theme_store.
+        self.lazy_page: bool = params.get(K.LAZY, True)
+        # [Attention]
+        # The settings pages write their values to the theme store, and the Home page
+        # saves the theme data from it.
+        self.theme_store = ThemeStore()
+        # [Attention]
+        # The color names are resolved by Tk once and shared by all settings pages.
+        self.color_resolver = ColorResolver(master=self)
+        self.contrast_auditor = ContrastAuditor(color_resolver=self.color_resolver)
+
+        # [Attention]
+        # With --cache, the parsed theme files are also saved in the result directory
+        # and reused by later runs.
+        self.theme_cache = ThemeCache(
+            cache_dir=Path(params.get(K.RESULT) or '.', 'cache')
+            if params.get(K.CACHE) else None,
+        )
+        # [Attention]
+        # The models and options above are shared by the Home page and settings pages.
+        self.page_context = PageContext(
+            theme_store=self.theme_store,
+            theme_cache=self.theme_cache,
+            color_resolver=self.color_resolver,
+            contrast_auditor=self.contrast_auditor,
+            palette_transformer=PaletteTransformer(color_resolver=self.color_resolver),
+            virtual_rows=params.get(K.VIRTUAL, 100),
+            watch_interval=params.get(K.WATCH, 1000),
+            save_thread=params.get(K.SAVE_THREAD, False),
+        )
+
         self.current_setting_page: BasePage = None
         self.setting_pages: dict[str, BasePage] = {
-            FIRST_PAGE_NAME: HomePage(master=self, event_bus=self.event_bus),
+            FIRST_PAGE_NAME: HomePage(
+                master=self,
+                event_bus=self.event_bus,
+                context=self.page_context,
+            ),
         }
 
         self.event_bus.subscribe(event_name=E.SHOW_PAGE, callback=self.on_show_page)
         self.event_bus.subscribe(event_name=E.BUILD_PAGE, callback=self.on_build_page)
+        self.event_bus.subscribe(event_name=E.ADD_PAGES, callback=self.on_add_pages)
+        self.event_bus.subscribe(event_name=E.PATCH_PAGE, callback=self.on_patch_page)
 
         self.event_bus.emit(
             event_name=E.ADD_BUTTON,
@@ -72,7 +129,9 @@ class App(ctk.CTk):
         Args:
             page_name (str): Page name.
         """
-        LOGGER.debug(f'{page_name=}')
+        LOGGER.debug('page_name=%r', page_name)
+        if page_name not in self.setting_pages:
+            self.build_setting_page(page_name=page_name)
         if self.current_setting_page is not None:
             self.current_setting_page.grid_forget()
         self.current_setting_page = self.setting_pages[page_name]
@@ -86,38 +145,184 @@ class App(ctk.CTk):
                 sticky=ctk.NSEW,
             )
 
-    def on_build_page(self, data: THEME_DATA_TYPE) -> None:
+    def on_log_profile(self, *_args) -> None:
+        """Log the event profile as a table.
+        """
+        LOGGER.info(f'\n{self.event_bus.profiler.format_table()}')
+
+    def on_build_page(
+            self,
+            data: THEME_DATA_TYPE,
+            dirty: bool = False,  # noqa: FBT001, FBT002
+            added: bool = False,  # noqa: FBT001, FBT002
+        ) -> None:
         """Build sidebar buttons and settings page based on loaded theme data.
 
-            *   Remove all sidebar buttons and settings pages if they have already been
-                built.
+            *   If they have already been built, they are reconciled with the theme
+                data. The buttons and settings pages of the same names are reused, and
+                only the changed values and widgets are updated.
+            *   In the lazy page mode, the settings pages are not built here.
+                Their data is sent to the sample page directly.
+            *   The sample page is updated once after all pages are processed.
+            *   If the pages have already been added by :data:`E.ADD_PAGES` (e.g., a
+                theme file loaded in chunks), the whole theme is only checked, and the
+                pages that are not in it are removed.
 
         Args:
             data (THEME_DATA_TYPE): Theme data.
+            dirty (bool): If ``True``, the theme data is not saved yet.
+                (e.g., a theme variant)
+            added (bool): If ``True``, the pages have already been added by
+                :data:`E.ADD_PAGES`.
         """
-        self.event_bus.emit(
-            event_name=E.DEL_ALL_BUTTON,
-            exclude_page_name=FIRST_PAGE_NAME,
-        )
-        for key in list(self.setting_pages):
-            LOGGER.debug(f'{key=}')
-            if key != FIRST_PAGE_NAME:
-                self.setting_pages[key].destroy()
-                del self.setting_pages[key]
+        for error in self.color_resolver.check_theme(data=data):
+            LOGGER.warning(f'The color is not previewed. {error}')
+        for issue in self.contrast_auditor.audit(data=data):
+            LOGGER.info(f'Low contrast: {issue}')
 
-        for key, val in data.items():
-            LOGGER.debug(f'{key=}, {val=}')
+        # [Attention]
+        # The sample page collects the widget updates of all pages and applies them
+        # in one pass when the batch is committed.
+        with self.event_bus.batch():
             self.event_bus.emit(
-                event_name=E.ADD_BUTTON,
+                event_name=E.SYNC_BUTTON,
                 frame_name=SideBarFrameName.MAIN,
-                page_name=key,
-            )
-            self.setting_pages[key] = SettingPage(
-                master=self,
-                event_bus=self.event_bus,
-                page_name=key,
-                values=val,
+                page_names=list(data),
             )
+            for key in list(self.setting_pages):
+                LOGGER.debug('key=%r', key)
+                if key != FIRST_PAGE_NAME and key not in data:
+                    self.setting_pages[key].destroy()
+                    del self.setting_pages[key]
+
+            if added:
+                self.theme_store.remove_pages(
+                    page_names=[
+                        key for key in self.theme_store.pages if key not in data
+                    ],
+                )
+            else:
+                self.theme_store.load(data=data, dirty=dirty)
+                self.update_pages(data=data)
+
+    def on_add_pages(self, data: THEME_DATA_TYPE) -> None:
+        """Add sidebar buttons and settings pages of a part of the theme data.
+
+            *   It is used for each chunk of a loading theme file, so only the pages of
+                the chunk are processed. The whole theme is checked once by
+                :data:`E.BUILD_PAGE` when the loading is finished.
+            *   The buttons and settings pages of the same names are reused.
+
+        Args:
+            data (THEME_DATA_TYPE): The theme data of the pages.
+        """
+        with self.event_bus.batch():
+            for page_name in data:
+                if page_name not in self.theme_store.pages:
+                    self.event_bus.emit(
+                        event_name=E.ADD_BUTTON,
+                        frame_name=SideBarFrameName.MAIN,
+                        page_name=page_name,
+                    )
+            self.theme_store.set_pages(data=data)
+            self.update_pages(data=data)
+
+    def update_pages(self, data: THEME_DATA_TYPE) -> None:
+        """Reconcile, build or preview the settings pages of the theme data.
+
+            *   The values of the pages must be in the theme store.
+
+        Args:
+            data (THEME_DATA_TYPE): The theme data of the pages.
+        """
+        reused_pages = reused_keys = num_keys = 0
+        for key, val in data.items():
+            LOGGER.debug('key=%r, val=%r', key, val)
+            page = self.setting_pages.get(key)
+            if isinstance(page, SettingPage):
+                reused_keys += page.reconcile(values=val)
+                reused_pages += 1
+                num_keys += len(val)
+            elif self.lazy_page:
+                self.event_bus.emit(
+                    event_name=E.CHANGE_CONF,
+                    item_name=key,
+                    values=self.get_preview_values(page_name=key),
+                    changed=None,
+                )
+            else:
+                self.build_setting_page(page_name=key)
+        LOGGER.info(
+            f'Reused settings pages: {reused_pages}/{len(data)}, '
+            f'settings: {reused_keys}/{num_keys}',
+        )
+
+    def on_patch_page(self, changes: dict[str, THEME_DATA_TYPE]) -> None:
+        """Apply the changed values of the theme data.
+
+            *   The values of the built settings pages are set, and the sample page is
+                updated by their traces. The other pages send the changed values to
+                the sample page directly.
+
+        Args:
+            changes (dict[str, THEME_DATA_TYPE]): The changed values.
+                (key: page name, val: {setting key: new value})
+        """
+        with self.event_bus.batch():
+            for page_name, values in changes.items():
+                self.theme_store.update_page(
+                    page_name=page_name,
+                    values=values,
+                    dirty=False,
+                )
+                page = self.setting_pages.get(page_name)
+                if isinstance(page, SettingPage):
+                    for key, val in values.items():
+                        page.set_value(key=key, val=val)
+                else:
+                    self.event_bus.emit(
+                        event_name=E.CHANGE_CONF,
+                        item_name=page_name,
+                        values=self.get_preview_values(page_name=page_name),
+                        changed=set(values),
+                    )
+
+    def get_preview_values(self, page_name: str) -> THEME_DATA_TYPE:
+        """Gets the values of a page that has not been built for the sample page.
+
+            *   The settings with invalid colors are not sent, as the settings pages
+                reject them.
+
+        Args:
+            page_name (str): Page name.
+
+        Returns:
+            THEME_DATA_TYPE: setting values.
+        """
+        values = self.theme_store.get_page(page_name=page_name)
+        if all(
+            self.color_resolver.is_valid_value(key=key, val=val)
+            for key, val in values.items()
+        ):
+            return values
+        return {
+            key: val for key, val in values.items()
+            if self.color_resolver.is_valid_value(key=key, val=val)
+        }
+
+    def build_setting_page(self, page_name: str) -> None:
+        """Build the settings page from the theme data.
+
+        Args:
+            page_name (str): Page name.
+        """
+        self.setting_pages[page_name] = SettingPage(
+            master=self,
+            event_bus=self.event_bus,
+            page_name=page_name,
+            values=self.theme_store.get_page(page_name=page_name),
+            context=self.page_context,
+        )
 
 
 @save_params_log(fname=f'log_params_{Path(__file__).stem}.yaml')
@@ -135,6 +340,17 @@ def main(params: dict[str, Any]) -> dict[str, Any]:
     """
     app = App(params=params)
     app.mainloop()
+    LOGGER.info(f'{app.event_bus.coalesce_stats=}')
+    LOGGER.info(f'{app.event_bus.queue_stats=}')
+    LOGGER.info(f'{app.sample_page.configure_stats=}')
+    LOGGER.info(f'{app.theme_cache.stats=}')
+    if app.event_bus.profiler is not None:
+        app.on_log_profile()
+        dump_json(
+            data=app.event_bus.profiler.to_dict(),
+            fpath=Path(params.get(K.RESULT) or '.', 'log_event_profile.json'),
+            indent=2,
+        )
     return params
 
 
@@ -197,6 +413,58 @@ def set_params() -> dict[str, Any]:
             'The choice is blue / dark-blue / green or json file path.'
         ),
     )
+    parser.add_argument(
+        f'--{K.LAZY}',
+        default=True, action=argparse.BooleanOptionalAction,
+        help=(
+            'The flag to build each settings page on its first display.\n'
+            'If --no-lazy, all settings pages are built when a theme is loaded.'
+        ),
+    )
+    parser.add_argument(
+        f'--{K.VIRTUAL}',
+        default=100, type=int,
+        help=(
+            'The number of rows above which a settings page is virtualized.\n'
+            'Only the visible rows are built and recycled while scrolling.\n'
+            'If 0, settings pages are never virtualized.'
+        ),
+    )
+    parser.add_argument(
+        f'--{K.CACHE}',
+        action='store_true',
+        help=(
+            'The flag to save the parsed theme files in "cache" of the result '
+            'directory.\n'
+            'The cache is reused if the content of a theme file is not changed.'
+        ),
+    )
+    parser.add_argument(
+        f'--{K.WATCH}',
+        default=1000, type=int,
+        help=(
+            'The interval to check the loaded theme file for changes. (msec)\n'
+            'The changed values are applied to the app.\n'
+            'If 0, the watch mode is off at startup.'
+        ),
+    )
+    parser.add_argument(
+        f'--{K.SAVE_THREAD}',
+        action='store_true',
+        help=(
+            'The flag to serialize and write theme files on a worker thread, so that '
+            'saving large themes does not block the UI.'
+        ),
+    )
+    parser.add_argument(
+        f'--{K.PROFILE}',
+        action='store_true',
+        help=(
+            'The flag to record the call count and wall time of events.\n'
+            'The table is logged by Ctrl+P and on exit, and saved as json in the '
+            'result directory.'
+        ),
+    )
 
     params = vars(parser.parse_args())
 
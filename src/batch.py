@@ -0,0 +1,315 @@
+"""This is the module that validates and normalizes theme files without the GUI.
+
+*   The theme json files in a directory are processed on a process pool.
+*   The settings are classified and normalized with the same rules as the settings
+    pages (:func:`lib.common.schema.normalize_theme`), but no Tk widgets are created.
+*   The colors are checked without Tk, so only the hex colors and the basic Tk color
+    names are valid. (:func:`lib.common.color.parse_basic_name`)
+*   The contrast of the text colors is audited, and the failures are listed in the
+    report. (:class:`lib.common.contrast.ContrastAuditor`)
+*   Theme variants can be generated from each theme.
+    (:class:`lib.common.palette.PaletteTransformer`)
+"""
+
+import argparse
+import functools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from lib.common.color import ColorResolver
+from lib.common.contrast import ContrastAuditor
+from lib.common.decorator import process_time, save_params_log
+from lib.common.file import dump_json, load_json, load_yaml
+from lib.common.log import SetLogging
+from lib.common.palette import PaletteTransformer, Variant, parse_variants
+from lib.common.schema import normalize_theme
+from lib.common.types import ParamKey as K
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+#: ColorResolver: The color resolver of the process. The colors are cached per process.
+COLOR_RESOLVER = ColorResolver()
+#: ContrastAuditor: The contrast auditor of the process.
+CONTRAST_AUDITOR = ContrastAuditor(color_resolver=COLOR_RESOLVER)
+#: PaletteTransformer: The palette transformer of the process.
+PALETTE_TRANSFORMER = PaletteTransformer(color_resolver=COLOR_RESOLVER)
+
+
+def process_theme(
+        fpath: Path,
+        out_dir: Path | None = None,
+        variants: tuple[Variant, ...] = (),
+        variant_dir: Path | None = None,
+    ) -> dict[str, Any]:
+    """Validates and normalizes a theme file.
+
+        *   It is run on a worker process, so the result is a small dictionary.
+
+    Args:
+        fpath (Path): theme json file path.
+        out_dir (Path | None): The directory to write the normalized theme.
+            If ``None``, it is not written.
+        variants (tuple[Variant, ...]): The variants to generate.
+        variant_dir (Path | None): The directory to write the variants as
+            "{file stem}_{variant name}.json". If ``None``, they are not generated.
+
+    Returns:
+        dict[str, Any]: The file path, the number of pages and settings, the errors,
+        the contrast failures, the number of variants and the processing time.
+    """
+    start_time = time.perf_counter()
+    result: dict[str, Any] = {
+        'path': str(fpath),
+        'pages': 0,
+        'settings': 0,
+        'contrast': [],
+        'variants': 0,
+    }
+    try:
+        data = load_json(fpath=fpath)
+    except (OSError, ValueError) as e:
+        result['errors'] = [f'{type(e).__name__}: {e}']
+    else:
+        normalized, result['errors'] = normalize_theme(data=data)
+        result['errors'].extend(COLOR_RESOLVER.check_theme(data=normalized))
+        result['contrast'] = [
+            issue.to_dict() for issue in CONTRAST_AUDITOR.audit(data=normalized)
+        ]
+        result['pages'] = len(normalized)
+        result['settings'] = sum(
+            len(val) for val in normalized.values() if isinstance(val, dict)
+        )
+        if out_dir is not None:
+            dump_json(
+                data=normalized,
+                fpath=Path(out_dir, fpath.name),
+                indent=2,
+                fast=True,
+            )
+        if variants and variant_dir is not None:
+            for name, variant_data in PALETTE_TRANSFORMER.transform_many(
+                data=normalized,
+                variants=variants,
+            ):
+                dump_json(
+                    data=variant_data,
+                    fpath=Path(variant_dir, f'{fpath.stem}_{name}.json'),
+                    indent=2,
+                    fast=True,
+                )
+                result['variants'] += 1
+    result['time'] = time.perf_counter() - start_time
+    return result
+
+
+def process_themes(
+        fpaths: list[Path],
+        out_dir: Path | None = None,
+        workers: int | None = None,
+        variants: tuple[Variant, ...] = (),
+        variant_dir: Path | None = None,
+    ) -> dict[str, Any]:
+    """Validates and normalizes theme files on a process pool.
+
+    Args:
+        fpaths (list[Path]): theme json file paths.
+        out_dir (Path | None): The directory to write the normalized themes.
+        workers (int | None): The number of worker processes.
+            If ``None``, the number of CPUs.
+        variants (tuple[Variant, ...]): The variants to generate from each theme.
+        variant_dir (Path | None): The directory to write the variants.
+
+    Returns:
+        dict[str, Any]: summary report.
+    """
+    workers = workers or os.cpu_count() or 1
+    # [Attention]
+    # Each theme is small, so themes are sent to the workers in chunks.
+    chunksize = max(1, len(fpaths) // (workers * 4))
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            functools.partial(
+                process_theme,
+                out_dir=out_dir,
+                variants=variants,
+                variant_dir=variant_dir,
+            ),
+            fpaths,
+            chunksize=chunksize,
+        ))
+    elapsed = time.perf_counter() - start_time
+    num_variants = sum(result['variants'] for result in results)
+    return {
+        'themes': len(results),
+        'failed': sum(1 for result in results if result['errors']),
+        'low_contrast': sum(1 for result in results if result['contrast']),
+        'settings': sum(result['settings'] for result in results),
+        'variants': num_variants,
+        'workers': workers,
+        'elapsed': elapsed,
+        'themes_per_sec': len(results) / elapsed if elapsed else 0.0,
+        'variants_per_min': num_variants / elapsed * 60 if elapsed else 0.0,
+        'results': results,
+    }
+
+
+@save_params_log(fname=f'log_params_{Path(__file__).stem}.yaml')
+@process_time(print_func=LOGGER.info)
+def main(params: dict[str, Any]) -> dict[str, Any]:
+    """Main.
+
+    This function is decorated by ``@save_params_log`` and ``@process_time``.
+
+    Args:
+        params (dict[str, Any]): parameters.
+
+    Returns:
+        dict[str, Any]: parameters.
+    """
+    fpaths = sorted(Path(params[K.INPUT]).glob('*.json'))
+    if not fpaths:
+        LOGGER.error(f'There is no theme json file. {params[K.INPUT]=}')
+        raise FileNotFoundError
+
+    out_dir = None
+    if params.get(K.RESULT):
+        out_dir = Path(params[K.RESULT], 'themes')
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    variants = parse_variants(specs=params.get(K.VARIANTS) or [])
+    variant_dir = None
+    if variants:
+        variant_dir = Path(params.get(K.RESULT) or '.', 'variants')
+        variant_dir.mkdir(parents=True, exist_ok=True)
+
+    report = process_themes(
+        fpaths=fpaths,
+        out_dir=out_dir,
+        workers=params.get(K.WORKERS),
+        variants=variants,
+        variant_dir=variant_dir,
+    )
+    for result in report['results']:
+        for error in result['errors']:
+            LOGGER.warning(f'{result["path"]}: {error}')
+    LOGGER.info(
+        f'themes: {report["themes"]} (failed: {report["failed"]}, '
+        f'low contrast: {report["low_contrast"]}), '
+        f'settings: {report["settings"]}, workers: {report["workers"]}, '
+        f'{report["themes_per_sec"]:.1f} themes/sec',
+    )
+    if variants:
+        LOGGER.info(
+            f'variants: {report["variants"]}, '
+            f'{report["variants_per_min"]:.0f} variants/min',
+        )
+    dump_json(
+        data=report,
+        fpath=Path(params.get(K.RESULT) or '.', 'report_batch.json'),
+        indent=2,
+    )
+    return params
+
+
+def set_params() -> dict[str, Any]:
+    """Sets the command line arguments and file parameters.
+
+    *   Set only common parameters as command line arguments.
+    *   Other necessary parameters are set in the file parameters.
+    *   Use a yaml file. (:func:`lib.common.file.load_yaml`)
+
+    Returns:
+        dict[str, Any]: parameters.
+
+    .. attention::
+
+        Command line arguments are overridden by file parameters.
+        This means that if you want to set everything using file parameters,
+        you don't necessarily need to use command line arguments.
+    """
+    # set the command line arguments.
+    parser = argparse.ArgumentParser(formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument(
+        f'--{K.HANDLER}',
+        default=[True, True], type=bool, nargs=2,
+        help=(
+            f'The log handler flag to use.\n'
+            f'True: set handler, False: not set handler\n'
+            f'ex) --{K.HANDLER} arg1 arg2 (arg1: stream handler, arg2: file handler)'
+        ),
+    )
+    parser.add_argument(
+        f'--{K.LEVEL}',
+        default=[20, 20], type=int, nargs=2, choices=[10, 20, 30, 40, 50],
+        help=(
+            f'The log level.\n'
+            f'DEBUG: 10, INFO: 20, WARNING: 30, ERROR: 40, CRITICAL: 50\n'
+            f'ex) --{K.LEVEL} arg1 arg2 (arg1: stream handler, arg2: file handler)'
+        ),
+    )
+    parser.add_argument(
+        f'--{K.PARAM}',
+        default='param/param.yaml', type=str,
+        help=('The parameter file path.'),
+    )
+    parser.add_argument(
+        f'--{K.RESULT}',
+        default='result', type=str,
+        help=(
+            'The directory path to save the results.\n'
+            'The normalized themes are saved in "themes" of it.'
+        ),
+    )
+    parser.add_argument(
+        f'--{K.INPUT}',
+        default='.', type=str,
+        help=('The directory path of the theme json files.'),
+    )
+    parser.add_argument(
+        f'--{K.WORKERS}',
+        default=None, type=int,
+        help=('The number of worker processes. (default: the number of CPUs)'),
+    )
+    parser.add_argument(
+        f'--{K.VARIANTS}',
+        default=[], type=str, nargs='*',
+        help=(
+            'The preset variants to generate from each theme.\n'
+            'They are saved in "variants" of the result directory.\n'
+            'Custom variants are set in the file parameters.\n'
+            f'ex) --{K.VARIANTS} hue+30 darken dark_from_light'
+        ),
+    )
+
+    params = vars(parser.parse_args())
+
+    # set the file parameters.
+    if params.get(K.PARAM):
+        fpath = Path(params[K.PARAM])
+        if fpath.is_file():
+            params.update(load_yaml(fpath=fpath))
+
+    return params
+
+
+if __name__ == '__main__':
+    # set the parameters.
+    params = set_params()
+    # set the logging configuration.
+    PARAM_LOG.HANDLER[PARAM_LOG.SH] = params[K.HANDLER][0]
+    PARAM_LOG.HANDLER[PARAM_LOG.FH] = params[K.HANDLER][1]
+    PARAM_LOG.LEVEL[PARAM_LOG.SH] = params[K.LEVEL][0]
+    PARAM_LOG.LEVEL[PARAM_LOG.FH] = params[K.LEVEL][1]
+    SetLogging(logger=LOGGER, param=PARAM_LOG)
+
+    if params.get(K.RESULT):
+        Path(params[K.RESULT]).mkdir(parents=True, exist_ok=True)
+
+    main(params=params)
@@ -0,0 +1,220 @@
+"""This is the module that resolves the colors of the theme data.
+
+*   The colors are converted to the packed RGB value. (``0xRRGGBB``)
+*   Hex colors are parsed in Python, and the Tk color names are resolved once by
+    ``winfo_rgb`` and cached.
+"""
+
+import string
+import tkinter as tk
+from array import array
+from collections.abc import Iterable
+from logging import getLogger
+from typing import Any
+
+from lib.common.types import (
+    THEME_DATA_TYPE,
+    ParamLog,
+    ThemeModel,
+    is_color_value,
+    parse_hex,
+)
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+#: str: The color that has no RGB value.
+TRANSPARENT = 'transparent'
+#: int: The packed RGB value of :data:`TRANSPARENT`.
+NO_RGB = -1
+
+#: dict[str, int]: The Tk color names resolved without Tk. (e.g., headless)
+#: 'gray0' to 'gray100' and 'grey0' to 'grey100' are also resolved.
+BASIC_COLORS: dict[str, int] = {
+    'black': 0x000000,
+    'white': 0xFFFFFF,
+    'gray': 0xBEBEBE,
+    'grey': 0xBEBEBE,
+    'red': 0xFF0000,
+    'green': 0x00FF00,
+    'blue': 0x0000FF,
+    'yellow': 0xFFFF00,
+    'cyan': 0x00FFFF,
+    'magenta': 0xFF00FF,
+}
+
+
+def parse_basic_name(name: str) -> int | None:
+    """Parses a Tk color name without Tk.
+
+    Args:
+        name (str): color name.
+
+    Returns:
+        int | None: The packed RGB value. ``None`` if it is not supported.
+    """
+    name = name.lower().replace(' ', '')
+    if name in BASIC_COLORS:
+        return BASIC_COLORS[name]
+    if name[:4] in ('gray', 'grey') and name[4:].isdigit():
+        level = int(name[4:])
+        if level <= 100:  # noqa: PLR2004
+            val = round(level * 255 / 100)
+            return val << 16 | val << 8 | val
+    return None
+
+
+class ColorResolver:
+    """Resolves the colors of the theme data.
+
+        *   The results of the color names are cached, so ``winfo_rgb`` is called
+            once per name. Invalid colors are also cached.
+        *   Without ``master`` (e.g., the batch process), the color names are resolved
+            by :func:`parse_basic_name`.
+
+    Args:
+        master (tk.Misc | None): widget class used to call ``winfo_rgb``.
+    """
+    def __init__(self, master: tk.Misc | None = None) -> None:
+        self.master = master
+        #: dict[str, int | None]: The resolved color names. ``None`` if invalid.
+        self.names: dict[str, int | None] = {TRANSPARENT: NO_RGB}
+
+    def resolve_name(self, name: str) -> int | None:
+        """Resolves a color name and caches the result.
+
+        Args:
+            name (str): color name.
+
+        Returns:
+            int | None: The packed RGB value. ``None`` if it is invalid.
+        """
+        if name in self.names:
+            return self.names[name]
+        rgb = None
+        if self.master is None:
+            rgb = parse_basic_name(name=name)
+        elif name.strip():
+            try:
+                red, green, blue = self.master.winfo_rgb(name)
+                rgb = (red >> 8) << 16 | (green >> 8) << 8 | blue >> 8
+            except tk.TclError:
+                rgb = None
+        self.names[name] = rgb
+        return rgb
+
+    def to_rgb(self, name: str) -> int:
+        """Converts a color to the packed RGB value.
+
+        Args:
+            name (str): color string. (e.g., ``'#3B8ED0'``, ``'gray86'``)
+
+        Returns:
+            int: The packed RGB value. :data:`NO_RGB` if it is :data:`TRANSPARENT`.
+
+        Raises:
+            ValueError: If the color is invalid.
+        """
+        rgb = parse_hex(name=name) if name[:1] == '#' else self.resolve_name(name=name)
+        if rgb is None:
+            LOGGER.debug('[name] is not a color. name=%r', name)
+            raise ValueError
+        return rgb
+
+    def is_valid(self, name: str) -> bool:
+        """Checks whether a color is valid.
+
+        Args:
+            name (str): color string.
+
+        Returns:
+            bool: ``True`` if it is valid.
+        """
+        if name[:1] == '#':
+            return parse_hex(name=name) is not None
+        return self.resolve_name(name=name) is not None
+
+    def to_rgb_many(self, names: Iterable[str]) -> tuple[array, list[str]]:
+        """Converts colors to the packed RGB values at once.
+
+            *   The colors are deduplicated, so each color is resolved once even if it
+                is used by many settings. The hex colors are parsed first, and then the
+                color names are resolved in one sweep.
+
+        Args:
+            names (Iterable[str]): color strings.
+
+        Returns:
+            tuple[array, list[str]]: The packed RGB values and the invalid colors.
+            The value of an invalid color is :data:`NO_RGB`. Each invalid color is
+            reported once.
+        """
+        names = list(names)
+        unique = dict.fromkeys(names)
+        rgb: dict[str, int | None] = {
+            name: parse_hex(name=name) for name in unique if name[:1] == '#'
+        }
+        rgb.update(
+            (name, self.resolve_name(name=name)) for name in unique if name not in rgb
+        )
+        invalid = [name for name in unique if rgb[name] is None]
+        for name in invalid:
+            rgb[name] = NO_RGB
+        return array('i', [rgb[name] for name in names]), invalid
+
+    def resolve_model(self, model: ThemeModel) -> list[str]:
+        """Resolves the colors of a theme model.
+
+            *   Each color of the model is resolved once, and the RGB values are set
+                to its :class:`lib.common.types.ColorTable`.
+
+        Args:
+            model (ThemeModel): :class:`lib.common.types.ThemeModel` class.
+
+        Returns:
+            list[str]: The invalid colors.
+        """
+        table = model.table
+        values, invalid = self.to_rgb_many(names=table.names)
+        table.rgb = values
+        return invalid
+
+    def is_valid_value(self, key: str, val: Any) -> bool:
+        """Checks whether the colors of a setting value are valid.
+
+            *   Values that are not colors are always valid.
+            *   An empty color is valid. (It is the same as the other mode.)
+
+        Args:
+            key (str): setting key.
+            val (Any): setting value.
+
+        Returns:
+            bool: ``True`` if it is valid.
+        """
+        if not is_color_value(key=key, val=val):
+            return True
+        names = [val] if isinstance(val, str) else val
+        return all(self.is_valid(name=name) for name in names if name)
+
+    def check_theme(self, data: THEME_DATA_TYPE) -> list[str]:
+        """Checks the colors of the theme data.
+
+            *   Each color is resolved once by :meth:`resolve_model`, and only the
+                settings are checked if any color is invalid.
+
+        Args:
+            data (THEME_DATA_TYPE): theme data.
+
+        Returns:
+            list[str]: The error messages. Empty if all colors are valid.
+        """
+        pages = {key: val for key, val in data.items() if isinstance(val, dict)}
+        if not self.resolve_model(model=ThemeModel.from_data(data=pages)):
+            return []
+        return [
+            f'{page_name}.{key}: {val!r} is not a color.'
+            for page_name, page in pages.items()
+            for key, val in page.items()
+            if not self.is_valid_value(key=key, val=val)
+        ]
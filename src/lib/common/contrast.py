@@ -0,0 +1,366 @@
+"""This is the module that audits the contrast of the theme colors.
+
+*   Each text color is paired with the background colors it is drawn on, and the
+    contrast ratio of WCAG 2 is computed for light and dark mode.
+*   The ratios of all pairs are computed in one batch, with NumPy if it is
+    installed.
+"""
+
+import functools
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from logging import getLogger
+from typing import Any
+
+from lib.common.color import NO_RGB, ColorResolver
+from lib.common.schema import Mode
+from lib.common.types import THEME_DATA_TYPE, ParamLog
+from lib.common.types import WidgetName as W
+from lib.common.types import WidgetSetting as S
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+#: tuple[str, str]: The page and key of the background of transparent colors.
+WINDOW_COLOR = (W.CTK, S.FG_COLOR)
+#: str: The background key of the labels drawn on the parent. (e.g., checkbox)
+WINDOW_KEY = '.'.join(WINDOW_COLOR)
+
+#: dict[str, dict[str, tuple[str, ...]]]: The background keys of each text color
+#: key per widget. The keys of other pages are ``'page_name.key'``.
+TEXT_PAIRS: dict[str, dict[str, tuple[str, ...]]] = {
+    W.BUTTON: {
+        S.TEXT_COLOR: (S.FG_COLOR, S.HOVER_COLOR),
+        S.TEXT_COLOR_DISABLED: (S.FG_COLOR,),
+    },
+    W.LABEL: {S.TEXT_COLOR: (S.FG_COLOR,)},
+    W.ENTRY: {
+        S.TEXT_COLOR: (S.FG_COLOR,),
+        S.PLACEHOLDER_TEXT_COLOR: (S.FG_COLOR,),
+    },
+    W.CHECKBOX: {
+        S.TEXT_COLOR: (WINDOW_KEY,),
+        S.TEXT_COLOR_DISABLED: (WINDOW_KEY,),
+        S.CHECKMARK_COLOR: (S.FG_COLOR,),
+    },
+    W.SWITCH: {
+        S.TEXT_COLOR: (WINDOW_KEY,),
+        S.TEXT_COLOR_DISABLED: (WINDOW_KEY,),
+    },
+    W.RADIOBUTTON: {
+        S.TEXT_COLOR: (WINDOW_KEY,),
+        S.TEXT_COLOR_DISABLED: (WINDOW_KEY,),
+    },
+    W.OPTIONMENU: {
+        S.TEXT_COLOR: (S.FG_COLOR,),
+        S.TEXT_COLOR_DISABLED: (S.FG_COLOR,),
+    },
+    W.COMBOBOX: {
+        S.TEXT_COLOR: (S.FG_COLOR,),
+        S.TEXT_COLOR_DISABLED: (S.FG_COLOR,),
+    },
+    W.SEGMENTEDBUTTON: {
+        S.TEXT_COLOR: (S.SELECTED_COLOR, S.UNSELECTED_COLOR),
+        S.TEXT_COLOR_DISABLED: (S.UNSELECTED_COLOR,),
+    },
+    W.TEXTBOX: {S.TEXT_COLOR: (S.FG_COLOR,)},
+    W.DROPDOWNMENU: {S.TEXT_COLOR: (S.FG_COLOR, S.HOVER_COLOR)},
+}
+#: dict[str, float]: The minimum contrast ratio of each text color key.
+#: (4.5: WCAG AA normal text, 3.0: WCAG AA non-text contrast)
+MIN_RATIOS: dict[str, float] = {
+    S.TEXT_COLOR: 4.5,
+    S.TEXT_COLOR_DISABLED: 3.0,
+    S.PLACEHOLDER_TEXT_COLOR: 4.5,
+    S.CHECKMARK_COLOR: 3.0,
+}
+#: tuple[float, ...]: The linear value of each 8-bit sRGB component.
+LINEAR = tuple(
+    c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4  # noqa: PLR2004
+    for c in (i / 255 for i in range(256))
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ContrastIssue:
+    """Defines a pair of colors whose contrast is too low.
+    """
+    #: str: page name.
+    page_name: str
+    #: str: The key of the text color.
+    key: str
+    #: str: The key of the background color.
+    bg_key: str
+    #: str: mode. ('light' or 'dark')
+    mode: str
+    #: float: contrast ratio.
+    ratio: float
+    #: float: The minimum contrast ratio.
+    min_ratio: float
+
+    def __str__(self) -> str:
+        return (
+            f'{self.page_name}.{self.key} on {self.bg_key} ({self.mode}): '
+            f'{self.ratio:.2f} < {self.min_ratio}'
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts to a dictionary.
+
+        Returns:
+            dict[str, Any]: The fields.
+        """
+        return asdict(self)
+
+
+@functools.cache
+def relative_luminance(rgb: int) -> float:
+    """Computes the relative luminance of a color.
+
+    Args:
+        rgb (int): The packed RGB value. (``0xRRGGBB``)
+
+    Returns:
+        float: relative luminance. (0.0 to 1.0)
+    """
+    return (
+        0.2126 * LINEAR[rgb >> 16 & 0xFF]
+        + 0.7152 * LINEAR[rgb >> 8 & 0xFF]
+        + 0.0722 * LINEAR[rgb & 0xFF]
+    )
+
+
+def contrast_ratios(fg: Sequence[int], bg: Sequence[int]) -> list[float]:
+    """Computes the contrast ratios of pairs of colors.
+
+        *   If NumPy is installed, all pairs are computed at once.
+
+    Args:
+        fg (Sequence[int]): The packed RGB values of the text colors.
+        bg (Sequence[int]): The packed RGB values of the background colors.
+
+    Returns:
+        list[float]: The contrast ratios. (1.0 to 21.0)
+    """
+    if np is None:
+        ratios = []
+        for fg_rgb, bg_rgb in zip(fg, bg):
+            lum1 = relative_luminance(rgb=fg_rgb)
+            lum2 = relative_luminance(rgb=bg_rgb)
+            ratios.append((max(lum1, lum2) + 0.05) / (min(lum1, lum2) + 0.05))
+        return ratios
+
+    linear = np.asarray(LINEAR)
+    weights = np.asarray([0.2126, 0.7152, 0.0722])
+    shifts = np.asarray([16, 8, 0])
+    lums = [
+        linear[np.asarray(rgb, dtype=np.int64)[:, None] >> shifts & 0xFF] @ weights
+        for rgb in (fg, bg)
+    ]
+    ratios = (np.maximum(*lums) + 0.05) / (np.minimum(*lums) + 0.05)
+    return ratios.tolist()
+
+
+def split_modes(val: Any) -> tuple[str, str] | None:
+    """Splits a color setting into light and dark mode.
+
+    Args:
+        val (Any): setting value.
+
+    Returns:
+        tuple[str, str] | None: The light and dark colors. ``None`` if it is not a
+        color.
+    """
+    if isinstance(val, str):
+        return val, val
+    if isinstance(val, list) and len(val) == 2:  # noqa: PLR2004
+        return val[0] or val[1], val[1] or val[0]
+    return None
+
+
+def get_setting(data: THEME_DATA_TYPE, page: dict[str, Any], key: str) -> Any:
+    """Gets a setting value of a page or another page.
+
+    Args:
+        data (THEME_DATA_TYPE): theme data.
+        page (dict[str, Any]): The settings of the page.
+        key (str): setting key. The keys of other pages are ``'page_name.key'``.
+
+    Returns:
+        Any: setting value. ``None`` if it is not set.
+    """
+    page_name, _, name = key.rpartition('.')
+    if page_name:
+        page = data.get(page_name)
+    return page.get(name) if isinstance(page, dict) else None
+
+
+class ContrastAuditor:
+    """Audits the contrast of the theme colors.
+
+    Args:
+        color_resolver (ColorResolver | None): :class:`ColorResolver` class.
+            If ``None``, the colors are resolved without Tk.
+        min_ratios (dict[str, float] | None): The minimum contrast ratio of each text
+            color key. If ``None``, :data:`MIN_RATIOS` is used.
+    """
+    def __init__(
+            self,
+            color_resolver: ColorResolver | None = None,
+            min_ratios: dict[str, float] | None = None,
+        ) -> None:
+        self.color_resolver = color_resolver or ColorResolver()
+        self.min_ratios = min_ratios if min_ratios is not None else MIN_RATIOS
+
+    def to_rgb(self, name: str) -> int:
+        """Converts a color to the packed RGB value.
+
+        Args:
+            name (str): color string.
+
+        Returns:
+            int: The packed RGB value. :data:`NO_RGB` if it is transparent or
+            invalid.
+        """
+        try:
+            return self.color_resolver.to_rgb(name=name)
+        except ValueError:
+            return NO_RGB
+
+    def get_pairs(
+            self,
+            data: THEME_DATA_TYPE,
+            page_names: Sequence[str] | None = None,
+        ) -> list[tuple[tuple[str, str, str, str], int, int]]:
+        """Gets the pairs of the text and background colors.
+
+            *   The pairs are looked up in :data:`TEXT_PAIRS`, so the pages of other
+                widgets are skipped.
+            *   Transparent backgrounds are replaced by the window color.
+            *   Pairs with a transparent or invalid color are skipped.
+
+        Args:
+            data (THEME_DATA_TYPE): theme data.
+            page_names (Sequence[str] | None): The pages to audit.
+                If ``None``, all pages are audited.
+
+        Returns:
+            list[tuple[tuple[str, str, str, str], int, int]]:
+            ((page name, key, background key, mode), text RGB, background RGB)
+        """
+        window = split_modes(get_setting(data=data, page={}, key=WINDOW_KEY))
+        window_rgb = [NO_RGB, NO_RGB] if window is None else [
+            self.to_rgb(name=name) for name in window
+        ]
+        pairs = []
+        for page_name in data if page_names is None else page_names:
+            pairs.extend(self.get_page_pairs(
+                data=data,
+                page_name=page_name,
+                window_rgb=window_rgb,
+            ))
+        return pairs
+
+    def get_page_pairs(
+            self,
+            data: THEME_DATA_TYPE,
+            page_name: str,
+            window_rgb: Sequence[int],
+        ) -> list[tuple[tuple[str, str, str, str], int, int]]:
+        """Gets the pairs of the text and background colors of a page.
+
+        Args:
+            data (THEME_DATA_TYPE): theme data.
+            page_name (str): page name.
+            window_rgb (Sequence[int]): The packed RGB values of the window color.
+                (light, dark)
+
+        Returns:
+            list[tuple[tuple[str, str, str, str], int, int]]:
+            ((page name, key, background key, mode), text RGB, background RGB)
+        """
+        page = data.get(page_name)
+        if not isinstance(page, dict):
+            return []
+        pairs = []
+        for key, bg_keys in TEXT_PAIRS.get(page_name, {}).items():
+            fg = split_modes(page.get(key))
+            for bg_key in bg_keys if fg is not None else ():
+                bg = split_modes(get_setting(data=data, page=page, key=bg_key))
+                if bg is None:
+                    continue
+                for i, mode in enumerate((Mode.LIGHT, Mode.DARK)):
+                    fg_rgb = self.to_rgb(name=fg[i])
+                    bg_rgb = self.to_rgb(name=bg[i])
+                    if bg_rgb == NO_RGB:
+                        bg_rgb = window_rgb[i]
+                    if NO_RGB not in (fg_rgb, bg_rgb):
+                        pairs.append(((page_name, key, bg_key, mode), fg_rgb, bg_rgb))
+        return pairs
+
+    def audit(
+            self,
+            data: THEME_DATA_TYPE,
+            page_names: Sequence[str] | None = None,
+        ) -> list[ContrastIssue]:
+        """Audits the theme data.
+
+        Args:
+            data (THEME_DATA_TYPE): theme data.
+            page_names (Sequence[str] | None): The pages to audit.
+                If ``None``, all pages are audited.
+
+        Returns:
+            list[ContrastIssue]: The pairs whose contrast is too low.
+        """
+        return self.audit_many(themes={'': data}, page_names=page_names)['']
+
+    def audit_many(
+            self,
+            themes: dict[str, THEME_DATA_TYPE],
+            page_names: Sequence[str] | None = None,
+        ) -> dict[str, list[ContrastIssue]]:
+        """Audits the theme data of many themes in one batch.
+
+        Args:
+            themes (dict[str, THEME_DATA_TYPE]): theme data. (key: theme name)
+            page_names (Sequence[str] | None): The pages to audit.
+                If ``None``, all pages are audited.
+
+        Returns:
+            dict[str, list[ContrastIssue]]: The pairs whose contrast is too low.
+            (key: theme name)
+        """
+        labels = []
+        fg = []
+        bg = []
+        for theme_name, data in themes.items():
+            for label, fg_rgb, bg_rgb in self.get_pairs(
+                data=data,
+                page_names=page_names,
+            ):
+                labels.append((theme_name, *label))
+                fg.append(fg_rgb)
+                bg.append(bg_rgb)
+
+        issues: dict[str, list[ContrastIssue]] = {key: [] for key in themes}
+        for (theme_name, page_name, key, bg_key, mode), ratio in zip(
+            labels,
+            contrast_ratios(fg=fg, bg=bg) if labels else [],
+        ):
+            min_ratio = self.min_ratios.get(key, 0.0)
+            if ratio < min_ratio:
+                issues[theme_name].append(ContrastIssue(
+                    page_name=page_name,
+                    key=key,
+                    bg_key=bg_key,
+                    mode=mode,
+                    ratio=ratio,
+                    min_ratio=min_ratio,
+                ))
+        return issues
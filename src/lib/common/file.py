@@ -1,7 +1,17 @@
 """This is the module that load and write files.
 """
 
+import hashlib
 import json
+import marshal
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
 from typing import Any
@@ -12,6 +22,11 @@ import yaml
 from lib.common.process import recursive_replace
 from lib.common.types import ParamLog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PARAM_LOG = ParamLog()
 LOGGER = getLogger(PARAM_LOG.NAME)
 
@@ -19,14 +34,159 @@ LOGGER = getLogger(PARAM_LOG.NAME)
 # -----------------------------------------------
 # json
 # -----------------------------------------------
-def dump_json(data: Any, fpath: Path, mode: str = 'w', **kwargs) -> None:  # noqa: D417
+@dataclass(frozen=True, slots=True)
+class JsonSerializer:
+    """Defines a json serializer backend.
+
+    *   The output is UTF-8 bytes, and non-ASCII characters are not escaped.
+    """
+    #: str: The backend name.
+    name: str
+    #: Callable: The function that serializes data with an indent. (data, indent)
+    dumps: Callable[[Any, int | None], bytes]
+    #: Callable: The function that parses bytes.
+    loads: Callable[[bytes], Any]
+    #: tuple[int | None, ...] | None: The supported indents. ``None`` if any.
+    indents: tuple[int | None, ...] | None = None
+
+
+#: dict[str, JsonSerializer]: The registered json serializers.
+JSON_SERIALIZERS: dict[str, JsonSerializer] = {}
+#: str: The name of the default json serializer.
+JSON_DEFAULT = 'json'
+
+
+def register_json_serializer(
+        serializer: JsonSerializer,
+        *,
+        default: bool = False,
+    ) -> None:
+    """Registers a json serializer.
+
+    Args:
+        serializer (JsonSerializer): :class:`JsonSerializer` class.
+        default (bool): If ``True``, it is used by default.
+    """
+    global JSON_DEFAULT  # noqa: PLW0603
+    JSON_SERIALIZERS[serializer.name] = serializer
+    if default:
+        JSON_DEFAULT = serializer.name
+
+
+def get_json_serializer(name: str | None = None) -> JsonSerializer:
+    """Gets a json serializer.
+
+    Args:
+        name (str | None): The backend name. If ``None``, the default backend.
+
+    Returns:
+        JsonSerializer: :class:`JsonSerializer` class.
+
+    Raises:
+        ValueError: If the backend is not registered.
+    """
+    name = JSON_DEFAULT if name is None else name
+    if name not in JSON_SERIALIZERS:
+        LOGGER.error(f'[name] is not registered. {name=}, {list(JSON_SERIALIZERS)=}')
+        raise ValueError
+    return JSON_SERIALIZERS[name]
+
+
+register_json_serializer(
+    serializer=JsonSerializer(
+        name='json',
+        dumps=lambda data, indent: json.dumps(
+            data, indent=indent, ensure_ascii=False,
+        ).encode('utf-8'),
+        loads=json.loads,
+    ),
+)
+# [Attention]
+# orjson is optional. If it is installed, it is used by default.
+# Without an indent, orjson writes no spaces after the separators unlike the stdlib
+# json, so only the indent of 2 is supported to keep the same output.
+if orjson is not None:
+    register_json_serializer(
+        serializer=JsonSerializer(
+            name='orjson',
+            dumps=lambda data, _: orjson.dumps(data, option=orjson.OPT_INDENT_2),
+            loads=orjson.loads,
+            indents=(2,),
+        ),
+        default=True,
+    )
+
+
+def dumps_json(  # noqa: D417
+        data: Any,
+        indent: int | None = None,
+        backend: str | None = None,
+        **kwargs,
+    ) -> bytes:
+    """Serializes data as json bytes.
+
+    *   If the backend does not support the arguments, or fails to serialize the data
+        (e.g., unsupported types), the stdlib json is used.
+
+    Args:
+        data (Any): serializing data.
+        indent (int | None): indent.
+        backend (str | None): The backend name. If ``None``, the default backend.
+
+    Returns:
+        bytes: UTF-8 json.
+
+    .. note::
+
+        Other keyword arguments (e.g., ``sort_keys``) are passed to the stdlib json.
+    """
+    serializer = get_json_serializer(name=backend)
+    if not kwargs and (serializer.indents is None or indent in serializer.indents):
+        try:
+            return serializer.dumps(data, indent)
+        except TypeError:
+            LOGGER.debug('%s failed to serialize. It uses json.', serializer.name)
+    kwargs.setdefault('ensure_ascii', False)
+    return json.dumps(data, indent=indent, **kwargs).encode('utf-8')
+
+
+def loads_json(raw: bytes | str, backend: str | None = None) -> Any:
+    """Parses json bytes.
+
+    Args:
+        raw (bytes | str): json.
+        backend (str | None): The backend name. If ``None``, the default backend.
+
+    Returns:
+        Any: parsed data.
+    """
+    return get_json_serializer(name=backend).loads(raw)
+
+
+def dump_json(  # noqa: D417
+        data: Any,
+        fpath: Path,
+        mode: str = 'w',
+        *,
+        fast: bool = False,
+        **kwargs,
+    ) -> None:
     """Writes json files.
 
+    *   If ``fast`` is ``True``, the data is serialized by :func:`dumps_json` and
+        written as UTF-8 bytes. (Non-ASCII characters are not escaped.)
+
     Args:
         data (Any): writing data.
         fpath (str): file path.
         mode (str): write mode.
+        fast (bool): If ``True``, the default json backend is used.
     """
+    if fast:
+        raw = dumps_json(data=data, **kwargs)
+        with fpath.open(mode=f'{mode.replace('b', '')}b') as f:
+            f.write(raw)
+        return
     with fpath.open(mode=mode) as f:
         json.dump(obj=data, fp=f, **kwargs)
 
@@ -34,6 +194,9 @@ def dump_json(data: Any, fpath: Path, mode: str = 'w', **kwargs) -> None:  # noq
 def load_json(fpath: Path, mode: str = 'rb', **kwargs) -> dict[str, Any]:  # noqa: D417
     """Loads json files.
 
+    *   The data is parsed by :func:`loads_json`.
+        If keyword arguments are given, the stdlib json is used with them.
+
     Args:
         fpath (str): file path.
         mode (str): load mode.
@@ -42,8 +205,291 @@ def load_json(fpath: Path, mode: str = 'rb', **kwargs) -> dict[str, Any]:  # noq
         dict[str, Any]: loaded data.
     """
     with fpath.open(mode=mode) as f:
-        data = json.load(fp=f, **kwargs)
-    return data
+        if kwargs:
+            return json.load(fp=f, **kwargs)
+        return loads_json(raw=f.read())
+
+
+def write_atomic(raw: bytes, fpath: Path) -> bool:
+    """Writes bytes to a file atomically.
+
+    *   The bytes are written to a temporary file in the same directory, flushed to
+        the disk (fsync) and renamed to the file, so the file is never left
+        half-written.
+    *   If the file already has the same content (size and hash), it is not written.
+
+    Args:
+        raw (bytes): writing bytes.
+        fpath (Path): file path.
+
+    Returns:
+        bool: ``True`` if the file is written, ``False`` if it is not changed.
+    """
+    if fpath.is_file() and fpath.stat().st_size == len(raw):
+        old_digest = hashlib.sha256(fpath.read_bytes()).digest()
+        if old_digest == hashlib.sha256(raw).digest():
+            LOGGER.debug('The content is not changed. fpath=%r', fpath)
+            return False
+
+    # [Attention]
+    # The temporary file is only readable by the owner, so the permission of the
+    # file is kept.
+    mode = fpath.stat().st_mode & 0o777 if fpath.is_file() else 0o644
+    fd, tmp_name = tempfile.mkstemp(
+        dir=fpath.parent,
+        prefix=f'.{fpath.name}.',
+        suffix='.tmp',
+    )
+    tmp_path = Path(tmp_name)
+    # [Attention]
+    # After the rename, the temporary file no longer exists, so it is only removed
+    # if something fails before.
+    try:
+        with os.fdopen(fd, mode='wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.chmod(mode)
+        tmp_path.replace(fpath)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return True
+
+
+def format_json_item(key: str, val: Any, backend: str | None = None) -> str:
+    r"""Formats a top-level item of a dictionary as json text.
+
+    *   Joining the items by ``',\n'`` in ``'{\n'`` and ``'\n}'`` gives the same
+        text as ``json.dumps(data, indent=2, ensure_ascii=False)``.
+
+    Args:
+        key (str): The key of the item.
+        val (Any): The value of the item.
+        backend (str | None): The json backend name. (:func:`dumps_json`)
+
+    Returns:
+        str: json text of the item. (e.g., ``'  "key": 1'``)
+    """
+    text = dumps_json(data=val, indent=2, backend=backend).decode('utf-8')
+    return f'  {json.dumps(key, ensure_ascii=False)}: {text.replace('\n', '\n  ')}'
+
+
+def iter_json_chunks(
+        data: dict[str, Any],
+        chunk_size: int = 65536,
+        backend: str | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Formats a dictionary as json text in chunks.
+
+    *   The text is split at the top-level items, so each chunk has the text and the
+        items in it.
+    *   Joining the text of all chunks gives the same text as
+        ``json.dumps(data, indent=2, ensure_ascii=False)``.
+
+    Args:
+        data (dict[str, Any]): formatting data.
+        chunk_size (int): The min number of characters of a chunk.
+            (The last chunk may be shorter.)
+        backend (str | None): The json backend name. (:func:`dumps_json`)
+
+    Yields:
+        tuple[str, dict[str, Any]]: The text and the top-level items of a chunk.
+    """
+    if not data:
+        yield dumps_json(data=data, indent=2, backend=backend).decode('utf-8'), {}
+        return
+    texts: list[str] = []
+    items: dict[str, Any] = {}
+    length = 0
+    for i, (key, val) in enumerate(data.items()):
+        text = ('{\n' if i == 0 else ',\n') + format_json_item(
+            key=key, val=val, backend=backend,
+        )
+        texts.append(text)
+        items[key] = val
+        length += len(text)
+        if length >= chunk_size:
+            yield ''.join(texts), items
+            texts, items, length = [], {}, 0
+    texts.append('\n}')
+    yield ''.join(texts), items
+
+
+#: int: The time (nsec) after which the mtime of a file is trusted by
+#: :class:`ThemeCache`. A file written within it may be changed again with the same
+#: mtime and size, so its content hash is checked.
+STAT_MARGIN_NS = 2_000_000_000
+#: str: The file suffix of the on-disk cache of :class:`ThemeCache`.
+#: (The marshal format may change between Python versions.)
+CACHE_SUFFIX = f'.py{sys.version_info.major}{sys.version_info.minor}.marshal'
+#: int: The size of the hash of the marshal data at the head of a cache file.
+CACHE_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Defines an entry of :class:`ThemeCache`.
+    """
+    #: tuple[int, int]: The mtime (nsec) and size of the file.
+    stat: tuple[int, int]
+    #: bool: If ``True``, the mtime is old enough to skip reading the file.
+    trusted: bool
+    #: str: The content hash of the file.
+    digest: str
+    #: Any: parsed data.
+    data: Any
+
+
+@dataclass
+class CacheStats:
+    """Defines the counters of :class:`ThemeCache`.
+    """
+    #: int: The number of loads found in memory.
+    hits: int = 0
+    #: int: The number of loads found in the on-disk cache.
+    disk_hits: int = 0
+    #: int: The number of loads parsed from the file.
+    misses: int = 0
+
+
+class ThemeCache:
+    """Caches the parsed data of json files.
+
+    *   If the mtime and size of the file are the same as the entry of the path, the
+        file is not read. Otherwise, the file is read and hashed, and it is parsed only
+        if its content is changed.
+    *   The entries in memory are bounded by LRU (one entry per path).
+    *   If ``cache_dir`` is set, the parsed data is also saved there as marshal files
+        named by the content hash and the Python version, and reused by later runs.
+        Each file starts with the hash of its marshal data, and a file that does not
+        match it is not loaded.
+    *   It is thread-safe, so it can be used on worker threads.
+
+    Args:
+        maxsize (int): The max number of files in memory.
+        cache_dir (Path | None): The directory of the on-disk cache.
+            If ``None``, the on-disk cache is not used.
+
+    .. attention::
+
+        The cached data is shared by all loads of the same file.
+        Do not modify it.
+    """
+    def __init__(self, maxsize: int = 16, cache_dir: Path | None = None) -> None:
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        self.items: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def load(self, fpath: Path) -> Any:
+        """Loads a json file from the cache, or parses it.
+
+        Args:
+            fpath (Path): file path.
+
+        Returns:
+            Any: loaded data.
+        """
+        path = str(fpath.resolve())
+        # [Attention]
+        # The stat is taken before reading, so a file changed while reading has another
+        # stat next time and is read again.
+        stat = fpath.stat()
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self.items.get(path)
+            if entry is not None and entry.trusted and entry.stat == stat_key:
+                self.items.move_to_end(path)
+                self.stats.hits += 1
+                return entry.data
+
+        raw = fpath.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        trusted = time.time_ns() - stat.st_mtime_ns > STAT_MARGIN_NS
+        with self._lock:
+            entry = self.items.get(path)
+            if entry is not None and entry.digest == digest:
+                entry.stat, entry.trusted = stat_key, trusted
+                self.items.move_to_end(path)
+                self.stats.hits += 1
+                return entry.data
+
+        data = self.load_disk(digest=digest)
+        disk_hit = data is not None
+        if not disk_hit:
+            data = loads_json(raw=raw)
+            self.dump_disk(digest=digest, data=data)
+
+        with self._lock:
+            if disk_hit:
+                self.stats.disk_hits += 1
+            else:
+                self.stats.misses += 1
+            self.items[path] = CacheEntry(
+                stat=stat_key,
+                trusted=trusted,
+                digest=digest,
+                data=data,
+            )
+            self.items.move_to_end(path)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+        return data
+
+    def load_disk(self, digest: str) -> Any | None:
+        """Loads the parsed data from the on-disk cache.
+
+        Args:
+            digest (str): The content hash of the file.
+
+        Returns:
+            Any | None: loaded data. ``None`` if it is not cached.
+        """
+        if self.cache_dir is None:
+            return None
+        fpath = Path(self.cache_dir, f'{digest}{CACHE_SUFFIX}')
+        if not fpath.is_file():
+            return None
+        try:
+            raw = fpath.read_bytes()
+            payload = raw[CACHE_DIGEST_SIZE:]
+            if hashlib.sha256(payload).digest() != raw[:CACHE_DIGEST_SIZE]:
+                LOGGER.warning(f'The cache file is broken. {fpath=}')
+                return None
+            # [Attention]
+            # The cache files are only written by dump_disk, named by the content
+            # hash of the theme file and the Python version, and checked by the hash
+            # of the marshal data above, so the data is what this cache wrote.
+            return marshal.loads(payload)  # noqa: S302
+        except (OSError, EOFError, ValueError, TypeError):
+            LOGGER.warning(f'The cache file is broken. {fpath=}')
+            return None
+
+    def dump_disk(self, digest: str, data: Any) -> None:
+        """Saves the parsed data in the on-disk cache.
+
+            *   The file is the hash of the marshal data followed by the data.
+            *   The file is written atomically, so a broken cache file is not left.
+                (:func:`write_atomic`)
+
+        Args:
+            digest (str): The content hash of the file.
+            data (Any): parsed data.
+        """
+        if self.cache_dir is None:
+            return
+        try:
+            payload = marshal.dumps(data)
+        except ValueError:
+            LOGGER.debug('The data is not cached on disk. (unsupported types)')
+            return
+        write_atomic(
+            raw=hashlib.sha256(payload).digest() + payload,
+            fpath=Path(self.cache_dir, f'{digest}{CACHE_SUFFIX}'),
+        )
 
 
 # -----------------------------------------------
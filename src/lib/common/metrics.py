@@ -0,0 +1,85 @@
+"""This is the module that defines the metrics.
+"""
+
+import bisect
+from logging import getLogger
+from typing import Any
+
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+
+class LatencyHistogram:
+    """Records the count and wall time histogram of an operation.
+
+    *   The bucket ``i`` counts values less than or equal to ``bounds[i]``.
+        The last bucket counts values greater than ``bounds[-1]``.
+    """
+    #: tuple[float, ...]: The upper bounds of the buckets. (sec)
+    bounds = (1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 1e-1, 5e-1, 1.0)
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(self.bounds) + 1)
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(count={self.count}, mean={self.mean:.6f}, '
+            f'max={self.max:.6f})'
+        )
+
+    def add(self, value: float) -> None:
+        """Adds a value.
+
+        Args:
+            value (float): wall time. (sec)
+        """
+        self.count += 1
+        self.total += value
+        self.max = max(value, self.max)
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+
+    @property
+    def mean(self) -> float:
+        """The mean of the values.
+
+        Returns:
+            float: mean wall time. (sec)
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts to a dictionary.
+
+        Returns:
+            dict[str, Any]: The count, total, mean, max and histogram.
+        """
+        labels = [f'<={bound}' for bound in self.bounds] + [f'>{self.bounds[-1]}']
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.mean,
+            'max': self.max,
+            'histogram': dict(zip(labels, self.buckets)),
+        }
+
+
+def format_table(header: list[str], rows: list[list[Any]]) -> str:
+    """Formats rows as a text table.
+
+    Args:
+        header (list[str]): column names.
+        rows (list[list[Any]]): rows.
+
+    Returns:
+        str: text table.
+    """
+    cells = [header] + [[str(val) for val in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(header))]
+    lines = [' | '.join(val.ljust(w) for val, w in zip(row, widths)) for row in cells]
+    lines.insert(1, '-+-'.join('-' * w for w in widths))
+    return '\n'.join(lines)
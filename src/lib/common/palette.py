@@ -0,0 +1,497 @@
+"""This is the module that transforms the palette of the theme data.
+
+*   A variant shifts the hue, saturation and lightness of every color of every
+    section, generates the dark mode colors from the light mode colors, or maps the
+    colors to a target palette.
+*   The theme data is converted to :class:`lib.common.types.ThemeModel`, so each
+    distinct color is transformed once per variant.
+*   The color math is done on all colors of all variants at once with NumPy if it
+    is installed.
+"""
+
+import colorsys
+import itertools
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any
+
+from lib.common.color import NO_RGB, ColorResolver
+from lib.common.types import THEME_DATA_TYPE, ColorTable, ParamLog, ThemeModel
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+#: tuple[str, ...]: The fields of :class:`Variant` adjusted in the HLS color space.
+HLS_FIELDS = ('hue', 'saturation', 'lightness')
+#: tuple[ThemeModel, list[str], list[int]]: The model of a variant, and the color
+#: strings and packed RGB values of its color table being transformed.
+VARIANT_COLORS_TYPE = tuple[ThemeModel, list[str], list[int]]
+
+
+@dataclass(frozen=True, slots=True)
+class Variant:
+    """Defines the transforms of a theme variant.
+
+    *   The transforms are applied in the order of the fields.
+    """
+    #: str: variant name.
+    name: str
+    #: bool: If ``True``, the dark mode colors are generated from the light mode
+    #: colors by inverting their lightness.
+    dark_from_light: bool = False
+    #: float: The hue rotation. (degree)
+    hue: float = 0.0
+    #: float: The saturation change. (-1.0 to 1.0)
+    saturation: float = 0.0
+    #: float: The lightness change. (-1.0 to 1.0) Negative values darken.
+    lightness: float = 0.0
+    #: tuple[str, ...]: The target palette. If not empty, each color is mapped to the
+    #: nearest color of it.
+    palette: tuple[str, ...] = ()
+
+
+#: dict[str, Variant]: The variants selectable in the app and the batch process.
+PRESET_VARIANTS: dict[str, Variant] = {
+    variant.name: variant for variant in (
+        Variant(name='hue+30', hue=30),
+        Variant(name='hue-30', hue=-30),
+        Variant(name='hue+180', hue=180),
+        Variant(name='lighten', lightness=0.1),
+        Variant(name='darken', lightness=-0.1),
+        Variant(name='saturate', saturation=0.2),
+        Variant(name='desaturate', saturation=-0.2),
+        Variant(name='dark_from_light', dark_from_light=True),
+    )
+}
+
+
+def parse_variants(specs: Iterable[str | dict[str, Any]]) -> tuple[Variant, ...]:
+    """Parses the variants of the parameters.
+
+    Args:
+        specs (Iterable[str | dict[str, Any]]): The names of
+            :data:`PRESET_VARIANTS` or the fields of :class:`Variant`.
+            (e.g., ``['hue+30', {'name': 'brand', 'hue': 200, 'lightness': -0.05}]``)
+
+    Returns:
+        tuple[Variant, ...]: :class:`Variant` classes.
+
+    Raises:
+        ValueError: If a variant name is not in :data:`PRESET_VARIANTS`.
+    """
+    variants = []
+    for spec in specs:
+        if isinstance(spec, dict):
+            variants.append(Variant(**{
+                **spec,
+                'palette': tuple(spec.get('palette', ())),
+            }))
+        elif spec in PRESET_VARIANTS:
+            variants.append(PRESET_VARIANTS[spec])
+        else:
+            LOGGER.error(f'[spec] is not a preset variant. {spec=}')
+            raise ValueError
+    return tuple(variants)
+
+
+def to_hex(rgb: int) -> str:
+    """Converts a packed RGB value to a hex color.
+
+    Args:
+        rgb (int): The packed RGB value. (``0xRRGGBB``)
+
+    Returns:
+        str: ``'#RRGGBB'``
+    """
+    return f'#{rgb:06X}'
+
+
+def per_color(val: float | Sequence[float], size: int) -> Sequence[float]:
+    """Gets the values of an adjustment per color.
+
+    Args:
+        val (float | Sequence[float]): A value for all colors or values per color.
+        size (int): The number of colors.
+
+    Returns:
+        Sequence[float]: The values per color.
+    """
+    if isinstance(val, Sequence):
+        return val
+    return tuple(itertools.repeat(val, size))
+
+
+def rgb_to_hls_array(rgb: Sequence[int]) -> tuple[Any, Any, Any]:
+    """Converts the colors to the HLS color space with NumPy.
+
+        *   It is the same conversion as :func:`colorsys.rgb_to_hls`.
+
+    Args:
+        rgb (Sequence[int]): The packed RGB values.
+
+    Returns:
+        tuple[Any, Any, Any]: The arrays of hue, lightness and saturation.
+        (0.0 to 1.0)
+    """
+    arr = np.asarray(rgb, dtype=np.int64)
+    r, g, b = ((arr >> shift & 0xFF) / 255 for shift in (16, 8, 0))
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    delta = maxc - minc
+    gray = delta == 0
+    l = (maxc + minc) / 2  # noqa: E741
+    s = np.where(gray, 0.0, delta / np.where(
+        gray,
+        1.0,
+        np.where(l <= 0.5, maxc + minc, 2.0 - maxc - minc),  # noqa: PLR2004
+    ))
+    rc, gc, bc = ((maxc - c) / np.where(gray, 1.0, delta) for c in (r, g, b))
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    return np.where(gray, 0.0, (h / 6.0) % 1.0), l, s
+
+
+def hls_to_rgb_array(h: Any, l: Any, s: Any) -> list[int]:  # noqa: E741
+    """Converts the colors in the HLS color space to RGB with NumPy.
+
+        *   It is the same conversion as :func:`colorsys.hls_to_rgb`.
+
+    Args:
+        h (Any): The array of hue. (0.0 to 1.0)
+        l (Any): The array of lightness. (0.0 to 1.0)
+        s (Any): The array of saturation. (0.0 to 1.0)
+
+    Returns:
+        list[int]: The packed RGB values.
+    """
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - l * s)  # noqa: PLR2004
+    m1 = 2.0 * l - m2
+    r, g, b = (
+        np.rint(np.select(
+            [hue < 1 / 6, hue < 0.5, hue < 2 / 3],  # noqa: PLR2004
+            [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2 / 3 - hue) * 6.0],
+            m1,
+        ) * 255).astype(np.int64)
+        for hue in ((h + offset) % 1.0 for offset in (1 / 3, 0.0, -1 / 3))
+    )
+    return (r << 16 | g << 8 | b).tolist()
+
+
+def adjust_hls(
+        rgb: Sequence[int],
+        hue: float | Sequence[float] = 0.0,
+        saturation: float | Sequence[float] = 0.0,
+        lightness: float | Sequence[float] = 0.0,
+        invert: bool = False,  # noqa: FBT001, FBT002
+    ) -> list[int]:
+    """Adjusts the colors in the HLS color space.
+
+        *   If NumPy is installed, all colors are adjusted at once. Otherwise,
+            :mod:`colorsys` is used per color.
+        *   The adjustments are values for all colors or values per color, so the
+            colors of many variants are adjusted in one call.
+
+    Args:
+        rgb (Sequence[int]): The packed RGB values.
+        hue (float | Sequence[float]): The hue rotation. (degree)
+        saturation (float | Sequence[float]): The saturation change. (-1.0 to 1.0)
+        lightness (float | Sequence[float]): The lightness change. (-1.0 to 1.0)
+        invert (bool): If ``True``, the lightness is inverted first.
+
+    Returns:
+        list[int]: The packed RGB values.
+    """
+    if np is not None:
+        h, l, s = rgb_to_hls_array(rgb=rgb)  # noqa: E741
+        l = 1.0 - l if invert else l  # noqa: E741
+        return hls_to_rgb_array(
+            h=(h + np.asarray(hue) / 360) % 1.0,
+            l=np.clip(l + np.asarray(lightness), 0.0, 1.0),
+            s=np.clip(s + np.asarray(saturation), 0.0, 1.0),
+        )
+
+    result = []
+    for val, dh, ds, dl in zip(
+        rgb,
+        *(per_color(val=val, size=len(rgb)) for val in (hue, saturation, lightness)),
+    ):
+        h, l, s = colorsys.rgb_to_hls(  # noqa: E741
+            (val >> 16 & 0xFF) / 255,
+            (val >> 8 & 0xFF) / 255,
+            (val & 0xFF) / 255,
+        )
+        l = 1.0 - l if invert else l  # noqa: E741
+        r, g, b = colorsys.hls_to_rgb(
+            (h + dh / 360) % 1.0,
+            min(max(l + dl, 0.0), 1.0),
+            min(max(s + ds, 0.0), 1.0),
+        )
+        result.append(round(r * 255) << 16 | round(g * 255) << 8 | round(b * 255))
+    return result
+
+
+def adjust_many(
+        values: Sequence[Sequence[int]],
+        variants: Sequence[Variant],
+    ) -> list[list[int]]:
+    """Adjusts the colors of many variants in the HLS color space at once.
+
+        *   The colors of all variants are passed to :func:`adjust_hls` in one call,
+            so NumPy computes them at once.
+        *   The colors of the variants with no HLS changes are kept.
+
+    Args:
+        values (Sequence[Sequence[int]]): The packed RGB values of each variant.
+        variants (Sequence[Variant]): :class:`Variant` classes.
+
+    Returns:
+        list[list[int]]: The packed RGB values of each variant.
+    """
+    targets = [
+        k for k, variant in enumerate(variants)
+        if any(getattr(variant, field) for field in HLS_FIELDS)
+    ]
+    adjusted = iter(adjust_hls(
+        rgb=[val for k in targets for val in values[k]],
+        **{
+            field: [getattr(variants[k], field) for k in targets for _ in values[k]]
+            for field in HLS_FIELDS
+        },
+    ) if targets else ())
+    result = [list(vals) for vals in values]
+    for k in targets:
+        result[k] = list(itertools.islice(adjusted, len(values[k])))
+    return result
+
+
+def map_to_palette(rgb: Sequence[int], palette: Sequence[int]) -> list[int]:
+    """Maps the colors to the nearest colors of a palette.
+
+        *   The distance is the squared distance in the RGB color space.
+        *   If NumPy is installed, all distances are computed at once.
+
+    Args:
+        rgb (Sequence[int]): The packed RGB values.
+        palette (Sequence[int]): The packed RGB values of the palette.
+
+    Returns:
+        list[int]: The packed RGB values of the palette.
+    """
+    if np is None:
+        targets = [[val >> shift & 0xFF for shift in (16, 8, 0)] for val in palette]
+        result = []
+        for val in rgb:
+            color = [val >> shift & 0xFF for shift in (16, 8, 0)]
+            distances = [
+                sum((c - t) ** 2 for c, t in zip(color, target)) for target in targets
+            ]
+            result.append(palette[distances.index(min(distances))])
+        return result
+
+    shifts = np.asarray([16, 8, 0])
+    colors = np.asarray(rgb, dtype=np.int64)[:, None] >> shifts & 0xFF
+    targets = np.asarray(palette, dtype=np.int64)[:, None] >> shifts & 0xFF
+    distances = ((colors[:, None, :] - targets[None, :, :]) ** 2).sum(axis=-1)
+    return np.asarray(palette, dtype=np.int64)[distances.argmin(axis=1)].tolist()
+
+
+def expand_colors(
+        model: ThemeModel,
+        variant: Variant,
+        inverted: dict[int, int],
+    ) -> VARIANT_COLORS_TYPE:
+    """Copies the model and its colors for a variant.
+
+        *   If ``dark_from_light``, the dark mode colors are generated from the
+            light mode colors.
+
+    Args:
+        model (ThemeModel): The model prepared by
+            :meth:`PaletteTransformer.prepare`.
+        variant (Variant): :class:`Variant` class.
+        inverted (dict[int, int]): The packed RGB values of the colors with
+            inverted lightness. (key: color id)
+
+    Returns:
+        VARIANT_COLORS_TYPE: The model of the variant, and its colors.
+    """
+    result = model.copy()
+    names = list(model.table.names)
+    rgb = list(model.table.rgb)
+    if not variant.dark_from_light:
+        return result, names, rgb
+    # [Attention]
+    # The inverted colors are added after the source colors, so the dark id of
+    # each setting is the light id plus the number of source colors.
+    size = len(rgb)
+    names.extend(
+        to_hex(rgb=inverted[i]) if i in inverted else names[i] for i in range(size)
+    )
+    rgb.extend(inverted.get(i, rgb[i]) for i in range(size))
+    for section in result.sections.values():
+        for i, packed in enumerate(section.colors):
+            light = packed >> 32
+            if light in inverted:
+                section.colors[i] = light << 32 | light + size
+    return result, names, rgb
+
+
+def set_colors(
+        colors: VARIANT_COLORS_TYPE,
+        valid: Sequence[int],
+        values: Sequence[int],
+    ) -> ThemeModel:
+    """Sets the transformed colors to the model of a variant.
+
+    Args:
+        colors (VARIANT_COLORS_TYPE): The model of the variant, and its colors.
+        valid (Sequence[int]): The ids of the transformed colors.
+        values (Sequence[int]): The packed RGB values of the transformed colors.
+
+    Returns:
+        ThemeModel: The model of the variant.
+    """
+    result, names, rgb = colors
+    for i, val in zip(valid, values):
+        if val != rgb[i]:
+            rgb[i] = val
+            names[i] = to_hex(rgb=val)
+    table = ColorTable(names=names, rgb=array('i', rgb))
+    for i, name in enumerate(names):
+        table.ids.setdefault(name, i)
+    result.table = table
+    return result
+
+
+class PaletteTransformer:
+    """Transforms the palette of the theme data.
+
+    Args:
+        color_resolver (ColorResolver | None): :class:`ColorResolver` class.
+            If ``None``, the colors are resolved without Tk.
+    """
+    def __init__(self, color_resolver: ColorResolver | None = None) -> None:
+        self.color_resolver = color_resolver or ColorResolver()
+
+    def prepare(self, data: THEME_DATA_TYPE) -> ThemeModel:
+        """Converts the theme data to the model and resolves its colors.
+
+            *   Transparent and invalid colors are not transformed.
+
+        Args:
+            data (THEME_DATA_TYPE): theme data.
+
+        Returns:
+            ThemeModel: :class:`lib.common.types.ThemeModel` class.
+        """
+        model = ThemeModel.from_data(data=data)
+        invalid = self.color_resolver.resolve_model(model=model)
+        if invalid:
+            LOGGER.warning(f'The colors are not transformed. {invalid=}')
+        return model
+
+    def apply(self, model: ThemeModel, variant: Variant) -> ThemeModel:
+        """Applies a variant to the model.
+
+        Args:
+            model (ThemeModel): The model prepared by :meth:`prepare`.
+            variant (Variant): :class:`Variant` class.
+
+        Returns:
+            ThemeModel: The new model. The source model is not changed.
+        """
+        return self.apply_many(model=model, variants=[variant])[0]
+
+    def apply_many(
+            self,
+            model: ThemeModel,
+            variants: Sequence[Variant],
+        ) -> list[ThemeModel]:
+        """Applies variants to the model.
+
+            *   The lightness of the source colors is inverted once for all variants.
+            *   The HLS changes of all variants are computed by :func:`adjust_many`
+                at once, and then each palette is mapped per variant.
+
+        Args:
+            model (ThemeModel): The model prepared by :meth:`prepare`.
+            variants (Sequence[Variant]): :class:`Variant` classes.
+
+        Returns:
+            list[ThemeModel]: The new models. The source model is not changed.
+
+        Raises:
+            ValueError: If a palette has invalid colors.
+        """
+        inverted = {}
+        if any(variant.dark_from_light for variant in variants):
+            rgb = model.table.rgb
+            ids = [i for i, val in enumerate(rgb) if val != NO_RGB]
+            inverted = dict(zip(
+                ids,
+                adjust_hls(rgb=[rgb[i] for i in ids], invert=True),
+            ))
+        colors = [
+            expand_colors(model=model, variant=variant, inverted=inverted)
+            for variant in variants
+        ]
+        valid = [
+            [i for i, val in enumerate(rgb) if val != NO_RGB] for _, _, rgb in colors
+        ]
+        values = adjust_many(
+            values=[[rgb[i] for i in ids] for (_, _, rgb), ids in zip(colors, valid)],
+            variants=variants,
+        )
+        for k, variant in enumerate(variants):
+            if variant.palette:
+                palette, invalid = self.color_resolver.to_rgb_many(
+                    names=variant.palette,
+                )
+                if invalid:
+                    LOGGER.error(f'[palette] has invalid colors. {invalid=}')
+                    raise ValueError
+                values[k] = map_to_palette(rgb=values[k], palette=palette)
+        return [
+            set_colors(colors=colors[k], valid=valid[k], values=values[k])
+            for k in range(len(variants))
+        ]
+
+    def transform(self, data: THEME_DATA_TYPE, variant: Variant) -> THEME_DATA_TYPE:
+        """Applies a variant to the theme data.
+
+        Args:
+            data (THEME_DATA_TYPE): theme data.
+            variant (Variant): :class:`Variant` class.
+
+        Returns:
+            THEME_DATA_TYPE: The theme data of the variant.
+        """
+        return self.apply(model=self.prepare(data=data), variant=variant).to_data()
+
+    def transform_many(
+            self,
+            data: THEME_DATA_TYPE,
+            variants: Iterable[Variant],
+        ) -> Iterator[tuple[str, THEME_DATA_TYPE]]:
+        """Applies variants to the theme data.
+
+            *   The theme data is converted and its colors are resolved once, and the
+                colors of all variants are transformed at once by :meth:`apply_many`.
+
+        Args:
+            data (THEME_DATA_TYPE): theme data.
+            variants (Iterable[Variant]): :class:`Variant` classes.
+
+        Yields:
+            tuple[str, THEME_DATA_TYPE]: The variant name and its theme data.
+        """
+        variants = tuple(variants)
+        models = self.apply_many(model=self.prepare(data=data), variants=variants)
+        for variant, model in zip(variants, models):
+            yield variant.name, model.to_data()
@@ -71,3 +71,44 @@ def sec_to_hms(time: float) -> tuple[int, int, int, float]:
     mm, ss = divmod(mm, 60)
     ss, ms = divmod(ss, 1)
     return hh, mm, ss, ms
+
+
+def diff_theme(
+        old: dict[str, Any],
+        new: dict[str, Any],
+    ) -> dict[str, dict[str, Any]] | None:
+    """Computes the key-level diff of theme data.
+
+    *   Only the values are compared. If the pages, the setting keys (or their order)
+        or the items of a dictionary value are changed, the shape is changed.
+
+    Args:
+        old (dict[str, Any]): theme data before the change.
+        new (dict[str, Any]): theme data after the change.
+
+    Returns:
+        dict[str, dict[str, Any]] | None: The changed values.
+        (key: page name, val: {setting key: new value})
+        ``None`` if the shape is changed.
+    """
+    if list(old) != list(new):
+        return None
+    changes: dict[str, dict[str, Any]] = {}
+    for page_name, values in new.items():
+        old_values = old[page_name]
+        if not isinstance(values, dict) or not isinstance(old_values, dict):
+            if values != old_values:
+                return None
+            continue
+        if list(values) != list(old_values):
+            return None
+        changed = {key: val for key, val in values.items() if val != old_values[key]}
+        for key, val in changed.items():
+            old_val = old_values[key]
+            if isinstance(val, dict) != isinstance(old_val, dict) or (
+                isinstance(val, dict) and list(val) != list(old_val)
+            ):
+                return None
+        if changed:
+            changes[page_name] = changed
+    return changes
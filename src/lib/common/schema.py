@@ -0,0 +1,346 @@
+"""This is the module that defines the theme schema.
+
+*   The schema classifies each setting key of the CustomTkinter theme data and maps it
+    to its kind, parser and target widget property.
+*   The schema of a page is compiled once per page shape (page name and setting keys)
+    and cached, so it is shared by all pages and theme reloads.
+"""
+
+import enum
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any
+
+from lib.common.types import THEME_DATA_TYPE, ParamLog
+from lib.common.types import WidgetName as W
+from lib.common.types import WidgetSetting as S
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+THEME_VALUE_TYPE = int | str | list[str] | dict[str, int | str]
+
+
+class Kind(enum.StrEnum):
+    """Defines the kind of the setting.
+    """
+    COLOR = enum.auto()
+    NUMBER = enum.auto()
+    FONT = enum.auto()
+
+
+class Mode(enum.StrEnum):
+    """Defines the mode identifier of the raw setting values.
+
+    *   'color' settings have light and dark mode values.
+    *   'number' settings have one value.
+    *   'font' settings have a value per item (e.g., 'family').
+    """
+    LIGHT = enum.auto()
+    DARK = enum.auto()
+    NONE = enum.auto()
+
+
+#: dict[Kind, str | list[str]]: The conditions to classify the setting keys.
+CONDITIONS: dict[Kind, str | list[str]] = {
+    Kind.COLOR: 'color',
+    Kind.NUMBER: ['corner_radius', 'width', 'length', 'spacing'],
+    Kind.FONT: ['macOS', 'Windows', 'Linux'],
+}
+
+#: dict[str, tuple[str, ...]]: The widget properties set by each page of the theme.
+#: The setting key is the same as the property name of ``configure()``.
+WIDGET_PROPS: dict[str, tuple[str, ...]] = {
+    W.CTK: (S.FG_COLOR,),
+    W.TOPLEVEL: (S.FG_COLOR,),
+    W.BUTTON: (
+        S.BORDER_COLOR, S.BORDER_WIDTH, S.CORNER_RADIUS, S.FG_COLOR, S.HOVER_COLOR,
+        S.TEXT_COLOR, S.TEXT_COLOR_DISABLED,
+    ),
+    W.RADIOBUTTON: (
+        S.BORDER_COLOR, S.BORDER_WIDTH_CHECKED, S.BORDER_WIDTH_UNCHECKED,
+        S.CORNER_RADIUS, S.FG_COLOR, S.HOVER_COLOR, S.TEXT_COLOR,
+        S.TEXT_COLOR_DISABLED,
+    ),
+    W.SEGMENTEDBUTTON: (
+        S.BORDER_WIDTH, S.CORNER_RADIUS, S.FG_COLOR, S.SELECTED_COLOR,
+        S.SELECTED_HOVER_COLOR, S.TEXT_COLOR, S.TEXT_COLOR_DISABLED,
+        S.UNSELECTED_COLOR, S.UNSELECTED_HOVER_COLOR,
+    ),
+    W.ENTRY: (
+        S.BORDER_COLOR, S.BORDER_WIDTH, S.CORNER_RADIUS, S.FG_COLOR,
+        S.PLACEHOLDER_TEXT_COLOR, S.TEXT_COLOR,
+    ),
+    W.LABEL: (S.CORNER_RADIUS, S.FG_COLOR, S.TEXT_COLOR),
+    W.CHECKBOX: (
+        S.BORDER_COLOR, S.BORDER_WIDTH, S.CHECKMARK_COLOR, S.CORNER_RADIUS,
+        S.FG_COLOR, S.HOVER_COLOR, S.TEXT_COLOR, S.TEXT_COLOR_DISABLED,
+    ),
+    W.SWITCH: (
+        S.BORDER_WIDTH, S.BUTTON_COLOR, S.BUTTON_HOVER_COLOR, S.BUTTON_LENGTH,
+        S.CORNER_RADIUS, S.FG_COLOR, S.PROGRESS_COLOR, S.TEXT_COLOR,
+        S.TEXT_COLOR_DISABLED,
+    ),
+    W.PROGRESSBAR: (
+        S.BORDER_COLOR, S.BORDER_WIDTH, S.CORNER_RADIUS, S.FG_COLOR,
+        S.PROGRESS_COLOR,
+    ),
+    W.SLIDER: (
+        S.BORDER_WIDTH, S.BUTTON_COLOR, S.BUTTON_CORNER_RADIUS, S.BUTTON_HOVER_COLOR,
+        S.BUTTON_LENGTH, S.CORNER_RADIUS, S.FG_COLOR, S.PROGRESS_COLOR,
+    ),
+    W.OPTIONMENU: (
+        S.BUTTON_COLOR, S.BUTTON_HOVER_COLOR, S.CORNER_RADIUS, S.FG_COLOR,
+        S.TEXT_COLOR, S.TEXT_COLOR_DISABLED,
+    ),
+    W.COMBOBOX: (
+        S.BORDER_COLOR, S.BORDER_WIDTH, S.BUTTON_COLOR, S.BUTTON_HOVER_COLOR,
+        S.CORNER_RADIUS, S.FG_COLOR, S.TEXT_COLOR, S.TEXT_COLOR_DISABLED,
+    ),
+    W.TEXTBOX: (
+        S.BORDER_COLOR, S.BORDER_WIDTH, S.CORNER_RADIUS, S.FG_COLOR,
+        S.SCROLLBAR_BUTTON_COLOR, S.SCROLLBAR_BUTTON_HOVER_COLOR, S.TEXT_COLOR,
+    ),
+    W.DROPDOWNMENU: (S.FG_COLOR, S.HOVER_COLOR, S.TEXT_COLOR),
+    # [Attention]
+    # When the parent's fg_color and its own fg_color are the same,
+    # top_fg_color is set instead of fg_color inside CustomTkinter.
+    W.FRAME: (S.BORDER_COLOR, S.BORDER_WIDTH, S.CORNER_RADIUS, S.FG_COLOR),
+    W.SCROLLBAR: (
+        S.BORDER_SPACING, S.BUTTON_COLOR, S.BUTTON_HOVER_COLOR, S.CORNER_RADIUS,
+        S.FG_COLOR,
+    ),
+    W.SCROLLABLEFRAME: (S.LABEL_FG_COLOR,),
+}
+
+
+def parse_color(raw: dict[str, str]) -> str | list[str]:
+    """Parses the raw values of a 'color' setting.
+
+        *   If either mode is empty or both are the same, it returns one color.
+
+    Args:
+        raw (dict[str, str]): The raw values. (key: mode, val: color)
+
+    Returns:
+        str | list[str]: setting value.
+    """
+    light, dark = raw[Mode.LIGHT], raw[Mode.DARK]
+    if not light or not dark or light == dark:
+        return light or dark
+    return [light, dark]
+
+
+def parse_number(raw: dict[str, str]) -> int:
+    """Parses the raw value of a 'number' setting.
+
+        *   ``int()`` raises ValueError if the value is not a number.
+
+    Args:
+        raw (dict[str, str]): The raw value. (key: mode, val: number)
+
+    Returns:
+        int: setting value.
+    """
+    return int(raw[Mode.NONE])
+
+
+def parse_font(raw: dict[str, str]) -> dict[str, int | str]:
+    """Parses the raw values of a 'font' setting.
+
+        *   Numbers (e.g., 'size') are converted to int.
+
+    Args:
+        raw (dict[str, str]): The raw values. (key: item, val: value)
+
+    Returns:
+        dict[str, int | str]: setting value.
+    """
+    value: dict[str, int | str] = {}
+    for key, val in raw.items():
+        try:
+            value[key] = int(val)
+        except ValueError:
+            value[key] = str(val)
+    return value
+
+
+def split_value(kind: Kind, val: THEME_VALUE_TYPE) -> dict[str, Any]:
+    """Splits a setting value into the raw values of :class:`Mode`.
+
+        *   It is the inverse of the parser of the kind.
+
+    Args:
+        kind (Kind): The kind of the setting.
+        val (THEME_VALUE_TYPE): setting value.
+
+    Returns:
+        dict[str, Any]: The raw values.
+
+    Raises:
+        TypeError: If the value of a 'color' setting is not str or list[str, str].
+    """
+    if kind == Kind.COLOR:
+        if isinstance(val, list):
+            return {Mode.LIGHT: val[0], Mode.DARK: val[1]}
+        if isinstance(val, str):
+            return {Mode.LIGHT: val, Mode.DARK: None}
+        LOGGER.error(f'[val] must be str or list[str, str]. {val=}')
+        raise TypeError
+    if kind == Kind.FONT:
+        return dict(val)  # type: ignore[arg-type]
+    return {Mode.NONE: val}
+
+
+#: dict[Kind, Callable]: The parser of each kind.
+PARSERS: dict[Kind, Callable[[dict[str, str]], THEME_VALUE_TYPE]] = {
+    Kind.COLOR: parse_color,
+    Kind.NUMBER: parse_number,
+    Kind.FONT: parse_font,
+}
+
+
+def classify_key(key: str) -> Kind:
+    """Classifies a setting key.
+
+    Args:
+        key (str): setting key.
+
+    Returns:
+        Kind: The kind of the setting.
+
+    Raises:
+        ValueError: If the key is not supported.
+    """
+    if CONDITIONS[Kind.COLOR] in key:
+        return Kind.COLOR
+    if any(k in key for k in CONDITIONS[Kind.NUMBER]):
+        return Kind.NUMBER
+    if key in CONDITIONS[Kind.FONT]:
+        return Kind.FONT
+    LOGGER.error(f'[key] is wrong. {key=}')
+    raise ValueError
+
+
+@dataclass(frozen=True, slots=True)
+class KeySpec:
+    """Defines the classification of a setting key.
+    """
+    #: Kind: The kind of the setting.
+    kind: Kind
+    #: Callable: The parser from the raw values to the setting value.
+    parse: Callable[[dict[str, str]], THEME_VALUE_TYPE]
+    #: str | None: The target widget property. ``None`` if it is not set directly.
+    prop: str | None
+
+
+@functools.cache
+def get_key_spec(page_name: str, key: str) -> KeySpec:
+    """Gets the classification of a setting key.
+
+        *   The result is cached per ``(page name, key)``.
+
+    Args:
+        page_name (str): page name.
+        key (str): setting key.
+
+    Returns:
+        KeySpec: :class:`KeySpec` class.
+    """
+    kind = classify_key(key=key)
+    prop = key if key in WIDGET_PROPS.get(page_name, ()) else None
+    return KeySpec(kind=kind, parse=PARSERS[kind], prop=prop)
+
+
+class PageSchema:
+    """Defines the schema of a page shape.
+
+        *   Use :func:`compile_page` to get the schema cached per page shape.
+        *   Unsupported keys are left out, and :meth:`get` raises an error for them.
+
+    Args:
+        page_name (str): page name.
+        keys (tuple[str, ...]): setting keys.
+    """
+    def __init__(self, page_name: str, keys: tuple[str, ...]) -> None:
+        self.page_name = page_name
+        self.specs: dict[str, KeySpec] = {}
+        for key in keys:
+            try:
+                self.specs[key] = get_key_spec(page_name=page_name, key=key)
+            except ValueError:
+                continue
+        #: tuple[str, ...]: The setting keys set as the widget properties.
+        self.props = tuple(
+            key for key, spec in self.specs.items() if spec.prop is not None
+        )
+
+    def get(self, key: str) -> KeySpec:
+        """Gets the classification of a setting key.
+
+        Args:
+            key (str): setting key.
+
+        Returns:
+            KeySpec: :class:`KeySpec` class.
+
+        Raises:
+            ValueError: If the key is not supported.
+        """
+        if key not in self.specs:
+            LOGGER.error(f'[key] is not supported. {self.page_name=}, {key=}')
+            raise ValueError
+        return self.specs[key]
+
+
+@functools.lru_cache(maxsize=256)
+def compile_page(page_name: str, keys: tuple[str, ...]) -> PageSchema:
+    """Compiles the schema of a page shape.
+
+        *   The result is cached per ``(page name, keys)``, so the pages of the same
+            theme shape share it across reloads.
+
+    Args:
+        page_name (str): page name.
+        keys (tuple[str, ...]): setting keys.
+
+    Returns:
+        PageSchema: :class:`PageSchema` class.
+    """
+    return PageSchema(page_name=page_name, keys=keys)
+
+
+def normalize_theme(data: THEME_DATA_TYPE) -> tuple[THEME_DATA_TYPE, list[str]]:
+    """Normalizes theme data with the same rules as the settings pages.
+
+        *   Each setting value is split into the raw values and parsed again, as if it
+            was edited on a settings page. (e.g., ``['#000', '#000']`` -> ``'#000'``)
+        *   It does not create any widgets, so it can be used without Tk.
+        *   Invalid settings are reported and kept as they are.
+
+    Args:
+        data (THEME_DATA_TYPE): theme data.
+
+    Returns:
+        tuple[THEME_DATA_TYPE, list[str]]: The normalized theme data and the errors.
+    """
+    normalized: THEME_DATA_TYPE = {}
+    errors: list[str] = []
+    for page_name, values in data.items():
+        if not isinstance(values, dict):
+            errors.append(f'{page_name}: the page must be dict.')
+            normalized[page_name] = values
+            continue
+        page: dict[str, Any] = {}
+        page_schema = compile_page(page_name=page_name, keys=tuple(values))
+        for key, val in values.items():
+            try:
+                spec = page_schema.get(key=key)
+                page[key] = spec.parse(split_value(kind=spec.kind, val=val))
+            except (TypeError, ValueError) as e:
+                errors.append(f'{page_name}.{key}: {type(e).__name__} {val=}')
+                page[key] = val
+        normalized[page_name] = page
+    return normalized, errors
@@ -0,0 +1,184 @@
+"""This is the module that defines the central store of theme data.
+"""
+
+from collections.abc import Iterable
+from logging import getLogger
+from typing import Any
+
+from lib.common.file import format_json_item
+from lib.common.types import THEME_DATA_TYPE, ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(PARAM_LOG.NAME)
+
+
+class ThemeStore:
+    """Holds the current theme data of all pages.
+
+    *   The settings pages write their values incrementally, and the save and the
+        preview read the data from here.
+    *   Each page has a dirty flag, which is set when its values change and cleared
+        when it is saved.
+    *   The json text is cached per page, and only the changed pages are formatted
+        again by :meth:`to_json`.
+    """
+    def __init__(self) -> None:
+        self.pages: THEME_DATA_TYPE = {}
+        self.dirty: set[str] = set()
+        self.versions: dict[str, int] = {}
+        self.fragments: dict[str, str] = {}
+
+    def load(
+            self,
+            data: THEME_DATA_TYPE,
+            dirty: bool = False,  # noqa: FBT001, FBT002
+        ) -> None:
+        """Replaces all theme data. (e.g., a theme file is loaded)
+
+        Args:
+            data (THEME_DATA_TYPE): theme data.
+            dirty (bool): If ``True``, all pages are dirty after loading.
+                (e.g., a generated theme that is not saved yet)
+        """
+        self.pages = {
+            key: dict(val) if isinstance(val, dict) else val
+            for key, val in data.items()
+        }
+        self.dirty = set(self.pages) if dirty else set()
+        self.versions = dict.fromkeys(self.pages, 0)
+        self.fragments = {}
+
+    def set_pages(
+            self,
+            data: THEME_DATA_TYPE,
+            dirty: bool = False,  # noqa: FBT001, FBT002
+        ) -> None:
+        """Replaces the values of some pages. (e.g., a chunk of a theme file)
+
+            *   The other pages are kept.
+
+        Args:
+            data (THEME_DATA_TYPE): The theme data of the pages.
+            dirty (bool): If ``True``, the pages are dirty after setting.
+        """
+        for page_name, values in data.items():
+            self.pages[page_name] = dict(values) if isinstance(values, dict) else values
+            self.versions[page_name] = self.versions.get(page_name, 0) + 1
+            self.fragments.pop(page_name, None)
+            if dirty:
+                self.dirty.add(page_name)
+            else:
+                self.dirty.discard(page_name)
+
+    def remove_pages(self, page_names: Iterable[str]) -> None:
+        """Removes pages. (e.g., pages that are not in a loaded theme file)
+
+        Args:
+            page_names (Iterable[str]): page names.
+        """
+        for page_name in page_names:
+            self.pages.pop(page_name, None)
+            self.versions.pop(page_name, None)
+            self.fragments.pop(page_name, None)
+            self.dirty.discard(page_name)
+
+    def get_page(self, page_name: str) -> Any:
+        """Gets the values of a page.
+
+        Args:
+            page_name (str): page name.
+
+        Returns:
+            Any: The values of the page. (Do not modify it.)
+        """
+        return self.pages[page_name]
+
+    def update_page(
+            self,
+            page_name: str,
+            values: dict[str, Any],
+            dirty: bool = True,  # noqa: FBT001, FBT002
+        ) -> bool:
+        """Updates the values of a page.
+
+            *   Only the values different from the current values are updated.
+
+        Args:
+            page_name (str): page name.
+            values (dict[str, Any]): The values to update. (key: setting key)
+            dirty (bool): If ``True``, the page is marked dirty when it is changed.
+                Use ``False`` for changes that are already in the file.
+
+        Returns:
+            bool: ``True`` if the page is changed.
+        """
+        page = self.pages.setdefault(page_name, {})
+        changed = {key: val for key, val in values.items() if page.get(key) != val}
+        if not changed and page_name in self.versions:
+            return False
+        page.update(changed)
+        self.versions[page_name] = self.versions.get(page_name, 0) + 1
+        self.fragments.pop(page_name, None)
+        if dirty:
+            self.dirty.add(page_name)
+        return True
+
+    def set_value(self, page_name: str, key: str, val: Any) -> bool:
+        """Sets a setting value.
+
+        Args:
+            page_name (str): page name.
+            key (str): setting key.
+            val (Any): setting value.
+
+        Returns:
+            bool: ``True`` if the value is changed.
+        """
+        return self.update_page(page_name=page_name, values={key: val})
+
+    def snapshot(self) -> tuple[THEME_DATA_TYPE, dict[str, int]]:
+        """Copies the theme data and the page versions.
+
+        Returns:
+            tuple[THEME_DATA_TYPE, dict[str, int]]: The theme data and the versions.
+            The versions are passed to :meth:`mark_clean` after saving.
+        """
+        data = {
+            key: dict(val) if isinstance(val, dict) else val
+            for key, val in self.pages.items()
+        }
+        return data, dict(self.versions)
+
+    def mark_clean(self, versions: dict[str, int] | None = None) -> None:
+        """Clears the dirty flags after saving.
+
+            *   Pages changed after ``versions`` was taken stay dirty.
+
+        Args:
+            versions (dict[str, int] | None): The page versions when saving.
+                If ``None``, all pages are cleared.
+        """
+        if versions is None:
+            self.dirty = set()
+            return
+        self.dirty = {
+            page_name for page_name in self.dirty
+            if self.versions.get(page_name) != versions.get(page_name)
+        }
+
+    def to_json(self) -> str:
+        """Formats the theme data as json text.
+
+            *   It is the same text as
+                ``json.dumps(data, indent=2, ensure_ascii=False)``.
+            *   Only the pages changed since the last call are formatted.
+
+        Returns:
+            str: json text.
+        """
+        if not self.pages:
+            return '{}'
+        for page_name, values in self.pages.items():
+            if page_name not in self.fragments:
+                self.fragments[page_name] = format_json_item(key=page_name, val=values)
+        return '{\n' + ',\n'.join(self.fragments[key] for key in self.pages) + '\n}'
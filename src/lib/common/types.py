@@ -2,8 +2,13 @@
 """
 
 import enum
+import functools
 import logging
+import string
 import zoneinfo
+from array import array
+from dataclasses import dataclass, field
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -20,6 +25,15 @@ class ParamKey(enum.StrEnum):
     RESULT = enum.auto()
     MODE = enum.auto()
     THEME = enum.auto()
+    PROFILE = enum.auto()
+    LAZY = enum.auto()
+    VIRTUAL = enum.auto()
+    INPUT = enum.auto()
+    WORKERS = enum.auto()
+    CACHE = enum.auto()
+    WATCH = enum.auto()
+    SAVE_THREAD = enum.auto()
+    VARIANTS = enum.auto()
 
 
 class ParamLog(BaseModel):
@@ -59,6 +73,8 @@ class ParamLog(BaseModel):
 
 THEME_DATA_TYPE = dict[str, int | str | list[str] | dict[str, int | str]]
 
+LOGGER = logging.getLogger(ParamLog().NAME)
+
 
 class SideBarFrameName(enum.StrEnum):
     """Defines the frame name of sidebar.
@@ -72,8 +88,356 @@ class EventName(enum.StrEnum):
     """
     SHOW_PAGE = enum.auto()
     BUILD_PAGE = enum.auto()
+    ADD_PAGES = enum.auto()
     DEL_ALL_BUTTON = enum.auto()
+    SYNC_BUTTON = enum.auto()
     ADD_BUTTON = enum.auto()
     CHANGE_CONF = enum.auto()
-    GET_DATA = enum.auto()
-    RECIEVE_DATA = enum.auto()
+    BEGIN_BATCH = enum.auto()
+    COMMIT_BATCH = enum.auto()
+    LOAD_CHUNK = enum.auto()
+    LOAD_DONE = enum.auto()
+    RELOAD_FILE = enum.auto()
+    PATCH_PAGE = enum.auto()
+    SAVE_DONE = enum.auto()
+
+
+class WidgetName(enum.StrEnum):
+    """Defines the CustomTkinter widget identifier.
+    """
+    CTK = 'CTk'
+    TOPLEVEL = 'CTkToplevel'
+    FRAME = 'CTkFrame'
+    BUTTON = 'CTkButton'
+    LABEL = 'CTkLabel'
+    ENTRY = 'CTkEntry'
+    CHECKBOX = 'CTkCheckBox'
+    SWITCH = 'CTkSwitch'
+    RADIOBUTTON = 'CTkRadioButton'
+    PROGRESSBAR = 'CTkProgressBar'
+    SLIDER = 'CTkSlider'
+    OPTIONMENU = 'CTkOptionMenu'
+    COMBOBOX = 'CTkComboBox'
+    SCROLLBAR = 'CTkScrollbar'
+    SEGMENTEDBUTTON = 'CTkSegmentedButton'
+    TEXTBOX = 'CTkTextbox'
+    SCROLLABLEFRAME = 'CTkScrollableFrame'
+    FONT = 'CTkFont'
+    DROPDOWNMENU = 'DropdownMenu'
+
+
+class WidgetSetting(enum.StrEnum):
+    """Defines the CustomTkinter widget setting identifier.
+    """
+    # Color
+    FG_COLOR = enum.auto()
+    TOP_FG_COLOR = enum.auto()
+    LABEL_FG_COLOR = enum.auto()
+    BORDER_COLOR = enum.auto()
+    HOVER_COLOR = enum.auto()
+    CHECKMARK_COLOR = enum.auto()
+    PROGRESS_COLOR = enum.auto()
+    BUTTON_COLOR = enum.auto()
+    BUTTON_HOVER_COLOR = enum.auto()
+    TEXT_COLOR = enum.auto()
+    TEXT_COLOR_DISABLED = enum.auto()
+    PLACEHOLDER_TEXT_COLOR = enum.auto()
+    SELECTED_COLOR = enum.auto()
+    SELECTED_HOVER_COLOR = enum.auto()
+    UNSELECTED_COLOR = enum.auto()
+    UNSELECTED_HOVER_COLOR = enum.auto()
+    SCROLLBAR_BUTTON_COLOR = enum.auto()
+    SCROLLBAR_BUTTON_HOVER_COLOR = enum.auto()
+    # Width, Spacing, Radiius, length
+    BORDER_WIDTH = enum.auto()
+    BORDER_WIDTH_CHECKED = enum.auto()
+    BORDER_WIDTH_UNCHECKED = enum.auto()
+    BORDER_SPACING = enum.auto()
+    CORNER_RADIUS = enum.auto()
+    BUTTON_CORNER_RADIUS = enum.auto()
+    BUTTON_LENGTH = enum.auto()
+    # Font
+    FAMILY = enum.auto()
+    SIZE = enum.auto()
+    WEIGHT = enum.auto()
+
+
+#: int: The dark color id of a setting that has one color for both modes.
+SINGLE_COLOR = 0xFFFFFFFF
+
+
+@functools.cache
+def parse_hex(name: str) -> int | None:
+    """Parses a hex color.
+
+        *   ``#RGB``, ``#RRGGBB``, ``#RRRGGGBBB`` and ``#RRRRGGGGBBBB`` are supported.
+        *   As in Tk, the digits are the most significant bits of each component.
+            (e.g., ``'#fff'`` is ``0xF0F0F0``)
+        *   The result is cached per color string.
+
+    Args:
+        name (str): color string.
+
+    Returns:
+        int | None: The packed RGB value. ``None`` if it is not a hex color.
+    """
+    digits = name[1:]
+    if name[:1] != '#' or len(digits) not in (3, 6, 9, 12):
+        return None
+    if not all(c in string.hexdigits for c in digits):
+        return None
+    value = int(digits, 16)
+    bits = len(digits) // 3 * 4
+    mask = (1 << bits) - 1
+    rgb = 0
+    for shift in (2 * bits, bits, 0):
+        component = (value >> shift) & mask
+        if bits < 8:  # noqa: PLR2004
+            component <<= 8 - bits
+        else:
+            component >>= bits - 8
+        rgb = rgb << 8 | component
+    return rgb
+
+
+def is_color_value(key: str, val: Any) -> bool:
+    """Checks whether a setting value is stored as a color.
+
+    Args:
+        key (str): setting key.
+        val (Any): setting value.
+
+    Returns:
+        bool: ``True`` if the key is a 'color' setting and the value is ``str`` or
+        ``list[str, str]``.
+    """
+    if 'color' not in key:
+        return False
+    if isinstance(val, str):
+        return True
+    return (
+        isinstance(val, list) and len(val) == 2  # noqa: PLR2004
+        and all(isinstance(v, str) for v in val)
+    )
+
+
+@dataclass(slots=True)
+class ColorTable:
+    """Holds the color strings of theme models and their packed RGB values.
+
+    *   Each color string is stored once and referred to by its id.
+    *   The RGB value is packed as ``0xRRGGBB``. ``-1`` means it is not resolved
+        (e.g., a Tk color name) or has no RGB value. (e.g., ``'transparent'``)
+    *   The table only grows, so it is shared by the copies of a model and by the
+        models of a theme library.
+    """
+    #: list[str]: The color strings. (index: color id)
+    names: list[str] = field(default_factory=list)
+    #: dict[str, int]: The color ids. (key: color string)
+    ids: dict[str, int] = field(default_factory=dict)
+    #: array: The packed RGB values. (index: color id)
+    rgb: array = field(default_factory=lambda: array('i'))
+
+    def add(self, name: str) -> int:
+        """Adds a color string.
+
+        Args:
+            name (str): color string.
+
+        Returns:
+            int: color id.
+        """
+        idx = self.ids.get(name)
+        if idx is None:
+            idx = self.ids[name] = len(self.names)
+            self.names.append(name)
+            rgb = parse_hex(name=name)
+            self.rgb.append(-1 if rgb is None else rgb)
+        return idx
+
+
+@dataclass(slots=True)
+class SectionModel:
+    """Holds the settings of a widget section. (e.g., ``'CTkButton'``)
+
+    *   Each color setting is packed as ``light id << 32 | dark id`` of
+        :class:`ColorTable`. A setting with one color has :data:`SINGLE_COLOR` as
+        the dark id.
+    """
+    #: tuple[str, ...]: All setting keys in the original order.
+    keys: tuple[str, ...]
+    #: tuple[str, ...]: The keys of the color settings.
+    color_keys: tuple[str, ...]
+    #: array: The packed color ids. (index: the index of ``color_keys``)
+    colors: array
+    #: dict[str, Any]: The other settings. (key: setting key)
+    values: dict[str, Any]
+
+    def copy(self) -> 'SectionModel':
+        """Copies the section.
+
+            *   The colors are copied as one block of memory.
+
+        Returns:
+            SectionModel: The copied section.
+        """
+        return SectionModel(
+            keys=self.keys,
+            color_keys=self.color_keys,
+            colors=self.colors[:],
+            values={
+                key: val.copy() if isinstance(val, dict | list) else val
+                for key, val in self.values.items()
+            },
+        )
+
+    def get_ids(self, key: str) -> tuple[int, int]:
+        """Gets the color ids of a color setting.
+
+        Args:
+            key (str): setting key.
+
+        Returns:
+            tuple[int, int]: The light and dark color ids. The dark id is
+            :data:`SINGLE_COLOR` if it has one color.
+        """
+        packed = self.colors[self.color_keys.index(key)]
+        return packed >> 32, packed & SINGLE_COLOR
+
+
+@dataclass(slots=True)
+class ThemeModel:
+    """Holds the theme data in a compact form.
+
+    *   The colors are stored in ``array`` as packed ids of :class:`ColorTable`,
+        and the other settings are kept as they are.
+    *   :meth:`from_data` and :meth:`to_data` convert to and from the
+        CustomTkinter theme data without loss, including the key order and
+        whether a setting has one color or a pair.
+    """
+    #: dict[str, SectionModel]: The widget sections. (key: page name)
+    sections: dict[str, SectionModel] = field(default_factory=dict)
+    #: ColorTable: :class:`ColorTable` class.
+    table: ColorTable = field(default_factory=ColorTable)
+
+    @classmethod
+    def from_data(
+            cls,
+            data: THEME_DATA_TYPE,
+            table: ColorTable | None = None,
+        ) -> 'ThemeModel':
+        """Creates the model from the theme data.
+
+        Args:
+            data (THEME_DATA_TYPE): theme data.
+            table (ColorTable | None): :class:`ColorTable` class to share with other
+                models. If ``None``, a new table is created.
+
+        Returns:
+            ThemeModel: :class:`ThemeModel` class.
+
+        Raises:
+            TypeError: If the value of a page is not a dictionary.
+        """
+        table = table if table is not None else ColorTable()
+        sections = {}
+        for page_name, page in data.items():
+            if not isinstance(page, dict):
+                LOGGER.error(f'[page] must be a dictionary. {page_name=}, {page=}')
+                raise TypeError
+            color_keys = []
+            colors = array('q')
+            values = {}
+            for key, val in page.items():
+                if not is_color_value(key=key, val=val):
+                    values[key] = val.copy() if isinstance(val, dict | list) else val
+                    continue
+                color_keys.append(key)
+                if isinstance(val, str):
+                    colors.append(table.add(name=val) << 32 | SINGLE_COLOR)
+                else:
+                    colors.append(table.add(name=val[0]) << 32 | table.add(name=val[1]))
+            sections[page_name] = SectionModel(
+                keys=tuple(page),
+                color_keys=tuple(color_keys),
+                colors=colors,
+                values=values,
+            )
+        return cls(sections=sections, table=table)
+
+    def to_data(self) -> THEME_DATA_TYPE:
+        """Converts the model to the theme data.
+
+        Returns:
+            THEME_DATA_TYPE: theme data.
+        """
+        data = {}
+        for page_name, section in self.sections.items():
+            page = {}
+            for key in section.keys:
+                if key in section.values:
+                    val = section.values[key]
+                    page[key] = val.copy() if isinstance(val, dict | list) else val
+                else:
+                    page[key] = self.get_color(page_name=page_name, key=key)
+            data[page_name] = page
+        return data
+
+    def copy(self) -> 'ThemeModel':
+        """Copies the model.
+
+            *   The color table is shared.
+
+        Returns:
+            ThemeModel: The copied model.
+        """
+        return ThemeModel(
+            sections={key: val.copy() for key, val in self.sections.items()},
+            table=self.table,
+        )
+
+    def get_color(self, page_name: str, key: str) -> str | list[str]:
+        """Gets a color setting.
+
+        Args:
+            page_name (str): page name.
+            key (str): setting key.
+
+        Returns:
+            str | list[str]: The color, or the light and dark colors.
+        """
+        light, dark = self.sections[page_name].get_ids(key=key)
+        if dark == SINGLE_COLOR:
+            return self.table.names[light]
+        return [self.table.names[light], self.table.names[dark]]
+
+    def get_rgb(self, page_name: str, key: str) -> tuple[int, int]:
+        """Gets the packed RGB values of a color setting.
+
+        Args:
+            page_name (str): page name.
+            key (str): setting key.
+
+        Returns:
+            tuple[int, int]: The light and dark RGB values. (``0xRRGGBB``) ``-1`` if
+            the color is not resolved. (:meth:`ColorTable.resolve`)
+        """
+        light, dark = self.sections[page_name].get_ids(key=key)
+        if dark == SINGLE_COLOR:
+            dark = light
+        return self.table.rgb[light], self.table.rgb[dark]
+
+    def set_color(self, page_name: str, key: str, val: str | list[str]) -> None:
+        """Sets a color setting.
+
+        Args:
+            page_name (str): page name.
+            key (str): setting key. It must be a color setting of the page.
+            val (str | list[str]): The color, or the light and dark colors.
+        """
+        section = self.sections[page_name]
+        if isinstance(val, str):
+            packed = self.table.add(name=val) << 32 | SINGLE_COLOR
+        else:
+            packed = self.table.add(name=val[0]) << 32 | self.table.add(name=val[1])
+        section.colors[section.color_keys.index(key)] = packed
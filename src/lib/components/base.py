@@ -1,23 +1,212 @@
 """This is the module that defines event base component class.
 """
 
+import contextlib
+import inspect
+import queue
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from logging import getLogger
+from collections.abc import Callable, Generator
+from dataclasses import dataclass, field
+from logging import DEBUG, getLogger
+from typing import Any
 
 import customtkinter as ctk
 
+from lib.common.color import ColorResolver
+from lib.common.contrast import ContrastAuditor
+from lib.common.file import ThemeCache
+from lib.common.metrics import LatencyHistogram, format_table
+from lib.common.palette import PaletteTransformer
+from lib.common.store import ThemeStore
+from lib.common.types import EventName as E
 from lib.common.types import ParamLog
 
 PARAM_LOG = ParamLog()
 LOGGER = getLogger(PARAM_LOG.NAME)
 
 
+@dataclass
+class CoalesceStats:
+    """Defines the counters of the coalesced events.
+    """
+    #: int: The number of emits of coalesced events.
+    emitted: int = 0
+    #: int: The number of emits merged into an already pending emit.
+    merged: int = 0
+    #: int: The number of dispatches after merging.
+    dispatched: int = 0
+    #: int: The number of flushes.
+    flushed: int = 0
+
+
+@dataclass
+class QueueStats:
+    """Defines the metrics of the events posted from other threads.
+    """
+    #: int: The number of posted events.
+    posted: int = 0
+    #: int: The number of events run on the Tk main loop.
+    dispatched: int = 0
+    #: int: The number of events rejected because the queue was full.
+    rejected: int = 0
+    #: int: The queue depth at the last poll.
+    depth: int = 0
+    #: int: The max queue depth.
+    max_depth: int = 0
+    #: LatencyHistogram: The delay from posting to running. (sec)
+    delay: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class EventProfiler:
+    """Records the call count and wall time of events and callbacks.
+
+    *   Events are recorded per event name and callbacks per qualified name.
+        Callbacks without it (e.g., ``functools.partial``) are recorded per repr.
+    *   The nesting depth and the chain of events (e.g.,
+        ``build_page > add_button``) are recorded for emits in other emits.
+    """
+    def __init__(self) -> None:
+        self.events: dict[str, LatencyHistogram] = {}
+        self.callbacks: dict[str, LatencyHistogram] = {}
+        self.depths: dict[str, int] = {}
+        self.chains: dict[str, int] = {}
+        self.stack: list[str] = []
+
+    def run(self, event_name: str, callbacks: list[Callable], *args, **kwargs) -> None:  # noqa: D417
+        """Runs the callbacks of an event and records them.
+
+        Args:
+            event_name (str): event name.
+            callbacks (list[Callable]): callback functions.
+        """
+        self.stack.append(event_name)
+        depth = len(self.stack)
+        self.depths[event_name] = max(depth, self.depths.get(event_name, 0))
+        if depth > 1:
+            chain = ' > '.join(self.stack)
+            self.chains[chain] = self.chains.get(chain, 0) + 1
+        start_time = time.perf_counter()
+        try:
+            for callback in callbacks:
+                cb_start_time = time.perf_counter()
+                callback(*args, **kwargs)
+                self.callbacks.setdefault(
+                    getattr(callback, '__qualname__', repr(callback)),
+                    LatencyHistogram(),
+                ).add(time.perf_counter() - cb_start_time)
+        finally:
+            self.stack.pop()
+            self.events.setdefault(event_name, LatencyHistogram()).add(
+                time.perf_counter() - start_time,
+            )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the records to a dictionary.
+
+        Returns:
+            dict[str, Any]: records.
+        """
+        return {
+            'events': {
+                key: {**val.to_dict(), 'max_depth': self.depths[key]}
+                for key, val in self.events.items()
+            },
+            'callbacks': {key: val.to_dict() for key, val in self.callbacks.items()},
+            'chains': self.chains,
+        }
+
+    def format_table(self) -> str:
+        """Formats the records as a text table sorted by total wall time.
+
+        Returns:
+            str: text table.
+        """
+        rows = [
+            ['event', key, val.count, f'{val.total:.6f}', f'{val.mean:.6f}',
+             f'{val.max:.6f}', self.depths[key]]
+            for key, val in self.events.items()
+        ] + [
+            ['callback', key, val.count, f'{val.total:.6f}', f'{val.mean:.6f}',
+             f'{val.max:.6f}', '']
+            for key, val in self.callbacks.items()
+        ]
+        rows.sort(key=lambda row: (row[0], -float(row[3])))
+        return format_table(
+            header=['kind', 'name', 'count', 'total', 'mean', 'max', 'depth'],
+            rows=rows,
+        )
+
+
+def make_ref(callback: Callable) -> Callable[[], Callable | None]:
+    """Makes a reference to a callback function.
+
+        *   Bound methods are referenced weakly, so subscribing does not keep the
+            instance alive.
+        *   Other callables (functions, lambdas) are referenced strongly.
+
+    Args:
+        callback (Callable): callback function.
+
+    Returns:
+        Callable[[], Callable | None]: A function that returns the callback, or
+        ``None`` if the instance has been garbage collected.
+    """
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
+
 class EventBus:
     """Subscribe and run events.
+
+    *   Listeners are held by :func:`make_ref`, and dead listeners are removed on
+        :meth:`dispatch`.
+
+    Args:
+        master (ctk.CTk | None): The widget used to schedule the coalesced events and
+            the events posted from other threads.
+            If ``None``, these events are run immediately.
+        queue_size (int): The max number of events posted from other threads.
+        post_timeout (float | None): The time to wait for a free slot when the queue
+            is full. If ``None``, it waits until a slot is free. (sec)
     """
-    def __init__(self) -> None:
-        self.listeners: dict[str, list[Callable]] = {}
+    def __init__(
+            self,
+            master: ctk.CTk | None = None,
+            queue_size: int = 1000,
+            post_timeout: float | None = 5.0,
+        ) -> None:
+        self.master = master
+        self.thread_id = threading.get_ident()
+        self.queue: queue.Queue[tuple[float, str, tuple, dict[str, Any]]] = (
+            queue.Queue(maxsize=queue_size)
+        )
+        self.post_timeout = post_timeout
+        self.queue_stats = QueueStats()
+        self._poll_id: str | None = None
+        self.listeners: dict[str, list[Callable[[], Callable | None]]] = {}
+        self.coalesce_keys: dict[str, str] = {}
+        self.coalesce_merges: dict[
+            str, Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]],
+        ] = {}
+        self.pending: dict[str, dict[Any, dict[str, Any]]] = {}
+        self.coalesce_stats = CoalesceStats()
+        self.profiler: EventProfiler | None = None
+        self._flush_id: str | None = None
+        self.batch_depth = 0
+
+    def enable_profiling(self) -> EventProfiler:
+        """Enables recording the call count and wall time of events.
+
+        Returns:
+            EventProfiler: :class:`EventProfiler` class.
+        """
+        if self.profiler is None:
+            self.profiler = EventProfiler()
+        return self.profiler
 
     def subscribe(self, event_name: str, callback: Callable) -> None:
         """Subscribe an event.
@@ -26,19 +215,254 @@ class EventBus:
             event_name (str): event name.
             callback (Callable): callback function.
         """
-        LOGGER.debug(f'{event_name=}, {callback=}')
-        self.listeners.setdefault(event_name, []).append(callback)
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(f'{event_name=}, {callback=}')
+        self.listeners.setdefault(event_name, []).append(make_ref(callback=callback))
+
+    def unsubscribe(self, event_name: str, callback: Callable) -> None:
+        """Unsubscribe an event.
+
+            *   Dead listeners of the event are also removed.
+
+        Args:
+            event_name (str): event name.
+            callback (Callable): callback function.
+        """
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(f'{event_name=}, {callback=}')
+        refs = self.listeners.get(event_name)
+        if refs is None:
+            return
+        refs[:] = [ref for ref in refs if ref() not in (None, callback)]
+        if not refs:
+            del self.listeners[event_name]
+
+    def set_coalesce(
+            self,
+            event_name: str,
+            key: str,
+            merge: Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]]
+            | None = None,
+        ) -> None:
+        """Sets an event to the coalescing mode.
+
+            *   Emits of the event are merged per value of the keyword argument ``key``
+                and run once on the next Tk idle cycle.
+            *   If ``merge`` is ``None``, the keyword arguments of the last emit win.
+            *   The event only takes keyword arguments, so that no arguments are lost
+                when emits are merged.
+
+        Args:
+            event_name (str): event name.
+            key (str): The keyword argument name used to merge emits.
+            merge (Callable | None): The function that merges the keyword arguments of
+                the pending emit (1st argument) and the new emit (2nd argument).
+        """
+        self.coalesce_keys[event_name] = key
+        if merge is not None:
+            self.coalesce_merges[event_name] = merge
 
     def emit(self, event_name: str, *args, **kwargs) -> None:  # noqa: D417
         """Run an event.
 
+            *   Events set by :meth:`set_coalesce` are run later by :meth:`flush`.
+            *   In a batch, they are run by :meth:`commit`.
+
+        Args:
+            event_name (str): event name.
+
+        Raises:
+            TypeError: If an event set by :meth:`set_coalesce` has positional arguments
+                or does not have the keyword argument of the key.
+        """
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(f'{event_name=}, {args=}, {kwargs=}')
+        if event_name in self.coalesce_keys:
+            key = self.coalesce_keys[event_name]
+            if args or key not in kwargs:
+                LOGGER.error(
+                    f'The coalesced event takes only keyword arguments with [key]. '
+                    f'{event_name=}, {key=}, {args=}',
+                )
+                raise TypeError
+            if self.master is not None or self.batch_depth:
+                self.enqueue(event_name, **kwargs)
+                return
+        self.dispatch(event_name, *args, **kwargs)
+
+    def post(self, event_name: str, *args, **kwargs) -> None:  # noqa: D417
+        """Run an event from any thread.
+
+            *   On other threads, the event is put in the queue and run on the Tk main
+                loop by :meth:`poll`.
+            *   If the queue is full, it blocks the calling thread for
+                ``post_timeout`` seconds and raises ``queue.Full`` (backpressure).
+            *   On the Tk thread, or without a master, the event is run by
+                :meth:`emit` immediately.
+
+        Args:
+            event_name (str): event name.
+        """
+        if self.master is None or threading.get_ident() == self.thread_id:
+            self.emit(event_name, *args, **kwargs)
+            return
+        try:
+            self.queue.put(
+                item=(time.perf_counter(), event_name, args, kwargs),
+                timeout=self.post_timeout,
+            )
+        except queue.Full:
+            self.queue_stats.rejected += 1
+            LOGGER.exception(f'The event queue is full. {event_name=}')
+            raise
+        self.queue_stats.posted += 1
+
+    def start_polling(self, interval: int = 20, max_batch: int = 100) -> None:
+        """Starts running the events posted from other threads on the Tk main loop.
+
+            *   Call it on the Tk thread.
+
+        Args:
+            interval (int): The polling interval. (msec)
+            max_batch (int): The max number of events run per poll, so that the UI
+                stays responsive.
+
+        Raises:
+            ValueError: If the event bus has no master.
+        """
+        if self.master is None:
+            LOGGER.error('[master] is required to poll the events.')
+            raise ValueError
+        self.stop_polling()
+        self._poll_id = self.master.after(
+            interval, self.poll, interval, max_batch,
+        )
+
+    def stop_polling(self) -> None:
+        """Stops polling the events posted from other threads.
+        """
+        if self._poll_id is not None:
+            self.master.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def poll(self, interval: int = 20, max_batch: int = 100) -> None:
+        """Run the events posted from other threads.
+
+        Args:
+            interval (int): The polling interval. (msec)
+            max_batch (int): The max number of events run per poll.
+        """
+        depth = self.queue.qsize()
+        self.queue_stats.depth = depth
+        self.queue_stats.max_depth = max(depth, self.queue_stats.max_depth)
+        for _ in range(min(depth, max_batch)):
+            try:
+                posted_time, event_name, args, kwargs = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.queue_stats.delay.add(value=time.perf_counter() - posted_time)
+            self.queue_stats.dispatched += 1
+            self.emit(event_name, *args, **kwargs)
+        if self._poll_id is not None:
+            self._poll_id = self.master.after(
+                interval, self.poll, interval, max_batch,
+            )
+
+    def dispatch(self, event_name: str, *args, **kwargs) -> None:  # noqa: D417
+        """Run the callbacks of an event immediately.
+
         Args:
             event_name (str): event name.
         """
-        LOGGER.debug(f'{event_name=}, {args=}, {kwargs=}')
-        for callback in self.listeners.get(event_name, []):
+        refs = self.listeners.get(event_name)
+        if not refs:
+            return
+        # [Attention]
+        # Resolve into a new list because callbacks may subscribe or unsubscribe.
+        callbacks = [callback for ref in refs if (callback := ref()) is not None]
+        if len(callbacks) != len(refs):
+            refs[:] = [ref for ref in refs if ref() is not None]
+        if self.profiler is not None:
+            self.profiler.run(event_name, callbacks, *args, **kwargs)
+            return
+        for callback in callbacks:
             callback(*args, **kwargs)
 
+    def enqueue(self, event_name: str, **kwargs) -> None:  # noqa: D417
+        """Merge an emit into the pending events and schedule a flush.
+
+        Args:
+            event_name (str): event name.
+        """
+        key = kwargs[self.coalesce_keys[event_name]]
+        pending = self.pending.setdefault(event_name, {})
+        self.coalesce_stats.emitted += 1
+        if key in pending:
+            self.coalesce_stats.merged += 1
+            if event_name in self.coalesce_merges:
+                kwargs = self.coalesce_merges[event_name](pending[key], kwargs)
+        pending[key] = kwargs
+        if self._flush_id is None and not self.batch_depth:
+            self._flush_id = self.master.after_idle(self.flush)
+
+    def flush(self) -> None:
+        """Run all pending coalesced events.
+
+        *   Events emitted during the flush are scheduled for the next idle cycle.
+        """
+        if self._flush_id is not None:
+            self.master.after_cancel(self._flush_id)
+            self._flush_id = None
+        pending, self.pending = self.pending, {}
+        self.coalesce_stats.flushed += 1
+        for event_name, items in pending.items():
+            for kwargs in items.values():
+                self.coalesce_stats.dispatched += 1
+                self.dispatch(event_name, **kwargs)
+
+    def begin_batch(self) -> None:
+        """Begins a batch.
+
+        *   Until the outermost :meth:`commit`, the coalesced events are held and
+            not flushed on the Tk idle cycle.
+        *   :data:`E.BEGIN_BATCH` is run when the outermost batch begins, so that
+            listeners can start collecting updates.
+        """
+        self.batch_depth += 1
+        if self.batch_depth == 1:
+            self.dispatch(E.BEGIN_BATCH)
+
+    def commit(self) -> None:
+        """Commits a batch.
+
+        *   When the outermost batch is committed, the held coalesced events are
+            run and then :data:`E.COMMIT_BATCH` is run, so that listeners can apply
+            the collected updates in one pass.
+        """
+        if not self.batch_depth:
+            LOGGER.error('commit() is called without begin_batch().')
+            raise RuntimeError
+        self.batch_depth -= 1
+        if self.batch_depth:
+            return
+        self.flush()
+        self.dispatch(E.COMMIT_BATCH)
+
+    @contextlib.contextmanager
+    def batch(self) -> Generator['EventBus', None, None]:
+        """Runs a block in a batch.
+
+            *   The batch is committed even if the block raises an error.
+
+        Yields:
+            EventBus: This class.
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.commit()
+
 
 class BaseComponent(ABC):
     """Defines the base of the class that receives the :class:`EventBus` class.
@@ -48,12 +472,21 @@ class BaseComponent(ABC):
     """
     def __init__(self, event_bus: EventBus) -> None:
         self.event_bus = event_bus
-        items = self.register_events()
+        self.subscribed_events = self.register_events() or {}
 
-        if items:
-            for event_name, callback in items.items():
+        for event_name, callback in self.subscribed_events.items():
+            if LOGGER.isEnabledFor(DEBUG):
                 LOGGER.debug(f'{event_name=}, {callback=}')
-                self.event_bus.subscribe(event_name=event_name, callback=callback)
+            self.event_bus.subscribe(event_name=event_name, callback=callback)
+
+    def unsubscribe_events(self) -> None:
+        """Unsubscribe all events registered by :meth:`register_events`.
+
+        *   Call it when the widget is destroyed.
+        """
+        for event_name, callback in self.subscribed_events.items():
+            self.event_bus.unsubscribe(event_name=event_name, callback=callback)
+        self.subscribed_events = {}
 
     @abstractmethod
     def register_events(self) -> dict[str, Callable]:
@@ -67,6 +500,35 @@ class BaseComponent(ABC):
         ...
 
 
+@dataclass
+class PageContext:
+    """Defines the models and options shared by the pages.
+
+    *   A model of ``None`` is replaced with a default one or not used by the page.
+    """
+    #: ThemeStore | None: :class:`ThemeStore` class that the setting values are
+    #: written to and the theme data is saved from.
+    theme_store: ThemeStore | None = None
+    #: ThemeCache | None: :class:`ThemeCache` class used to load theme files.
+    theme_cache: ThemeCache | None = None
+    #: ColorResolver | None: :class:`ColorResolver` class used to reject invalid
+    #: colors.
+    color_resolver: ColorResolver | None = None
+    #: ContrastAuditor | None: :class:`ContrastAuditor` class used to show the
+    #: settings with low contrast.
+    contrast_auditor: ContrastAuditor | None = None
+    #: PaletteTransformer | None: :class:`PaletteTransformer` class used to generate
+    #: theme variants.
+    palette_transformer: PaletteTransformer | None = None
+    #: int: The number of rows above which a settings page is virtualized.
+    #: If ``0``, the pages are never virtualized.
+    virtual_rows: int = 0
+    #: int: The interval to check the loaded file for changes. (msec)
+    watch_interval: int = 1000
+    #: bool: If ``True``, theme files are serialized and written on a worker thread.
+    save_thread: bool = False
+
+
 class BasePage(ctk.CTkScrollableFrame, BaseComponent):
     """Defines the base page.
 
@@ -86,3 +548,9 @@ class BasePage(ctk.CTkScrollableFrame, BaseComponent):
         BaseComponent.__init__(self=self, event_bus=event_bus)
 
         self.configure(fg_color='transparent', label_text=page_name)
+
+    def destroy(self) -> None:
+        """Unsubscribe all events and destroy the page.
+        """
+        self.unsubscribe_events()
+        super().destroy()
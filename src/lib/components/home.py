@@ -1,22 +1,28 @@
 """This is the module that defines Home page class.
 """
 
-import json
+import threading
 from collections.abc import Callable
 from logging import getLogger
 from pathlib import Path
+from typing import Any
 
 import customtkinter as ctk
 
-from lib.common.file import dump_json, load_json
+from lib.common.file import ThemeCache, dumps_json, iter_json_chunks, write_atomic
+from lib.common.palette import PRESET_VARIANTS, PaletteTransformer
+from lib.common.process import diff_theme
+from lib.common.store import ThemeStore
 from lib.common.types import EventName as E
 from lib.common.types import ParamLog
-from lib.components.base import BasePage, EventBus
+from lib.components.base import BasePage, EventBus, PageContext
 
 PARAM_LOG = ParamLog()
 LOGGER = getLogger(PARAM_LOG.NAME)
 
 FIRST_PAGE_NAME = 'Home'
+#: int: The max number of recent theme files.
+MAX_RECENT = 10
 
 
 class HomePage(BasePage):
@@ -25,8 +31,20 @@ class HomePage(BasePage):
     Args:
         master (ctk.CTk): parent widget class.
         event_bus (EventBus): :class:`EventBus` class.
+        context (PageContext | None): :class:`PageContext` class.
+            Without a theme store, an empty store is used. Without a theme cache, a
+            cache only in memory is used. Without a palette transformer, the colors
+            of the variants are resolved without Tk. If the watch interval is ``0``,
+            the file is not watched by default.
     """
-    def __init__(self, master: ctk.CTk, event_bus: EventBus, **kwargs) -> None:
+    def __init__(
+            self,
+            master: ctk.CTk,
+            event_bus: EventBus,
+            context: PageContext | None = None,
+            **kwargs,
+        ) -> None:
+        context = context if context is not None else PageContext()
         super().__init__(
             master=master,
             event_bus=event_bus,
@@ -46,23 +64,78 @@ class HomePage(BasePage):
             text='選択',
             command=self.on_open_file_dialog,
         ).grid(row=0, column=1, padx=(0, 10), pady=10)
+        self.progress_bar = ctk.CTkProgressBar(master=self)
+        self.progress_bar.grid(row=1, column=0, padx=10, sticky=ctk.EW)
+        self.progress_bar.set(0)
+        self.recent_menu = ctk.CTkOptionMenu(
+            master=self,
+            values=[],
+            command=self.on_select_recent,
+        )
+        self.recent_menu.set('最近のテーマ')
+        self.recent_menu.grid(row=1, column=1, padx=(0, 10))
+        self.watch_switch = ctk.CTkSwitch(
+            master=self,
+            text='ファイルの変更を反映',
+            command=self.on_switch_watch,
+        )
+        self.watch_switch.grid(row=1, column=2, padx=(0, 10))
+        self.variant_menu = ctk.CTkOptionMenu(
+            master=self,
+            values=list(PRESET_VARIANTS),
+            command=self.on_select_variant,
+        )
+        self.variant_menu.set('バリエーション')
+        self.variant_menu.grid(row=1, column=3, padx=(0, 10))
+        if context.watch_interval:
+            self.watch_switch.select()
         self.base_data = ctk.CTkTextbox(master=self, corner_radius=10, border_width=2)
-        self.base_data.grid(row=1, column=0, padx=10, pady=10, sticky=ctk.NSEW)
+        self.base_data.grid(row=2, column=0, padx=10, pady=10, sticky=ctk.NSEW)
 
         self.save_file = ctk.CTkEntry(
             master=self,
             placeholder_text='保存するファイルを選択してください',
         )
-        self.save_file.grid(row=2, column=0, padx=10, pady=10, sticky=ctk.EW)
+        self.save_file.grid(row=3, column=0, padx=10, pady=10, sticky=ctk.EW)
         ctk.CTkButton(
             master=self,
             text='保存',
             command=self.on_save_file,
-        ).grid(row=2, column=1, padx=(0, 10), pady=10, sticky=ctk.N)
+        ).grid(row=3, column=1, padx=(0, 10), pady=10, sticky=ctk.N)
         self.save_data = ctk.CTkTextbox(master=self, corner_radius=10, border_width=2)
-        self.save_data.grid(row=3, column=0, padx=10, pady=10, sticky=ctk.NSEW)
+        self.save_data.grid(row=4, column=0, padx=10, pady=10, sticky=ctk.NSEW)
 
-        self.new_data = {}
+        self.theme_store = (
+            context.theme_store if context.theme_store is not None else ThemeStore()
+        )
+        # [Attention]
+        # load_id identifies the current loading, and the chunks of an older loading
+        # (e.g., another file was selected while loading) are ignored.
+        # loading_data is the theme data received so far.
+        self.load_id = 0
+        self.loading_data: dict[str, Any] = {}
+        self.loading_path = ''
+        # [Attention]
+        # The theme files are loaded through the cache, so the recent themes are
+        # reopened without parsing them again.
+        self.theme_cache = (
+            context.theme_cache if context.theme_cache is not None else ThemeCache()
+        )
+        self.recent_paths: list[str] = []
+        # [Attention]
+        # In the watch mode, the stat of the loaded file is polled, and a changed file
+        # is applied by the diff from file_data (the data last read from the file).
+        # The values edited in the app are kept unless they are changed in the file.
+        self.watch_interval = context.watch_interval or 1000
+        self.watch_id: str | None = None
+        self.watch_stat: tuple[int, int] | None = None
+        self.file_data: dict[str, Any] = {}
+        self.save_thread = context.save_thread
+        self.save_text = ''
+        self.palette_transformer = (
+            context.palette_transformer if context.palette_transformer is not None
+            else PaletteTransformer()
+        )
 
     def register_events(self) -> dict[str, Callable]:
         """Returns a list of events to subscribe to.
@@ -71,22 +144,296 @@ class HomePage(BasePage):
             dict[str, Callable]: events list to register. (key: event name, val: func)
         """
         return {
-            E.RECIEVE_DATA: self.on_recieve_data,
+            E.LOAD_CHUNK: self.on_load_chunk,
+            E.LOAD_DONE: self.on_load_done,
+            E.RELOAD_FILE: self.on_reload_file,
+            E.SAVE_DONE: self.on_save_done,
         }
 
     def load_file(self, filepath: str) -> None:
         """Load CustomTkinter theme file.
 
+            *   The file is parsed and formatted on a worker thread, and the results
+                are sent back in chunks by :meth:`EventBus.post`.
+                (:meth:`on_load_chunk`, :meth:`on_load_done`)
+
+        Args:
+            filepath (str): file path.
+        """
+        self.load_id += 1
+        self.loading_data = {}
+        self.loading_path = filepath
+        self.watch_stat = None
+        self.progress_bar.set(0)
+        self.base_file.configure(state=ctk.NORMAL)
+        self.base_file.delete(first_index=0, last_index=ctk.END)
+        self.base_file.insert(index=0, string=filepath)
+        self.base_file.configure(state='readonly')
+        self.base_data.configure(state=ctk.NORMAL)
+        self.base_data.delete(index1='1.0', index2=ctk.END)
+        self.base_data.configure(state=ctk.DISABLED)
+        threading.Thread(
+            target=self.read_file,
+            args=(Path(filepath), self.load_id, self.event_bus, self.theme_cache),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def read_file(
+            fpath: Path,
+            load_id: int,
+            event_bus: EventBus,
+            theme_cache: ThemeCache,
+        ) -> None:
+        """Parse and format CustomTkinter theme file. (worker thread)
+
+            *   It does not touch any widgets. The results are posted to the Tk
+                thread.
+
+        Args:
+            fpath (Path): file path.
+            load_id (int): The id of the loading.
+            event_bus (EventBus): :class:`EventBus` class.
+            theme_cache (ThemeCache): :class:`ThemeCache` class.
+        """
+        try:
+            data = theme_cache.load(fpath=fpath)
+            total = max(len(data), 1)
+            done = 0
+            for text, items in iter_json_chunks(data=data):
+                done += len(items)
+                event_bus.post(
+                    E.LOAD_CHUNK,
+                    load_id=load_id,
+                    text=text,
+                    items=items,
+                    progress=done / total,
+                )
+        except (OSError, ValueError) as e:
+            LOGGER.exception(f'Failed to load the theme file. {fpath=}')
+            event_bus.post(E.LOAD_DONE, load_id=load_id, error=f'{e}')
+            return
+        event_bus.post(E.LOAD_DONE, load_id=load_id, error=None)
+
+    def on_load_chunk(
+            self,
+            load_id: int,
+            text: str,
+            items: dict[str, Any],
+            progress: float,
+        ) -> None:
+        """Add a chunk of the loading theme file.
+
+            *   The text is appended to the textbox, and only the settings pages of
+                the items are built by :data:`E.ADD_PAGES`.
+
+        Args:
+            load_id (int): The id of the loading.
+            text (str): The formatted text of the chunk.
+            items (dict[str, Any]): The theme data of the chunk.
+            progress (float): The ratio of the items received so far.
+        """
+        if load_id != self.load_id:
+            return
+        self.base_data.configure(state=ctk.NORMAL)
+        self.base_data.insert(index=ctk.END, text=text)
+        self.base_data.configure(state=ctk.DISABLED)
+        self.progress_bar.set(progress)
+        if items:
+            self.loading_data.update(items)
+            self.event_bus.emit(event_name=E.ADD_PAGES, data=items)
+
+    def on_load_done(self, load_id: int, error: str | None) -> None:
+        """Finish loading the theme file.
+
+            *   The theme data received so far is checked once, and the pages that are
+                not in it are removed by :data:`E.BUILD_PAGE`.
+
+        Args:
+            load_id (int): The id of the loading.
+            error (str | None): The error message. ``None`` if it succeeded.
+        """
+        if load_id != self.load_id:
+            return
+        self.progress_bar.set(1)
+        if self.loading_data:
+            self.event_bus.emit(
+                event_name=E.BUILD_PAGE,
+                data=dict(self.loading_data),
+                added=True,
+            )
+        if error is not None:
+            self.base_data.configure(state=ctk.NORMAL)
+            self.base_data.insert(index=ctk.END, text=error)
+            self.base_data.configure(state=ctk.DISABLED)
+            return
+        LOGGER.info(
+            f'Loaded the theme file. ({len(self.loading_data)} pages, '
+            f'{self.theme_cache.stats})',
+        )
+        self.add_recent(filepath=self.loading_path)
+        self.file_data = dict(self.loading_data)
+        self.watch_stat = self.get_stat(filepath=self.loading_path)
+        self.on_switch_watch()
+
+    @staticmethod
+    def get_stat(filepath: str) -> tuple[int, int] | None:
+        """Gets the stat of a file to detect changes.
+
+        Args:
+            filepath (str): file path.
+
+        Returns:
+            tuple[int, int] | None: The mtime (nsec) and size.
+            ``None`` if the file does not exist.
+        """
+        try:
+            stat = Path(filepath).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def on_switch_watch(self) -> None:
+        """Start or stop watching the loaded file.
+        """
+        if self.watch_id is not None:
+            self.after_cancel(self.watch_id)
+            self.watch_id = None
+        if self.watch_switch.get() and self.watch_stat is not None:
+            self.watch_id = self.after(self.watch_interval, self.poll_file)
+
+    def poll_file(self) -> None:
+        """Check the loaded file for changes, and reload it if changed.
+        """
+        self.watch_id = self.after(self.watch_interval, self.poll_file)
+        stat = self.get_stat(filepath=self.loading_path)
+        if stat is None or stat == self.watch_stat:
+            return
+        LOGGER.info(f'The theme file is changed. {self.loading_path=}')
+        self.watch_stat = stat
+        threading.Thread(
+            target=self.reread_file,
+            args=(Path(self.loading_path), self.load_id, self.event_bus,
+                  self.theme_cache),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def reread_file(
+            fpath: Path,
+            load_id: int,
+            event_bus: EventBus,
+            theme_cache: ThemeCache,
+        ) -> None:
+        """Parse and format a changed theme file. (worker thread)
+
+        Args:
+            fpath (Path): file path.
+            load_id (int): The id of the loading.
+            event_bus (EventBus): :class:`EventBus` class.
+            theme_cache (ThemeCache): :class:`ThemeCache` class.
+        """
+        try:
+            data = theme_cache.load(fpath=fpath)
+            text = dumps_json(data=data, indent=2).decode('utf-8')
+        except (OSError, ValueError):
+            # [Attention]
+            # The file may be in the middle of saving by an editor.
+            # It is read again on the next change.
+            LOGGER.exception(f'Failed to reload the theme file. {fpath=}')
+            return
+        event_bus.post(E.RELOAD_FILE, load_id=load_id, data=data, text=text)
+
+    def on_reload_file(self, load_id: int, data: dict[str, Any], text: str) -> None:
+        """Apply a changed theme file.
+
+            *   Only the changed values are sent by :data:`E.PATCH_PAGE`.
+            *   If the pages or keys are changed, the pages are rebuilt by
+                :data:`E.BUILD_PAGE`. (The pages and buttons are reused.)
+
+        Args:
+            load_id (int): The id of the loading.
+            data (dict[str, Any]): The theme data of the file.
+            text (str): The formatted text of the file.
+        """
+        if load_id != self.load_id:
+            return
+        changes = diff_theme(old=self.file_data, new=data)
+        self.file_data = dict(data)
+        self.base_data.configure(state=ctk.NORMAL)
+        self.base_data.delete(index1='1.0', index2=ctk.END)
+        self.base_data.insert(index='1.0', text=text)
+        self.base_data.configure(state=ctk.DISABLED)
+        if changes is None:
+            LOGGER.info('The shape of the theme is changed. It rebuilds the pages.')
+            self.event_bus.emit(event_name=E.BUILD_PAGE, data=dict(data))
+            return
+        LOGGER.info(
+            f'Changed settings: {sum(len(val) for val in changes.values())} '
+            f'in {len(changes)} pages',
+        )
+        if changes:
+            self.event_bus.emit(event_name=E.PATCH_PAGE, changes=changes)
+
+    def add_recent(self, filepath: str) -> None:
+        """Add a theme file to the top of the recent themes.
+
         Args:
             filepath (str): file path.
         """
-        data = load_json(fpath=Path(filepath))
-        formated_data = json.dumps(data, indent=2, ensure_ascii=False)
+        if filepath in self.recent_paths:
+            self.recent_paths.remove(filepath)
+        self.recent_paths.insert(0, filepath)
+        del self.recent_paths[MAX_RECENT:]
+        self.recent_menu.configure(values=self.recent_paths)
+        self.recent_menu.set('最近のテーマ')
+
+    def on_select_recent(self, filepath: str) -> None:
+        """Reopen a recent theme file.
+
+        Args:
+            filepath (str): file path.
+        """
+        self.load_file(filepath=filepath)
+
+    def on_select_variant(self, name: str) -> None:
+        """Open a variant of the current theme as a new theme.
+
+            *   The variant is generated from the theme store, so the edited values
+                are included.
+            *   The loaded file is no longer watched, and the pages are dirty until the
+                variant is saved.
+
+        Args:
+            name (str): variant name. (:data:`lib.common.palette.PRESET_VARIANTS`)
+        """
+        self.variant_menu.set('バリエーション')
+        data, _ = self.theme_store.snapshot()
+        if not data:
+            return
+        data = self.palette_transformer.transform(
+            data=data,
+            variant=PRESET_VARIANTS[name],
+        )
+        # [Attention]
+        # load_id is changed, so the chunks and reloads of the loaded file are ignored.
+        self.load_id += 1
+        self.watch_stat = None
+        self.file_data = {}
+        self.on_switch_watch()
+        self.base_file.configure(state=ctk.NORMAL)
+        self.base_file.delete(first_index=0, last_index=ctk.END)
+        self.base_file.insert(index=0, string=f'{self.loading_path} ({name})')
+        self.base_file.configure(state='readonly')
         self.base_data.configure(state=ctk.NORMAL)
         self.base_data.delete(index1='1.0', index2=ctk.END)
-        self.base_data.insert(index='1.0', text=formated_data)
+        self.base_data.insert(
+            index='1.0',
+            text=dumps_json(data=data, indent=2).decode('utf-8'),
+        )
         self.base_data.configure(state=ctk.DISABLED)
-        self.event_bus.emit(event_name=E.BUILD_PAGE, data=data)
+        LOGGER.info(f'Opened the theme variant. {name=}')
+        self.event_bus.emit(event_name=E.BUILD_PAGE, data=data, dirty=True)
 
     def on_open_file_dialog(self) -> None:
         """Opens a file dialog to select the CustomTkinter theme file.
@@ -98,21 +445,21 @@ class HomePage(BasePage):
             '.venv\\Lib\\site-packages\\customtkinter\\assets\\themes',
         )
         if fpath:
-            self.base_file.configure(state=ctk.NORMAL)
-            self.base_file.delete(first_index=0, last_index=ctk.END)
-            self.base_file.insert(index=0, string=fpath)
-            self.base_file.configure(state='readonly')
             self.load_file(filepath=fpath)
 
     def on_save_file(self) -> None:
         """Opens a file dialog to save the CustomTkinter theme file.
+
+        *   The theme data is read from the theme store, and only the pages
+            changed since the last save are formatted again.
+        *   The file is written by :meth:`write_file`, on a worker thread if
+            ``save_thread`` is ``True``.
         """
-        self.event_bus.emit(event_name=E.GET_DATA)
-        formated_data = json.dumps(self.new_data, indent=2, ensure_ascii=False)
-        self.save_data.configure(state=ctk.NORMAL)
-        self.save_data.delete(index1='1.0', index2=ctk.END)
-        self.save_data.insert(index='1.0', text=formated_data)
-        self.save_data.configure(state=ctk.DISABLED)
+        # [Attention]
+        # The settings pages keep updating the store, so the text and the page
+        # versions are taken here. The pages changed while saving stay dirty.
+        raw = self.theme_store.to_json().encode('utf-8')
+        _, versions = self.theme_store.snapshot()
 
         fpath = ctk.filedialog.asksaveasfilename(
             title='select save json file.',
@@ -124,14 +471,83 @@ class HomePage(BasePage):
             self.save_file.delete(first_index=0, last_index=ctk.END)
             self.save_file.insert(index=0, string=fpath)
             self.save_file.configure(state='readonly')
-            fpath = Path(fpath)
-            dump_json(data=self.new_data, fpath=fpath, indent=2, ensure_ascii=False)
 
-    def on_recieve_data(self, fm: str, data: dict[str, int | str | list[str]]) -> None:
-        """Receive data.
+        args = (raw, Path(fpath) if fpath else None, self.event_bus, versions)
+        if self.save_thread:
+            threading.Thread(target=self.write_file, args=args, daemon=True).start()
+        else:
+            self.write_file(*args)
+
+    @staticmethod
+    def write_file(
+            raw: bytes,
+            fpath: Path | None,
+            event_bus: EventBus,
+            versions: dict[str, int] | None = None,
+        ) -> None:
+        """Write CustomTkinter theme file. (any thread)
+
+            *   The bytes are used for both the textbox and the file.
+            *   The file is written atomically, and not written if it is not changed.
+                (:func:`lib.common.file.write_atomic`)
+            *   The result is sent by :data:`E.SAVE_DONE`.
+
+        Args:
+            raw (bytes): The formatted theme data.
+            fpath (Path | None): file path. If ``None``, the file is not written.
+            event_bus (EventBus): :class:`EventBus` class.
+            versions (dict[str, int] | None): The page versions of the theme store
+                when the data was formatted. (:meth:`ThemeStore.snapshot`)
+        """
+        written = error = None
+        if fpath is not None:
+            try:
+                written = write_atomic(raw=raw, fpath=fpath)
+            except OSError as e:
+                LOGGER.exception(f'Failed to save the theme file. {fpath=}')
+                error = f'{e}'
+        event_bus.post(
+            E.SAVE_DONE,
+            text=raw.decode('utf-8'),
+            fpath=str(fpath or ''),
+            written=written,
+            error=error,
+            versions=versions,
+        )
+
+    def on_save_done(
+            self,
+            text: str,
+            fpath: str,
+            written: bool | None,  # noqa: FBT001
+            error: str | None,
+            versions: dict[str, int] | None = None,
+        ) -> None:
+        """Show the saved theme data.
+
+            *   When the file is saved, the saved pages of the theme store are marked
+                clean.
 
         Args:
-            fm (str): Sender name.
-            data (dict[str, int  |  str  |  list[str]]): CustomTkinter theme data.
+            text (str): The formatted text of the theme data.
+            fpath (str): file path. Empty if the file is not written.
+            written (bool | None): ``True`` if the file is written, ``False`` if it is
+                not changed. ``None`` if it is not saved.
+            error (str | None): The error message. ``None`` if it succeeded.
+            versions (dict[str, int] | None): The page versions of the theme store
+                when the data was formatted.
         """
-        self.new_data[fm] = data
+        if text != self.save_text:
+            self.save_text = text
+            self.save_data.configure(state=ctk.NORMAL)
+            self.save_data.delete(index1='1.0', index2=ctk.END)
+            self.save_data.insert(index='1.0', text=text)
+            self.save_data.configure(state=ctk.DISABLED)
+        if error is not None:
+            LOGGER.error(f'The theme file is not saved. {fpath=}, {error=}')
+        elif written is not None:
+            self.theme_store.mark_clean(versions=versions)
+            LOGGER.info(
+                f'Saved the theme file. {fpath=}' if written else
+                f'The theme file is not changed. {fpath=}',
+            )
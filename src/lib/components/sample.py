@@ -3,18 +3,28 @@
 
 import enum
 import platform
+import weakref
 from collections.abc import Callable
+from dataclasses import dataclass
 from logging import getLogger
+from typing import Any
 
 import customtkinter as ctk
 
+from lib.common.schema import Mode as M
+from lib.common.schema import compile_page
 from lib.common.types import THEME_DATA_TYPE, ParamLog
 from lib.common.types import EventName as E
+from lib.common.types import WidgetName as W
+from lib.common.types import WidgetSetting as S
 from lib.components.base import BasePage, EventBus
 
 PARAM_LOG = ParamLog()
 LOGGER = getLogger(PARAM_LOG.NAME)
 
+#: tuple[str, ...]: The keys of the 'CTkFont' settings passed to ctk.CTkFont.
+FONT_PROPS = (S.FAMILY, S.SIZE, S.WEIGHT)
+
 SAMPLE_ITEM_TYPE = dict[str,
     ctk.CTk |
     ctk.CTkToplevel |
@@ -38,66 +48,6 @@ SAMPLE_ITEM_TYPE = dict[str,
 ]
 
 
-class W(enum.StrEnum):
-    """Defines the CustomTkinter widget identifier.
-    """
-    CTK = 'CTk'
-    TOPLEVEL = 'CTkToplevel'
-    FRAME = 'CTkFrame'
-    BUTTON = 'CTkButton'
-    LABEL = 'CTkLabel'
-    ENTRY = 'CTkEntry'
-    CHECKBOX = 'CTkCheckBox'
-    SWITCH = 'CTkSwitch'
-    RADIOBUTTON = 'CTkRadioButton'
-    PROGRESSBAR = 'CTkProgressBar'
-    SLIDER = 'CTkSlider'
-    OPTIONMENU = 'CTkOptionMenu'
-    COMBOBOX = 'CTkComboBox'
-    SCROLLBAR = 'CTkScrollbar'
-    SEGMENTEDBUTTON = 'CTkSegmentedButton'
-    TEXTBOX = 'CTkTextbox'
-    SCROLLABLEFRAME = 'CTkScrollableFrame'
-    FONT = 'CTkFont'
-    DROPDOWNMENU = 'DropdownMenu'
-
-
-class S(enum.StrEnum):
-    """Defines the CustomTkinter widget setting identifier.
-    """
-    # Color
-    FG_COLOR = enum.auto()
-    TOP_FG_COLOR = enum.auto()
-    LABEL_FG_COLOR = enum.auto()
-    BORDER_COLOR = enum.auto()
-    HOVER_COLOR = enum.auto()
-    CHECKMARK_COLOR = enum.auto()
-    PROGRESS_COLOR = enum.auto()
-    BUTTON_COLOR = enum.auto()
-    BUTTON_HOVER_COLOR = enum.auto()
-    TEXT_COLOR = enum.auto()
-    TEXT_COLOR_DISABLED = enum.auto()
-    PLACEHOLDER_TEXT_COLOR = enum.auto()
-    SELECTED_COLOR = enum.auto()
-    SELECTED_HOVER_COLOR = enum.auto()
-    UNSELECTED_COLOR = enum.auto()
-    UNSELECTED_HOVER_COLOR = enum.auto()
-    SCROLLBAR_BUTTON_COLOR = enum.auto()
-    SCROLLBAR_BUTTON_HOVER_COLOR = enum.auto()
-    # Width, Spacing, Radiius, length
-    BORDER_WIDTH = enum.auto()
-    BORDER_WIDTH_CHECKED = enum.auto()
-    BORDER_WIDTH_UNCHECKED = enum.auto()
-    BORDER_SPACING = enum.auto()
-    CORNER_RADIUS = enum.auto()
-    BUTTON_CORNER_RADIUS = enum.auto()
-    BUTTON_LENGTH = enum.auto()
-    # Font
-    FAMILY = enum.auto()
-    SIZE = enum.auto()
-    WEIGHT = enum.auto()
-
-
 class C(enum.StrEnum):
     """Defines the condition identifier.
     """
@@ -105,6 +55,115 @@ class C(enum.StrEnum):
     DISABLED = enum.auto()
 
 
+@dataclass
+class ConfigureStats:
+    """Defines the counters of the widget reconfiguration.
+    """
+    #: int: The number of ``configure()`` calls.
+    called: int = 0
+    #: int: The number of ``configure()`` calls (and redraws) skipped with no changes.
+    skipped: int = 0
+    #: int: The number of properties passed to ``configure()``.
+    applied_props: int = 0
+    #: int: The number of properties skipped because they were already applied.
+    skipped_props: int = 0
+    #: int: The number of batches applied in one pass.
+    batches: int = 0
+
+
+def diff_props(applied: dict[str, Any], values: dict[str, Any]) -> dict[str, Any]:
+    """Gets the properties that differ from the applied values.
+
+    Args:
+        applied (dict[str, Any]): The last applied properties.
+        values (dict[str, Any]): The properties to apply.
+
+    Returns:
+        dict[str, Any]: The changed properties.
+    """
+    return {
+        prop: val for prop, val in values.items()
+        if prop not in applied or applied[prop] != val
+    }
+
+
+def get_props(
+        item_name: str,
+        values: THEME_DATA_TYPE,
+        changed: set[str] | None = None,
+    ) -> dict[str, Any]:
+    """Gets the widget properties of a page from its setting values.
+
+        *   The widget properties are looked up in the schema of the page shape.
+            (See :func:`lib.common.schema.compile_page`)
+        *   The properties that are not in the values (e.g., settings with invalid
+            colors) are not in the page shape, so the widgets keep the last valid
+            values.
+
+    Args:
+        item_name (str): Widget name.
+        values (THEME_DATA_TYPE): Setting value.
+        changed (set[str] | None): The changed setting keys.
+            If ``None``, all keys are changed.
+
+    Returns:
+        dict[str, Any]: The widget properties.
+    """
+    props = compile_page(page_name=item_name, keys=tuple(values)).props
+    return {
+        prop: values[prop] for prop in props if changed is None or prop in changed
+    }
+
+
+def resolve_props(kwargs: dict[str, Any], mode: str) -> dict[str, Any]:
+    """Resolves the [light, dark] values of the properties for an appearance mode.
+
+        *   A property of one value is used for both modes.
+
+    Args:
+        kwargs (dict[str, Any]): The properties.
+        mode (str): 'light' or 'dark'.
+
+    Returns:
+        dict[str, Any]: The properties of one value.
+    """
+    index = 0 if mode == M.LIGHT else 1
+    return {
+        prop: val[index] if isinstance(val, list | tuple) else val
+        for prop, val in kwargs.items()
+    }
+
+
+def get_os_name() -> str:
+    """Gets the OS name used as the key of the 'CTkFont' settings.
+
+    Returns:
+        str: 'macOS', 'Windows' or 'Linux'.
+    """
+    system = platform.system()
+    return 'macOS' if system == 'Darwin' else system
+
+
+def get_font_props(values: THEME_DATA_TYPE) -> dict[str, Any] | None:
+    """Gets the ctk.CTkFont properties of this OS from the 'CTkFont' settings.
+
+    Args:
+        values (THEME_DATA_TYPE): Setting value.
+
+    Returns:
+        dict[str, Any] | None: (family, size, weight) ``None`` if the settings of
+        this OS are missing or the size is not a number.
+    """
+    value = values.get(get_os_name())
+    if not isinstance(value, dict) or any(prop not in value for prop in FONT_PROPS):
+        LOGGER.debug('The font settings of this OS are missing. (value=%r)', value)
+        return None
+    if not isinstance(value[S.SIZE], int):
+        LOGGER.debug('The font size must be number. (size=%r)', value[S.SIZE])
+        return None
+    return {prop: value[prop] for prop in FONT_PROPS}
+
+
 class SamplePage(BasePage):
     """Defines the Sample page.
 
@@ -124,16 +183,40 @@ class SamplePage(BasePage):
 
         self._condtion = {
             C.FONT: [W.TOPLEVEL, W.PROGRESSBAR, W.SLIDER, W.FRAME, W.SCROLLBAR,
-                     W.SCROLLABLEFRAME],
+                     W.SCROLLABLEFRAME, W.FONT],
             C.DISABLED: [W.BUTTON, W.CHECKBOX, W.SWITCH, W.RADIOBUTTON, W.OPTIONMENU,
                          W.COMBOBOX, W.SEGMENTEDBUTTON],
         }
 
         self.sample_items: SAMPLE_ITEM_TYPE = {}
+        # [Attention]
+        # applied[widget] is the last properties passed to configure().
+        # The keys are weak, so a closed CTkToplevel is released.
+        self.applied: weakref.WeakKeyDictionary[Any, dict[str, Any]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self.configure_stats = ConfigureStats()
+        # [Attention]
+        # In a batch of the event bus, the properties are collected per widget here
+        # and applied in one pass on commit.
+        self.batch_items: dict[Any, dict[str, Any]] | None = None
+        # [Attention]
+        # Each pane has one ctk.CTkFont (items[W.FONT]) assigned to its widgets when it
+        # is built. A font change updates it in place, and ctk.CTkFont notifies the
+        # widgets using it, so they are not configured again.
+        # font_props is the last applied properties of the fonts.
+        self.font_props: dict[str, Any] = {}
+        self.batch_font: dict[str, Any] | None = None
+        # [Attention]
+        # In the dual preview, panes[mode] is the sample widgets of the mode, and the
+        # [light, dark] values are resolved for each pane. (No global mode change.)
+        # theme_values[item_name] is the last values used to fill a new pane.
+        self.panes: dict[str, SAMPLE_ITEM_TYPE] = {}
+        self.theme_values: dict[str, THEME_DATA_TYPE] = {}
 
         frame = ctk.CTkFrame(master=self, fg_color=('gray80', 'gray20'))
         frame.grid(row=0, column=0, columnspan=2, sticky=ctk.EW)
-        frame.grid_columnconfigure(index=(0, 1), weight=1)
+        frame.grid_columnconfigure(index=(0, 1, 2), weight=1)
         ctk.CTkButton(
             master=frame,
             text='Open Top Level Window',
@@ -151,6 +234,15 @@ class SamplePage(BasePage):
             command=self.on_disabled_sample,
         )
         self.disabled_switch.grid(row=0, column=1, pady=20)
+        self.dual_switch = ctk.CTkSwitch(
+            master=frame,
+            text='Light / Dark Preview',
+            button_color=('orange', 'orange'),
+            button_hover_color=('orange3', 'orange3'),
+            progress_color=('orange3', 'orange3'),
+            command=self.on_dual_preview,
+        )
+        self.dual_switch.grid(row=0, column=2, pady=20)
 
         # CTk
         # [Attetion]
@@ -221,6 +313,9 @@ class SamplePage(BasePage):
         self.sample_items[W.SCROLLBAR] = self._scrollbar
         # CTkFrame
         self.sample_items[W.FRAME] = self._parent_frame
+        # CTkFont
+        self.sample_items[W.FONT] = ctk.CTkFont()
+        self.assign_font(items=self.sample_items)
 
     def register_events(self) -> dict[str, Callable]:
         """Returns a list of events to subscribe to.
@@ -228,7 +323,11 @@ class SamplePage(BasePage):
         Returns:
             dict[str, Callable]: events list to register. (key: event name, val: func)
         """
-        return {E.CHANGE_CONF: self.on_change_conf}
+        return {
+            E.CHANGE_CONF: self.on_change_conf,
+            E.BEGIN_BATCH: self.on_begin_batch,
+            E.COMMIT_BATCH: self.on_commit_batch,
+        }
 
     def on_open_window(self) -> None:
         """Open ctk.CTkToplevel window.
@@ -246,187 +345,249 @@ class SamplePage(BasePage):
 
     def on_disabled_sample(self) -> None:
         state = 'normal' if not self.disabled_switch.get() else 'disabled'
-        for key in self._condtion[C.DISABLED]:
-            self.sample_items[key].configure(state=state)
+        for items in [self.sample_items, *self.panes.values()]:
+            for key in self._condtion[C.DISABLED]:
+                items[key].configure(state=state)
+
+    def create_pane(self, mode: str) -> SAMPLE_ITEM_TYPE:
+        """Create the sample widgets of the dual preview.
+
+        Args:
+            mode (str): 'light' or 'dark'.
 
-    def on_change_conf(self, item_name: str, values: THEME_DATA_TYPE) -> None:  # noqa: C901, PLR0912
+        Returns:
+            SAMPLE_ITEM_TYPE: The sample widgets of the pane.
+        """
+        frame = ctk.CTkFrame(master=self)
+        frame.grid_columnconfigure(index=0, weight=1)
+        items: SAMPLE_ITEM_TYPE = {
+            W.LABEL: ctk.CTkLabel(master=frame, text=f'CTkLabel ({mode})'),
+            W.ENTRY: ctk.CTkEntry(master=frame),
+            W.BUTTON: ctk.CTkButton(master=frame),
+            W.SEGMENTEDBUTTON: ctk.CTkSegmentedButton(
+                master=frame,
+                values=['button1', 'button2'],
+            ),
+            W.CHECKBOX: ctk.CTkCheckBox(master=frame),
+            W.RADIOBUTTON: ctk.CTkRadioButton(master=frame),
+            W.SWITCH: ctk.CTkSwitch(master=frame),
+            W.PROGRESSBAR: ctk.CTkProgressBar(master=frame, width=140),
+            W.SLIDER: ctk.CTkSlider(master=frame, width=140),
+            W.OPTIONMENU: ctk.CTkOptionMenu(
+                master=frame,
+                values=['option1', 'option2', 'option3'],
+            ),
+            W.COMBOBOX: ctk.CTkComboBox(
+                master=frame,
+                values=['combo1', 'combo2', 'combo3'],
+            ),
+            W.TEXTBOX: ctk.CTkTextbox(master=frame, width=140, height=60),
+        }
+        for row, item in enumerate(items.values()):
+            item.grid(row=row, column=0, padx=10, pady=5)
+        items[W.DROPDOWNMENU] = {
+            W.OPTIONMENU: items[W.OPTIONMENU]._dropdown_menu,  # noqa: SLF001
+            W.COMBOBOX: items[W.COMBOBOX]._dropdown_menu,  # noqa: SLF001
+        }
+        items[W.FRAME] = frame
+        items[W.FONT] = ctk.CTkFont(**self.font_props)
+        self.assign_font(items=items)
+        return items
+
+    def on_dual_preview(self) -> None:
+        """Show or hide the light and dark panes of the dual preview.
+
+        *   The panes are created on the first display and filled with the last
+            theme values. Hidden panes are not updated.
+        """
+        if not self.dual_switch.get():
+            for pane in self.panes.values():
+                pane[W.FRAME].grid_remove()
+            return
+        for column, mode in enumerate([M.LIGHT, M.DARK]):
+            if mode not in self.panes:
+                self.panes[mode] = self.create_pane(mode=mode)
+                self.panes[mode][W.FRAME].grid(
+                    row=8, column=column, padx=5, pady=10, sticky=ctk.N,
+                )
+            self.panes[mode][W.FRAME].grid()
+        self.on_disabled_sample()
+        for item_name, values in self.theme_values.items():
+            self.change_panes(item_name=item_name, values=values)
+
+    def get_targets(
+            self,
+            item_name: str,
+            items: SAMPLE_ITEM_TYPE | None = None,
+        ) -> list[ctk.CTkBaseClass]:
+        """Gets the widgets configured by a page of the theme.
+
+        Args:
+            item_name (str): Widget name.
+            items (SAMPLE_ITEM_TYPE | None): The sample widgets.
+                If ``None``, the widgets of this page.
+
+        Returns:
+            list[ctk.CTkBaseClass]: widgets. (Empty if there is no sample widget.)
+        """
+        items = self.sample_items if items is None else items
+        if item_name == W.TOPLEVEL:
+            if W.TOPLEVEL in items and items[W.TOPLEVEL].winfo_exists():
+                return [items[W.TOPLEVEL]]
+            return []
+        if item_name == W.DROPDOWNMENU:
+            return list(items[W.DROPDOWNMENU].values())
+        if item_name in items:
+            return [items[item_name]]
+        return []
+
+    def on_change_conf(
+            self,
+            item_name: str,
+            values: THEME_DATA_TYPE,
+            changed: set[str] | None = None,
+        ) -> None:
         """Change the widget configuration.
 
+            *   The widget properties are looked up by :func:`get_props`.
+            *   Only the properties that differ from the last applied values are
+                passed to ``configure()``, because each call redraws the widget.
+
         Args:
             item_name (str): Widget name.
             values (THEME_DATA_TYPE): Setting value.
+            changed (set[str] | None): The changed setting keys.
+                If ``None``, all keys are changed.
         """
-        if item_name == W.CTK:
-            self.sample_items[item_name].configure(fg_color=values[S.FG_COLOR])
-        elif item_name == W.TOPLEVEL:
-            if (W.TOPLEVEL in self.sample_items
-            and self.sample_items[W.TOPLEVEL].winfo_exists()
-            ):
-                self.sample_items[item_name].configure(fg_color=values[S.FG_COLOR])
-        elif item_name == W.BUTTON:
-            self.sample_items[item_name].configure(
-                border_color=values[S.BORDER_COLOR],
-                border_width=values[S.BORDER_WIDTH],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                hover_color=values[S.HOVER_COLOR],
-                text_color=values[S.TEXT_COLOR],
-                text_color_disabled=values[S.TEXT_COLOR_DISABLED],
-            )
-        elif item_name == W.RADIOBUTTON:
-            self.sample_items[item_name].configure(
-                border_color=values[S.BORDER_COLOR],
-                border_width_checked=values[S.BORDER_WIDTH_CHECKED],
-                border_width_unchecked=values[S.BORDER_WIDTH_UNCHECKED],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                hover_color=values[S.HOVER_COLOR],
-                text_color=values[S.TEXT_COLOR],
-                text_color_disabled=values[S.TEXT_COLOR_DISABLED],
-            )
-        elif item_name == W.SEGMENTEDBUTTON:
-            self.sample_items[item_name].configure(
-                border_width=values[S.BORDER_WIDTH],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                selected_color=values[S.SELECTED_COLOR],
-                selected_hover_color=values[S.SELECTED_HOVER_COLOR],
-                text_color=values[S.TEXT_COLOR],
-                text_color_disabled=values[S.TEXT_COLOR_DISABLED],
-                unselected_color=values[S.UNSELECTED_COLOR],
-                unselected_hover_color=values[S.UNSELECTED_HOVER_COLOR],
-            )
-        elif item_name == W.ENTRY:
-            self.sample_items[item_name].configure(
-                border_color=values[S.BORDER_COLOR],
-                border_width=values[S.BORDER_WIDTH],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                placeholder_text_color=values[S.PLACEHOLDER_TEXT_COLOR],
-                text_color=values[S.TEXT_COLOR],
-            )
-        elif item_name == W.LABEL:
-            self.sample_items[item_name].configure(
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                text_color=values[S.TEXT_COLOR],
-            )
-        elif item_name == W.CHECKBOX:
-            self.sample_items[item_name].configure(
-                border_color=values[S.BORDER_COLOR],
-                border_width=values[S.BORDER_WIDTH],
-                checkmark_color=values[S.CHECKMARK_COLOR],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                hover_color=values[S.HOVER_COLOR],
-                text_color=values[S.TEXT_COLOR],
-                text_color_disabled=values[S.TEXT_COLOR_DISABLED],
-            )
-        elif item_name == W.SWITCH:
-            self.sample_items[item_name].configure(
-                border_width=values[S.BORDER_WIDTH],
-                button_color=values[S.BUTTON_COLOR],
-                button_hover_color=values[S.BUTTON_HOVER_COLOR],
-                button_length=values[S.BUTTON_LENGTH],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                progress_color=values[S.PROGRESS_COLOR],
-                text_color=values[S.TEXT_COLOR],
-                text_color_disabled=values[S.TEXT_COLOR_DISABLED],
-            )
-        elif item_name == W.PROGRESSBAR:
-            self.sample_items[item_name].configure(
-                border_color=values[S.BORDER_COLOR],
-                border_width=values[S.BORDER_WIDTH],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                progress_color=values[S.PROGRESS_COLOR],
-            )
-        elif item_name == W.SLIDER:
-            self.sample_items[item_name].configure(
-                border_width=values[S.BORDER_WIDTH],
-                button_color=values[S.BUTTON_COLOR],
-                button_corner_radius=values[S.BUTTON_CORNER_RADIUS],
-                button_hover_color=values[S.BUTTON_HOVER_COLOR],
-                button_length=values[S.BUTTON_LENGTH],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                progress_color=values[S.PROGRESS_COLOR],
-            )
-        elif item_name == W.OPTIONMENU:
-            self.sample_items[item_name].configure(
-                button_color=values[S.BUTTON_COLOR],
-                button_hover_color=values[S.BUTTON_HOVER_COLOR],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                text_color=values[S.TEXT_COLOR],
-                text_color_disabled=values[S.TEXT_COLOR_DISABLED],
-            )
-        elif item_name == W.COMBOBOX:
-            self.sample_items[item_name].configure(
-                border_color=values[S.BORDER_COLOR],
-                border_width=values[S.BORDER_WIDTH],
-                button_color=values[S.BUTTON_COLOR],
-                button_hover_color=values[S.BUTTON_HOVER_COLOR],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                text_color=values[S.TEXT_COLOR],
-                text_color_disabled=values[S.TEXT_COLOR_DISABLED],
-            )
-        elif item_name == W.TEXTBOX:
-            self.sample_items[item_name].configure(
-                border_color=values[S.BORDER_COLOR],
-                border_width=values[S.BORDER_WIDTH],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                scrollbar_button_color=values[S.SCROLLBAR_BUTTON_COLOR],
-                scrollbar_button_hover_color=values[S.SCROLLBAR_BUTTON_HOVER_COLOR],
-                text_color=values[S.TEXT_COLOR],
-            )
-        elif item_name == W.DROPDOWNMENU:
-            self.sample_items[item_name][W.OPTIONMENU].configure(
-                fg_color=values[S.FG_COLOR],
-                hover_color=values[S.HOVER_COLOR],
-                text_color=values[S.TEXT_COLOR],
-            )
-            self.sample_items[item_name][W.COMBOBOX].configure(
-                fg_color=values[S.FG_COLOR],
-                hover_color=values[S.HOVER_COLOR],
-                text_color=values[S.TEXT_COLOR],
-            )
-        elif item_name == W.FRAME:
-            # [Attention]
-            # When the parent's fg_color and its own fg_color are the same,
-            # top_fg_color is set instead of fg_color inside CustomTkinter.
-            self.sample_items[item_name].configure(
-                border_color=values[S.BORDER_COLOR],
-                border_width=values[S.BORDER_WIDTH],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-                # top_fg_color=values['top_fg_color'],
-            )
-        elif item_name == W.SCROLLBAR:
-            self.sample_items[item_name].configure(
-                border_spacing=values[S.BORDER_SPACING],
-                button_color=values[S.BUTTON_COLOR],
-                button_hover_color=values[S.BUTTON_HOVER_COLOR],
-                corner_radius=values[S.CORNER_RADIUS],
-                fg_color=values[S.FG_COLOR],
-            )
-        elif item_name == W.SCROLLABLEFRAME:
-            self.sample_items[item_name].configure(
-                label_fg_color=values[S.LABEL_FG_COLOR],
-            )
-        elif item_name == W.FONT:
-            os_name = platform.system() if platform.system() != 'Drawin' else 'macOS'
-            font = ctk.CTkFont(
-                family=values[os_name][S.FAMILY],
-                size=values[os_name][S.SIZE],
-                weight=values[os_name][S.WEIGHT],
-            )
-            for key, item in self.sample_items.items():
-                if W.DROPDOWNMENU in key:
-                    item[W.OPTIONMENU].configure(font=font)
-                    item[W.COMBOBOX].configure(font=font)
-                elif all(k not in key for k in self._condtion[C.FONT]):
-                    item.configure(font=font)
+        self.theme_values[item_name] = values
+        if item_name == W.FONT:
+            self.change_font(values=values)
+            return
+        kwargs = get_props(item_name=item_name, values=values, changed=changed)
+        for item in self.get_targets(item_name=item_name):
+            self.configure_item(item=item, kwargs=kwargs)
+        if self.dual_switch.get():
+            self.change_panes(item_name=item_name, values=values, changed=changed)
+
+    def change_panes(
+            self,
+            item_name: str,
+            values: THEME_DATA_TYPE,
+            changed: set[str] | None = None,
+        ) -> None:
+        """Change the widget configuration of the dual preview.
+
+            *   The [light, dark] values are resolved for each pane.
+
+        Args:
+            item_name (str): Widget name.
+            values (THEME_DATA_TYPE): Setting value.
+            changed (set[str] | None): The changed setting keys.
+                If ``None``, all keys are changed.
+        """
+        kwargs = get_props(item_name=item_name, values=values, changed=changed)
+        for mode, pane in self.panes.items():
+            resolved = resolve_props(kwargs=kwargs, mode=mode)
+            for item in self.get_targets(item_name=item_name, items=pane):
+                self.configure_item(item=item, kwargs=resolved)
+
+    def on_begin_batch(self) -> None:
+        """Start collecting the widget properties until the batch is committed.
+        """
+        self.batch_items = {}
+        self.batch_font = None
+
+    def on_commit_batch(self) -> None:
+        """Apply the collected widget properties in one pass.
+
+        *   The pending redraws are processed by one ``update_idletasks()``.
+        """
+        items, self.batch_items = self.batch_items or {}, None
+        font, self.batch_font = self.batch_font, None
+        for item, kwargs in items.items():
+            if item.winfo_exists():
+                self.configure_item(item=item, kwargs=kwargs)
+        if font is not None:
+            self.configure_font(kwargs=font)
+        self.update_idletasks()
+        self.configure_stats.batches += 1
+        LOGGER.debug(
+            'len(items)=%d, self.configure_stats=%r',
+            len(items),
+            self.configure_stats,
+        )
+
+    def configure_item(self, item: ctk.CTkBaseClass, kwargs: dict[str, Any]) -> None:
+        """Configure a widget with the properties that are not applied yet.
+
+            *   In a batch, the properties are collected and applied on commit.
+
+        Args:
+            item (ctk.CTkBaseClass): widget.
+            kwargs (dict[str, Any]): The properties to apply.
+        """
+        if self.batch_items is not None:
+            self.batch_items.setdefault(item, {}).update(kwargs)
+            return
+        applied = self.applied.setdefault(item, {})
+        diff = diff_props(applied=applied, values=kwargs)
+        self.configure_stats.skipped_props += len(kwargs) - len(diff)
+        if not diff:
+            self.configure_stats.skipped += 1
+            return
+        item.configure(**diff)
+        applied.update(diff)
+        self.configure_stats.called += 1
+        self.configure_stats.applied_props += len(diff)
+
+    def change_font(self, values: THEME_DATA_TYPE) -> None:
+        """Change the font of the widgets.
+
+            *   The settings of this OS are read by :func:`get_font_props`, and
+                nothing is done if they are missing or invalid.
+
+        Args:
+            values (THEME_DATA_TYPE): Setting value.
+        """
+        kwargs = get_font_props(values=values)
+        if kwargs is not None:
+            self.configure_font(kwargs=kwargs)
+
+    def configure_font(self, kwargs: dict[str, Any]) -> None:
+        """Configure the fonts of all panes with the properties not applied yet.
+
+            *   The fonts are updated in place, so the widgets are not configured.
+            *   In a batch, the properties are collected and applied on commit.
+
+        Args:
+            kwargs (dict[str, Any]): The properties to apply. (family, size, weight)
+        """
+        if self.batch_items is not None:
+            self.batch_font = kwargs
+            return
+        diff = diff_props(applied=self.font_props, values=kwargs)
+        self.configure_stats.skipped_props += len(kwargs) - len(diff)
+        if not diff:
+            self.configure_stats.skipped += 1
+            return
+        for items in [self.sample_items, *self.panes.values()]:
+            items[W.FONT].configure(**diff)
+        self.font_props.update(diff)
+        self.configure_stats.called += 1
+        self.configure_stats.applied_props += len(diff)
+
+    def assign_font(self, items: SAMPLE_ITEM_TYPE) -> None:
+        """Assign the font of a pane to its sample widgets.
+
+            *   It is called once when the pane is built.
+
+        Args:
+            items (SAMPLE_ITEM_TYPE): The sample widgets.
+        """
+        font = items[W.FONT]
+        for name, item in items.items():
+            if W.DROPDOWNMENU in name:
+                item[W.OPTIONMENU].configure(font=font)
+                item[W.COMBOBOX].configure(font=font)
+            elif all(k not in name for k in self._condtion[C.FONT]):
+                item.configure(font=font)
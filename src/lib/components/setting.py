@@ -1,45 +1,241 @@
 """This is the module that defines Setting page class.
 """
 
-import enum
+import math
+import sys
+import tkinter as tk
 from collections.abc import Callable
 from logging import getLogger
+from typing import Any, override
 
 import customtkinter as ctk
 
+from lib.common.schema import Kind, compile_page, split_value
+from lib.common.schema import Mode as M
 from lib.common.types import THEME_DATA_TYPE, ParamLog
 from lib.common.types import EventName as E
-from lib.components.base import BasePage, EventBus
+from lib.components.base import BasePage, EventBus, PageContext
 
 PARAM_LOG = ParamLog()
 LOGGER = getLogger(PARAM_LOG.NAME)
 
 ENTRY_ITEM_TYPE = dict[str, ctk.CTkEntry | list[ctk.CTkEntry] | dict[str, ctk.CTkEntry]]
+#: The row of the virtualized list. (key label, item label, var name, var name)
+ROW_TYPE = tuple[str, str, str | None, str | None]
+#: str: The border color of ctk.CTkEntry with an invalid value.
+INVALID_BORDER_COLOR = '#E04040'
+#: str: The text color of the key label of a setting with low contrast.
+LOW_CONTRAST_TEXT_COLOR = '#E08000'
 
 
-class M(enum.StrEnum):
-    """Defines the mode identifier (light/dark).
+def merge_change_conf(
+        old: dict[str, Any],
+        new: dict[str, Any],
+    ) -> dict[str, Any]:
+    """Merges the keyword arguments of two pending ``CHANGE_CONF`` events.
+
+        *   ``values`` is the cached data of the page, so the latest one is used.
+        *   ``changed`` is the union of the changed keys. (``None`` means all keys.)
+
+    Args:
+        old (dict[str, Any]): The keyword arguments of the pending event.
+        new (dict[str, Any]): The keyword arguments of the new event.
+
+    Returns:
+        dict[str, Any]: The merged keyword arguments.
     """
-    LIGHT = enum.auto()
-    DARK = enum.auto()
+    changed = None
+    if old.get('changed') is not None and new.get('changed') is not None:
+        changed = old['changed'] | new['changed']
+    return {**new, 'changed': changed}
+
 
+def is_reusable(kind: Kind, modes: list[str], val: Any) -> bool:
+    """Returns whether the ctk.CTkEntry of a setting can be reused for a value.
 
-class C(enum.StrEnum):
-    """Defines the condition identifier.
+        *   'color' and 'number' settings are always reusable.
+        *   'font' settings are reusable if the items (e.g., 'family') match.
+
+    Args:
+        kind (Kind): The kind of the setting.
+        modes (list[str]): The modes of the ctk.StringVar of the setting.
+        val (Any): Setting Value.
+
+    Returns:
+        bool: ``True`` if it is reusable.
     """
-    COLOR = enum.auto()
-    NUMBER = enum.auto()
-    FONT = enum.auto()
+    if kind == Kind.FONT:
+        return isinstance(val, dict) and list(val) == modes
+    return True
+
+
+class RowPool:
+    """Defines the recycled row widgets of a virtualized settings page.
+
+    *   Only the visible rows (plus a small buffer) are built, and the row widgets
+        are bound to the ctk.StringVar of the visible rows while scrolling.
+
+    Args:
+        page (SettingPage): :class:`SettingPage` class that the row widgets are built
+            in.
+    """
+    #: int: The height of a row. (px)
+    row_height = 38
+    #: int: The number of rows built in addition to the visible rows.
+    buffer_rows = 2
+
+    def __init__(self, page: 'SettingPage') -> None:
+        self.page = page
+        self.rows: list[ROW_TYPE] = []
+        self.items: list[dict[str, ctk.CTkLabel | ctk.CTkEntry]] = []
+        self.first_row = 0
+        self.scrollbar = ctk.CTkScrollbar(master=page, command=self.on_scroll)
+
+    def get_rows(self) -> list[ROW_TYPE]:
+        """Gets the rows of the virtualized list from the settings of the page.
+
+            *   'color': (key, '', light mode var, dark mode var)
+            *   'number': (key, '', var, None)
+            *   'font': (key or '', item, None, var) for each item
+
+        Returns:
+            list[ROW_TYPE]: rows.
+        """
+        page = self.page
+        rows: list[ROW_TYPE] = []
+        for key, modes in page.var_modes.items():
+            kind = page.schema.get(key=key).kind
+            names = [page.get_var_name(key=key, mode=mode) for mode in modes]
+            if kind == Kind.COLOR:
+                rows.append((key, '', names[0], names[1]))
+            elif kind == Kind.NUMBER:
+                rows.append((key, '', names[0], None))
+            else:
+                rows.extend(
+                    (key if i == 0 else '', mode, None, name)
+                    for i, (mode, name) in enumerate(zip(modes, names))
+                )
+        return rows
+
+    def update(self) -> None:
+        """Rebuilds the rows from the settings of the page and renders them.
+        """
+        self.rows = self.get_rows()
+        self.render()
+
+    def create(self, size: int) -> None:
+        """Creates the row widgets up to a size.
+
+        Args:
+            size (int): The number of row widgets.
+        """
+        for row in range(len(self.items), size):
+            items: dict[str, ctk.CTkLabel | ctk.CTkEntry] = {
+                'key': ctk.CTkLabel(
+                    master=self.page, text='', width=180, anchor=ctk.W,
+                ),
+                'item': ctk.CTkLabel(
+                    master=self.page, text='', width=120, anchor=ctk.W,
+                ),
+                'entry1': ctk.CTkEntry(master=self.page, width=120),
+                'entry2': ctk.CTkEntry(master=self.page, width=120),
+            }
+            items['key'].grid(row=row, column=0, padx=10, pady=5)
+            items['item'].grid(row=row, column=1, padx=10, pady=5)
+            items['entry1'].grid(row=row, column=1, padx=10)
+            items['entry2'].grid(row=row, column=2, padx=10)
+            self.items.append(items)
+        self.scrollbar.grid(row=0, column=3, rowspan=max(size, 1), sticky=ctk.NS)
+
+    def render(self) -> None:
+        """Binds the row widgets to the visible rows.
+        """
+        page = self.page
+        size = len(self.items)
+        self.first_row = max(0, min(self.first_row, len(self.rows) - size))
+        for i, items in enumerate(self.items):
+            index = self.first_row + i
+            if index >= len(self.rows):
+                for item in items.values():
+                    item.grid_remove()
+                continue
+            key, item, name1, name2 = self.rows[index]
+            page.configure_key_label(label=items['key'], key=key)
+            items['key'].grid()
+            if name1 is None:
+                items['item'].configure(text=item)
+                items['item'].grid()
+                items['entry1'].grid_remove()
+            else:
+                items['entry1'].configure(
+                    textvariable=page.str_vars[name1],
+                    border_color=page.get_border_color(name=name1),
+                )
+                items['entry1'].grid()
+                items['item'].grid_remove()
+            if name2 is None:
+                items['entry2'].grid_remove()
+            else:
+                items['entry2'].configure(
+                    textvariable=page.str_vars[name2],
+                    border_color=page.get_border_color(name=name2),
+                )
+                items['entry2'].grid()
+        if self.rows:
+            self.scrollbar.set(
+                self.first_row / len(self.rows),
+                min(self.first_row + size, len(self.rows)) / len(self.rows),
+            )
+
+    def scroll(self, first_row: int) -> None:
+        """Scrolls the virtualized list.
+
+        Args:
+            first_row (int): The index of the first visible row.
+        """
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self.render()
+
+    def on_scroll(self, *args: str) -> None:
+        """Scrolls the virtualized list by the scrollbar.
+
+        *   ('moveto', fraction) or ('scroll', number, 'units' | 'pages')
+        """
+        if args[0] == tk.MOVETO:
+            self.scroll(first_row=round(float(args[1]) * len(self.rows)))
+        elif args[0] == tk.SCROLL:
+            step = len(self.items) if args[2] == tk.PAGES else 1
+            self.scroll(first_row=self.first_row + int(args[1]) * step)
+
+    def on_resize(self, event: tk.Event) -> None:
+        """Builds the row widgets to fill the visible height.
+
+        Args:
+            event (tk.Event): ``<Configure>`` event.
+        """
+        size = math.ceil(event.height / self.row_height) + self.buffer_rows
+        if size > len(self.items):
+            self.create(size=size)
+            self.render()
 
 
 class SettingPage(BasePage):
     """Defines the Setting page.
 
+    *   The ctk.StringVar of each setting is the data model of the page.
+    *   If the number of rows is larger than ``virtual_rows``, the page is a
+        virtualized list. Only the visible rows (plus a small buffer) are built, and
+        the row widgets are recycled while scrolling.
+
     Args:
         master (ctk.CTk): parent widget class.
         event_bus (EventBus): :class:`EventBus` class.
         page_name (str): page name.
         values (THEME_DATA_TYPE): CustomTkinter theme data.
+        context (PageContext | None): :class:`PageContext` class.
+            Without a color resolver, the colors are not checked. Without a contrast
+            auditor, the contrast is not audited.
     """
     def __init__(
             self,
@@ -47,12 +243,30 @@ class SettingPage(BasePage):
             event_bus: EventBus,
             page_name: str,
             values: THEME_DATA_TYPE,
+            context: PageContext | None = None,
             **kwargs,
         ) -> None:
+        context = context if context is not None else PageContext()
         # [Attention]
         # self.master is used by the parent class CustomTkinter.
         self._master = master
         self.page_name = page_name
+        # [Attention]
+        # The setting keys are classified once per page shape. (See compile_page)
+        self.schema = compile_page(page_name=page_name, keys=tuple(values))
+        self.theme_store = context.theme_store
+        self.color_resolver = context.color_resolver
+        # [Attention]
+        # invalid_vars is the names of the ctk.StringVar with an invalid color.
+        # Their values are not sent to the sample page.
+        self.invalid_vars: set[str] = set()
+        self.border_color = ctk.ThemeManager.theme['CTkEntry']['border_color']
+        # [Attention]
+        # contrast_ratios[key] is the lowest contrast ratio of the text color key
+        # that fails the audit. It is shown on the key label.
+        self.contrast_auditor = context.contrast_auditor
+        self.contrast_ratios: dict[str, float] = {}
+        self.label_color = ctk.ThemeManager.theme['CTkLabel']['text_color']
 
         super().__init__(
             master=master,
@@ -63,46 +277,70 @@ class SettingPage(BasePage):
 
         self.grid_columnconfigure(index=(0, 1, 2), weight=1)
 
-        self._condtions = {
-            C.COLOR: 'color',
-            C.NUMBER: ['corner_radius', 'width', 'length', 'spacing'],
-            C.FONT: ['macOS', 'Windows', 'Linux'],
-        }
-
         self.entry_items: ENTRY_ITEM_TYPE = {}
+        # [Attention]
+        # label_items[key][0] is the label of the key, and the rest are the labels of
+        # the 'font' settings in the order of entry_items[key].
+        self.label_items: dict[str, list[ctk.CTkLabel]] = {}
+        self.str_vars: dict[str, ctk.StringVar] = {}
+        # [Attention]
+        # var_modes[key] is the modes of the ctk.StringVar of the key.
+        # (e.g., ['light', 'dark'])
+        self.var_modes: dict[str, list[str]] = {}
+
+        num_rows = sum(
+            len(val) if isinstance(val, dict) else 1 for val in values.values()
+        )
+        self.virtual = 0 < context.virtual_rows < num_rows
+        self.row_pool = RowPool(page=self) if self.virtual else None
 
         row = 0
         for key, val in values.items():
-            ctk.CTkLabel(
-                master=self,
-                text=key,
-                width=180,
-                anchor=ctk.W,
-            ).grid(row=row, column=0, padx=10, pady=5)
-
-            if self._condtions[C.COLOR] in key:
-                row = self.create_entry_color(key=key, val=val, row=row)
-            elif any(k in key for k in self._condtions[C.NUMBER]):
-                row = self.create_entry_number(key=key, val=val, row=row)
-            elif key in self._condtions[C.FONT]:
-                row = self.create_entry_font(key=key, val=val, row=row)
-            else:
-                LOGGER.error(f'[key] is wrong. {key=}')
-                raise ValueError
+            row = self.create_entry(key=key, val=val, row=row)
+
+        if self.row_pool is not None:
+            self._parent_frame.bind(
+                sequence='<Configure>',
+                command=self.row_pool.on_resize,
+                add=True,
+            )
+            self.regrid()
+
+        self.data: THEME_DATA_TYPE = {}
+        for key in self.var_modes:
+            self.update_data(key=key)
+        self.check_contrast()
 
         self.event_bus.emit(
             event_name=E.CHANGE_CONF,
             item_name=page_name,
-            values=self.get_data(),
+            values=self.data,
+            changed=None,
         )
 
+    @override
     def register_events(self) -> dict[str, Callable]:
         """Returns a list of events to subscribe to.
 
+            *   The page does not subscribe to any events, but it is required by
+                :class:`lib.components.base.BaseComponent`.
+
         Returns:
             dict[str, Callable]: events list to register. (key: event name, val: func)
         """
-        return {E.GET_DATA: self.on_get_data}
+        return {}
+
+    def destroy(self) -> None:
+        """Remove the traces of all ctk.StringVar and destroy the page.
+
+        *   The trace callbacks refer to this page, so the page would never be
+            released without removing them.
+        """
+        for str_var in self.str_vars.values():
+            for mode, cbname in str_var.trace_info():
+                str_var.trace_remove(mode=mode, cbname=cbname)
+        self.str_vars = {}
+        super().destroy()
 
     def unset_global_var(self, name: str) -> None:
         """Unsets a variable set inside Tkinter.
@@ -115,7 +353,11 @@ class SettingPage(BasePage):
         try:
             self._master.globalunsetvar(name)
         except ctk.ctk_tk.tkinter.TclError:
-            LOGGER.debug(f'{self._master=} does not have StringVar ({name=}).')
+            LOGGER.debug(
+                'self._master=%r does not have StringVar (name=%r).',
+                self._master,
+                name,
+            )
 
     def create_str_var(self, name: str, value: str) -> ctk.StringVar:
         """Creates a ctk.StringVar.
@@ -128,10 +370,194 @@ class SettingPage(BasePage):
             ctk.StringVar: ctk.StringVar.
         """
         self.unset_global_var(name=name)
-        str_var = ctk.StringVar(value=value, name=name)
+        str_var = ctk.StringVar(value=value, name=name)  # type: ignore[arg-type]
         str_var.trace_add(mode='write', callback=self.on_trace_var)
+        self.str_vars[name] = str_var
         return str_var
 
+    def get_var_name(self, key: str, mode: str) -> str:
+        """Gets the name of the ctk.StringVar of a setting.
+
+        Args:
+            key (str): setting key.
+            mode (str): mode. (e.g., 'light', 'none', 'family')
+
+        Returns:
+            str: "{page name}-{key}-{mode}"
+        """
+        return f'{self.page_name}-{key}-{mode}'
+
+    def _mouse_wheel_all(self, event: tk.Event) -> None:
+        """Scrolls the virtualized list by the mouse wheel.
+
+            *   Overrides the handler of ctk.CTkScrollableFrame, which does not scroll
+                because the row widgets fit in the visible height.
+
+        Args:
+            event (tk.Event): mouse wheel event.
+        """
+        if self.row_pool is None:
+            super()._mouse_wheel_all(event)
+            return
+        if not self._check_if_valid_scroll(event.widget):
+            return
+        if sys.platform.startswith('win'):
+            step = -int(event.delta / 120)
+        elif sys.platform == 'darwin':
+            step = -event.delta
+        else:
+            step = -1 if event.num == 4 else 1  # noqa: PLR2004
+        self.row_pool.scroll(first_row=self.row_pool.first_row + step)
+
+    def create_entry(self, key: str, val: Any, row: int) -> int:
+        """Creates a label and ctk.CTkEntry for a setting.
+
+        Args:
+            key (str): setting key.
+            val (Any): Setting Value.
+            row (int): The number of row.
+
+        Returns:
+            int: The number of row.
+        """
+        kind = self.schema.get(key=key).kind
+        raw = split_value(kind=kind, val=val)
+        self.var_modes[key] = list(raw)
+        if self.virtual:
+            # [Attention]
+            # In the virtualized list, only ctk.StringVar is created here and the row
+            # widgets are bound to it by RowPool.render.
+            for mode, value in raw.items():
+                self.create_str_var(
+                    name=self.get_var_name(key=key, mode=mode),
+                    value=value,
+                )
+            return row
+
+        label = ctk.CTkLabel(
+            master=self,
+            text=key,
+            width=180,
+            anchor=ctk.W,
+        )
+        label.grid(row=row, column=0, padx=10, pady=5)
+        self.label_items[key] = [label]
+
+        if kind == Kind.COLOR:
+            row = self.create_entry_color(key=key, val=val, row=row)
+        elif kind == Kind.NUMBER:
+            row = self.create_entry_number(key=key, val=val, row=row)
+        else:
+            row = self.create_entry_font(key=key, val=val, row=row)
+        return row
+
+    def delete_entry(self, key: str) -> None:
+        """Deletes the label, ctk.CTkEntry and ctk.StringVar of a setting.
+
+        Args:
+            key (str): setting key.
+        """
+        items = self.entry_items.pop(key, {})
+        for entry in items.values() if isinstance(items, dict) else [items]:
+            entry.destroy()
+        for label in self.label_items.pop(key, []):
+            label.destroy()
+        for mode in self.var_modes.pop(key):
+            name = self.get_var_name(key=key, mode=mode)
+            str_var = self.str_vars.pop(name)
+            self.invalid_vars.discard(name)
+            for modes, cbname in str_var.trace_info():
+                str_var.trace_remove(mode=modes, cbname=cbname)
+        self.data.pop(key, None)
+
+    def set_value(self, key: str, val: Any) -> None:
+        """Sets a value to the ctk.StringVar of a setting.
+
+            *   Only the changed ctk.StringVar is set, so only its trace callback runs.
+
+        Args:
+            key (str): setting key.
+            val (Any): Setting Value.
+        """
+        kind = self.schema.get(key=key).kind
+        for mode, value in split_value(kind=kind, val=val).items():
+            str_var = self.str_vars[self.get_var_name(key=key, mode=mode)]
+            value = '' if value is None else str(value)  # noqa: PLW2901
+            if str_var.get() != value:
+                str_var.set(value=value)
+
+    def reconcile(self, values: THEME_DATA_TYPE) -> int:
+        """Reconciles the page with new theme data.
+
+            *   Reusable settings keep their widgets and only the values are set.
+            *   Other settings are deleted or created, and the rows are re-gridded
+                only if the layout changed.
+
+        Args:
+            values (THEME_DATA_TYPE): CustomTkinter theme data.
+
+        Returns:
+            int: The number of reused settings.
+        """
+        self.schema = compile_page(page_name=self.page_name, keys=tuple(values))
+        for key in list(self.var_modes):
+            if key not in values or not is_reusable(
+                kind=self.schema.get(key=key).kind,
+                modes=self.var_modes[key],
+                val=values[key],
+            ):
+                self.delete_entry(key=key)
+
+        reused = 0
+        row = self.grid_size()[1]
+        for key, val in values.items():
+            if key in self.var_modes:
+                self.set_value(key=key, val=val)
+                reused += 1
+            else:
+                row = self.create_entry(key=key, val=val, row=row)
+                self.update_data(key=key)
+        self.check_contrast()
+
+        if list(self.var_modes) != list(values) or reused != len(values):
+            self.var_modes = {key: self.var_modes[key] for key in values}
+            if not self.virtual:
+                self.entry_items = {key: self.entry_items[key] for key in values}
+            self.data = {key: self.data[key] for key in values if key in self.data}
+            self.regrid()
+            self.event_bus.emit(
+                event_name=E.CHANGE_CONF,
+                item_name=self.page_name,
+                values=self.data,
+                changed=None,
+            )
+        return reused
+
+    def regrid(self) -> None:
+        """Re-grids the labels and ctk.CTkEntry in the order of the settings.
+
+        *   In the virtualized list, the rows are rebuilt and rendered instead.
+        """
+        if self.row_pool is not None:
+            self.row_pool.update()
+            return
+        row = 0
+        for key, items in self.entry_items.items():
+            labels = self.label_items[key]
+            labels[0].grid(row=row, column=0, padx=10, pady=5)
+            if isinstance(items, ctk.CTkEntry):
+                items.grid(row=row, column=1, padx=10)
+                row += 1
+            elif self.schema.get(key=key).kind == Kind.FONT:
+                for label, entry in zip(labels[1:], items.values()):
+                    label.grid(row=row, column=1, padx=10, pady=5)
+                    entry.grid(row=row, column=2, padx=10)
+                    row += 1
+            else:
+                items[M.LIGHT].grid(row=row, column=1, padx=10)
+                items[M.DARK].grid(row=row, column=2, padx=10)
+                row += 1
+
     def create_entry_color(self, key: str, val: str | list[str], row: int) -> int:
         """Creates a ctk.CTkEntry that sets 'color'.
 
@@ -146,20 +572,14 @@ class SettingPage(BasePage):
         Returns:
             int: The number of row.
         """
-        if isinstance(val, list):
-            values = {M.LIGHT: val[0], M.DARK: val[1]}
-        elif isinstance(val, str):
-            values = {M.LIGHT: val, M.DARK: None}
-        else:
-            LOGGER.error(f'[val] must be str or list[str, str]. {key=}, {val=}')
-            raise TypeError
+        values = split_value(kind=Kind.COLOR, val=val)
 
         self.entry_items[key] = {
             M.LIGHT: ctk.CTkEntry(
                 master=self,
                 width=120,
                 textvariable=self.create_str_var(
-                    name=f'{self.page_name}-{key}-{M.LIGHT}',
+                    name=self.get_var_name(key=key, mode=M.LIGHT),
                     value=values[M.LIGHT],
                 ),
             ),
@@ -167,7 +587,7 @@ class SettingPage(BasePage):
                 master=self,
                 width=120,
                 textvariable=self.create_str_var(
-                    name=f'{self.page_name}-{key}-{M.DARK}',
+                    name=self.get_var_name(key=key, mode=M.DARK),
                     value=values[M.DARK],
                 ),
             ),
@@ -199,7 +619,7 @@ class SettingPage(BasePage):
             master=self,
             width=120,
             textvariable=self.create_str_var(
-                name=f'{self.page_name}-{key}-none',
+                name=self.get_var_name(key=key, mode=M.NONE),
                 value=val,
             ),
         )
@@ -227,18 +647,20 @@ class SettingPage(BasePage):
         """
         self.entry_items[key] = {}
         for k, v in val.items():
-            ctk.CTkLabel(
+            label = ctk.CTkLabel(
                 master=self,
                 text=k,
                 width=120,
                 anchor=ctk.W,
-            ).grid(row=row, column=1, padx=10, pady=5)
+            )
+            label.grid(row=row, column=1, padx=10, pady=5)
+            self.label_items[key].append(label)
 
             self.entry_items[key][k] = ctk.CTkEntry(
                 master=self,
                 width=120,
                 textvariable=self.create_str_var(
-                    name=f'{self.page_name}-{key}-{k}',
+                    name=self.get_var_name(key=key, mode=k),
                     value=v,
                 ),
             )
@@ -246,54 +668,152 @@ class SettingPage(BasePage):
             row += 1
         return row
 
-    def get_data(self) -> THEME_DATA_TYPE:
-        """Gets the setting values of all ctk.CTkEntry in the page.
+    def get_border_color(self, name: str) -> str | list[str]:
+        """Gets the border color of the ctk.CTkEntry of a ctk.StringVar.
+
+        Args:
+            name (str): string variable name.
 
         Returns:
-            THEME_DATA_TYPE: setting values.
+            str | list[str]: border color.
         """
-        data = {}
-        for key, val in self.entry_items.items():
-            if self._condtions[C.COLOR] in key:
-                data[key] = [val[M.LIGHT].get(), val[M.DARK].get()]
-                if not data[key][0] or not data[key][1]:
-                    data[key] = data[key][0] or data[key][1]
-                if data[key][0] == data[key][1]:
-                    data[key] = data[key][0]
-            elif any(k in key for k in self._condtions[C.NUMBER]):
-                try:
-                    data[key] = int(val.get())
-                except ValueError:
-                    LOGGER.exception(f'{val=} must be number. ({key=})')
-            elif any(k in key for k in self._condtions[C.FONT]):
-                data[key] = {}
-                for k, v in val.items():
-                    try:
-                        data[key][k] = int(v.get())
-                    except ValueError:
-                        data[key][k] = str(v.get())
+        return INVALID_BORDER_COLOR if name in self.invalid_vars else self.border_color
+
+    def check_color(self, key: str) -> bool:
+        """Checks the colors of a 'color' setting and marks the invalid ones.
+
+            *   An empty value is valid. (It is the same as the other mode.)
+
+        Args:
+            key (str): setting key.
+
+        Returns:
+            bool: ``True`` if all colors are valid.
+        """
+        valid = True
+        for mode in self.var_modes[key]:
+            name = self.get_var_name(key=key, mode=mode)
+            value = self.str_vars[name].get()
+            invalid = bool(value) and not self.color_resolver.is_valid(name=value)
+            valid = valid and not invalid
+            if invalid == (name in self.invalid_vars):
+                continue
+            if invalid:
+                self.invalid_vars.add(name)
+            else:
+                self.invalid_vars.discard(name)
+            if self.row_pool is not None:
+                self.row_pool.render()
             else:
-                LOGGER.error(f'{key=} do not support.')
-                raise ValueError
-        return data
+                self.entry_items[key][mode].configure(
+                    border_color=self.get_border_color(name=name),
+                )
+        return valid
 
-    def on_trace_var(self, *args: tuple[str]) -> None:
-        """Watch for changes to setting values and change the widget configuration.
+    def configure_key_label(self, label: ctk.CTkLabel, key: str) -> None:
+        """Configures the key label of a setting.
+
+            *   If the setting has low contrast, the lowest ratio is shown.
+
+        Args:
+            label (ctk.CTkLabel): key label.
+            key (str): setting key.
         """
-        LOGGER.debug(f'{args=}')
-        item_name = args[0].split('-')[0]
+        ratio = self.contrast_ratios.get(key)
+        if ratio is None:
+            label.configure(text=key, text_color=self.label_color)
+        else:
+            label.configure(
+                text=f'{key} ({ratio:.1f}:1)',
+                text_color=LOW_CONTRAST_TEXT_COLOR,
+            )
 
-        self.event_bus.emit(
-            event_name=E.CHANGE_CONF,
-            item_name=item_name,
-            values=self.get_data(),
+    def check_contrast(self) -> None:
+        """Audits the contrast of the page and shows the failures on the key labels.
+
+        *   The transparent colors are audited on the window color of the theme
+            store.
+        *   The page writes its valid values to the theme store, so the store is
+            audited as it is. (Invalid colors are skipped by the audit.)
+        """
+        if self.contrast_auditor is None:
+            return
+        data = (
+            {self.page_name: self.data} if self.theme_store is None
+            else self.theme_store.pages
         )
+        issues = self.contrast_auditor.audit(data=data, page_names=[self.page_name])
+        ratios: dict[str, float] = {}
+        for issue in issues:
+            ratios[issue.key] = min(issue.ratio, ratios.get(issue.key, issue.ratio))
+        if ratios == self.contrast_ratios:
+            return
+        changed = {
+            key for key in ratios.keys() | self.contrast_ratios.keys()
+            if ratios.get(key) != self.contrast_ratios.get(key)
+        }
+        self.contrast_ratios = ratios
+        if self.row_pool is not None:
+            self.row_pool.render()
+            return
+        for key in changed:
+            if key in self.label_items:
+                self.configure_key_label(label=self.label_items[key][0], key=key)
+
+    def update_data(self, key: str) -> bool:
+        """Updates the cached setting value of a key.
+
+            *   The raw values of the ctk.StringVar are parsed by the parser of
+                :class:`lib.common.schema.PageSchema`.
+            *   The value is also written to the :class:`ThemeStore` class.
+            *   Invalid colors are rejected, so they are not sent to the sample page.
+
+        Args:
+            key (str): setting key.
+
+        Returns:
+            bool: ``True`` if the value is updated.
+        """
+        spec = self.schema.get(key=key)
+        if (
+            spec.kind == Kind.COLOR and self.color_resolver is not None
+            and not self.check_color(key=key)
+        ):
+            LOGGER.warning(f'The value must be a color. ({self.page_name=}, {key=})')
+            return False
+        raw = {
+            mode: self.str_vars[self.get_var_name(key=key, mode=mode)].get()
+            for mode in self.var_modes[key]
+        }
+        try:
+            self.data[key] = spec.parse(raw)
+        except ValueError:
+            LOGGER.exception(f'The value must be number. ({self.page_name=}, {key=})')
+            return False
+        if self.theme_store is not None:
+            self.theme_store.set_value(
+                page_name=self.page_name,
+                key=key,
+                val=self.data[key],
+            )
+        return True
 
-    def on_get_data(self) -> None:
-        """Get the setting value and send it to HomePage.
+    def on_trace_var(self, *args: tuple[str]) -> None:
+        """Watch for changes to setting values and change the widget configuration.
+
+        *   The ctk.StringVar name is "{page name}-{key}-{mode}", so only the
+            cached value of the changed key is updated.
         """
+        LOGGER.debug('args=%r', args)
+        _, key, _ = args[0].rsplit('-', 2)
+        if not self.update_data(key=key):
+            return
+        if self.schema.get(key=key).kind == Kind.COLOR:
+            self.check_contrast()
+
         self.event_bus.emit(
-            event_name=E.RECIEVE_DATA,
-            fm=self.page_name,
-            data=self.get_data(),
+            event_name=E.CHANGE_CONF,
+            item_name=self.page_name,
+            values=self.data,
+            changed={key},
         )
@@ -56,10 +56,17 @@ class SideBar(ctk.CTkFrame, BaseComponent):
         """
         return {
             E.DEL_ALL_BUTTON: self.on_del_all_button,
+            E.SYNC_BUTTON: self.on_sync_button,
             E.ADD_BUTTON: self.on_add_button,
             E.SHOW_PAGE: self.on_select_button,
         }
 
+    def destroy(self) -> None:
+        """Unsubscribe all events and destroy the sidebar.
+        """
+        self.unsubscribe_events()
+        super().destroy()
+
     def on_switch_mode(self) -> None:
         """Switch between light and dark mode.
         """
@@ -79,6 +86,56 @@ class SideBar(ctk.CTkFrame, BaseComponent):
                 self.sidebar_items[key].destroy()
                 del self.sidebar_items[key]
 
+    def on_sync_button(
+            self,
+            frame_name: SideBarFrameName,
+            page_names: list[str],
+        ) -> None:
+        """Reconcile the sidebar buttons of a frame with the page names.
+
+            *   Existing buttons are reused, and only the buttons of removed or added
+                pages are destroyed or created.
+            *   The buttons are re-gridded in the order of the page names.
+
+        Args:
+            frame_name (SideBarFrameName): The name of the frame to reconcile.
+            page_names (list[str]): The names of the buttons (corresponding to the page
+                names).
+        """
+        master = self.get_frame(frame_name=frame_name)
+        for key in list(self.sidebar_items):
+            if self.sidebar_items[key].master is master and key not in page_names:
+                if self.current_item is self.sidebar_items[key]:
+                    self.current_item = None
+                self.sidebar_items[key].destroy()
+                del self.sidebar_items[key]
+
+        reused = 0
+        for index, page_name in enumerate(page_names):
+            if page_name in self.sidebar_items:
+                self.sidebar_items[page_name].grid(row=index, column=0, sticky=ctk.EW)
+                reused += 1
+            else:
+                self.on_add_button(frame_name=frame_name, page_name=page_name)
+                self.sidebar_items[page_name].grid(row=index, column=0, sticky=ctk.EW)
+        LOGGER.info(f'Reused sidebar buttons: {reused}/{len(page_names)}')
+
+    def get_frame(self, frame_name: SideBarFrameName) -> ctk.CTkFrame:
+        """Gets the frame of the sidebar.
+
+        Args:
+            frame_name (SideBarFrameName): The name of the frame.
+
+        Returns:
+            ctk.CTkFrame: frame.
+        """
+        if frame_name == SideBarFrameName.HEADER:
+            return self.header_frame
+        if frame_name == SideBarFrameName.MAIN:
+            return self.main_frame
+        LOGGER.error(f'[frame_name] is wrong. {frame_name=}')
+        raise ValueError
+
     def on_add_button(self, frame_name: SideBarFrameName, page_name: str) -> None:
         """Add the sidebar button.
 
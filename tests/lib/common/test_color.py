@@ -0,0 +1,97 @@
+"""This is the module that tests color.py.
+"""
+
+from logging import getLogger
+
+import pytest
+
+from lib.common import color
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class FakeMaster:
+    """Imitates ``winfo_rgb`` of Tk and counts the calls.
+    """
+    def __init__(self):
+        self.count = 0
+
+    def winfo_rgb(self, name):
+        self.count += 1
+        if name != 'gray86':
+            msg = f'unknown color name "{name}"'
+            raise color.tk.TclError(msg)
+        return (0xDBDB, 0xDBDB, 0xDBDB)
+
+
+class TestColorResolver:
+    """Tests :class:`color.ColorResolver`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The color names are resolved by ``winfo_rgb`` once, including the invalid
+            ones.
+        """
+        master = FakeMaster()
+        resolver = color.ColorResolver(master=master)
+        for _ in range(3):
+            assert resolver.to_rgb(name='gray86') == 0xDBDBDB
+            assert resolver.to_rgb(name=color.TRANSPARENT) == color.NO_RGB
+            assert not resolver.is_valid(name='grey_86')
+        assert master.count == 2
+
+        with pytest.raises(ValueError):
+            resolver.to_rgb(name='grey_86')
+
+    def test_many(self):
+        """Tests that no errors are raised.
+
+        *   Each color is resolved once, and each invalid color is reported once.
+        """
+        master = FakeMaster()
+        resolver = color.ColorResolver(master=master)
+        values, invalid = resolver.to_rgb_many(
+            names=['gray86', '#GGG', 'grey_86', 'gray86', '#fff', '#GGG', 'grey_86'],
+        )
+        assert list(values) == [
+            0xDBDBDB, color.NO_RGB, color.NO_RGB, 0xDBDBDB, 0xF0F0F0, color.NO_RGB,
+            color.NO_RGB,
+        ]
+        assert invalid == ['#GGG', 'grey_86']
+        assert master.count == 2
+
+    def test_headless(self):
+        """Tests that no errors are raised.
+
+        *   Without a master, the basic color names are resolved.
+        """
+        resolver = color.ColorResolver()
+        values, invalid = resolver.to_rgb_many(
+            names=['gray86', 'grey14', 'White', '#000', 'gray101', 'navyblue'],
+        )
+        assert list(values) == [
+            0xDBDBDB, 0x242424, 0xFFFFFF, 0x000000, color.NO_RGB, color.NO_RGB,
+        ]
+        assert invalid == ['gray101', 'navyblue']
+
+    def test_check_theme(self):
+        """Tests that no errors are raised.
+
+        *   The invalid colors are reported per setting, and empty colors are valid.
+        """
+        resolver = color.ColorResolver()
+        data = {
+            'CTkButton': {
+                'fg_color': ['#3B8ED0', '#1F6AA'],
+                'text_color': ['', 'gray98'],
+                'corner_radius': 6,
+            },
+            'CTkFrame': {'fg_color': 'transparent'},
+        }
+        assert resolver.check_theme(data=data) == [
+            "CTkButton.fg_color: ['#3B8ED0', '#1F6AA'] is not a color.",
+        ]
+        assert resolver.is_valid_value(key='corner_radius', val=6)
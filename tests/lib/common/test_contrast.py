@@ -0,0 +1,93 @@
+"""This is the module that tests contrast.py.
+"""
+
+import json
+from logging import getLogger
+from pathlib import Path
+
+import customtkinter
+import pytest
+
+from lib.common import contrast
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class TestContrastRatios:
+    """Tests :func:`contrast.contrast_ratios`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The ratios match the WCAG 2 examples in both directions.
+        """
+        ratios = contrast.contrast_ratios(
+            fg=[0x000000, 0xFFFFFF, 0x777777, 0x123456],
+            bg=[0xFFFFFF, 0x000000, 0xFFFFFF, 0x123456],
+        )
+        assert ratios == pytest.approx([21.0, 21.0, 4.48, 1.0], abs=0.01)
+
+
+class TestContrastAuditor:
+    """Tests :class:`contrast.ContrastAuditor`.
+    """
+    data = {
+        'CTk': {'fg_color': ['gray92', 'gray14']},
+        'CTkLabel': {'fg_color': 'transparent', 'text_color': ['gray10', 'gray20']},
+        'CTkButton': {
+            'fg_color': ['#3B8ED0', '#1F6AA5'],
+            'text_color': '#000000',
+            'corner_radius': 6,
+        },
+    }
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Transparent backgrounds are audited on the window color.
+        *   Only the failing pairs are reported per mode.
+        """
+        auditor = contrast.ContrastAuditor()
+        issues = auditor.audit(data=self.data)
+        assert [(i.page_name, i.key, i.bg_key, i.mode) for i in issues] == [
+            ('CTkLabel', 'text_color', 'fg_color', 'dark'),
+            ('CTkButton', 'text_color', 'fg_color', 'dark'),
+        ]
+        assert all(issue.ratio < issue.min_ratio for issue in issues)
+
+        issues = auditor.audit(data=self.data, page_names=['CTkButton'])
+        assert [issue.page_name for issue in issues] == ['CTkButton']
+
+    def test_many(self):
+        """Tests that no errors are raised.
+
+        *   Many themes are audited in one batch, and the issues are split per theme.
+        """
+        auditor = contrast.ContrastAuditor(min_ratios={'text_color': 1.0})
+        issues = auditor.audit_many(themes={'a': self.data, 'b': {}})
+        assert issues == {'a': [], 'b': []}
+
+    def test_pairs(self):
+        """Tests that no errors are raised.
+
+        *   The labels drawn on the parent are paired with the window color.
+        *   The colors of the inner parts are not paired with the text.
+        """
+        fpath = Path(customtkinter.__file__).parent / 'assets/themes/blue.json'
+        data = json.loads(fpath.read_text(encoding='utf-8'))
+        auditor = contrast.ContrastAuditor()
+        pairs = {label[:3] for label, _, _ in auditor.get_pairs(data=data)}
+        assert {
+            (page_name, key, bg_key) for page_name, key, bg_key in pairs
+            if page_name in ('CTkCheckBox', 'CTkSwitch', 'CTkRadioButton')
+        } == {
+            *(
+                (page_name, key, 'CTk.fg_color')
+                for page_name in ('CTkCheckBox', 'CTkSwitch', 'CTkRadioButton')
+                for key in ('text_color', 'text_color_disabled')
+            ),
+            ('CTkCheckBox', 'checkmark_color', 'fg_color'),
+        }
+        assert ('CTkComboBox', 'text_color_disabled', 'button_color') not in pairs
@@ -1,6 +1,9 @@
 """This is the module that tests file.py.
 """
 
+import json
+import marshal
+import os
 import shutil
 from logging import getLogger
 from pathlib import Path
@@ -42,6 +45,24 @@ class TestJson:
         data = file.load_json(fpath=fpath)
         assert self.params == data
 
+    def test_fast(self, tmp_path):
+        """Tests that no errors are raised.
+
+        *   By default, the same text as ``json.dump`` is written.
+        *   With ``fast=True``, non-ASCII characters are written as UTF-8.
+        """
+        data = {'family': 'ゴシック', 'size': 13}
+        fpath = tmp_path / 'font.json'
+        file.dump_json(data=data, fpath=fpath, indent=2)
+        assert fpath.read_bytes() == json.dumps(data, indent=2).encode('ascii')
+        file.dump_json(data=data, fpath=fpath, indent=2, fast=True)
+        assert fpath.read_bytes() == json.dumps(
+            data,
+            indent=2,
+            ensure_ascii=False,
+        ).encode('utf-8')
+        assert file.load_json(fpath=fpath) == data
+
 
 class TestYaml:
     """Tests :func:`file.dump_yaml` and :func:`file.load_yaml`.
@@ -98,3 +119,213 @@ class TestToml:
         file.dump_toml(data=self.params, fpath=fpath)
         data = file.load_toml(fpath=fpath)
         assert self.params == data
+
+
+class TestIterJsonChunks:
+    """Tests :func:`file.iter_json_chunks`.
+    """
+    data = {
+        'CTk': {'fg_color': ['gray92', 'gray14']},
+        'CTkButton': {'corner_radius': 6, 'text_color': ['#DCE4EE', '#DCE4EE']},
+        'CTkFont': {'Linux': {'family': 'Roboto', 'size': 13, 'weight': 'normal'}},
+    }
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The joined text is the same as ``json.dumps(indent=2)``.
+        *   The items of all chunks are the same as the data.
+        """
+        for chunk_size in [1, 50, 65536]:
+            chunks = list(file.iter_json_chunks(data=self.data, chunk_size=chunk_size))
+            assert ''.join(text for text, _ in chunks) == json.dumps(self.data, indent=2)
+            items = {}
+            for _, chunk in chunks:
+                items.update(chunk)
+            assert items == self.data
+        assert len(list(file.iter_json_chunks(data=self.data, chunk_size=1))) == 4
+
+    def test_empty(self):
+        """Tests that no errors are raised.
+
+        *   Empty data is one chunk.
+        """
+        assert list(file.iter_json_chunks(data={})) == [('{}', {})]
+
+
+class TestThemeCache:
+    """Tests :class:`file.ThemeCache`.
+    """
+    def test(self, tmp_path):
+        """Tests that no errors are raised.
+
+        *   The same file is loaded from memory, and a changed file is parsed again.
+        """
+        fpath = Path(tmp_path, 'theme.json')
+        fpath.write_text(json.dumps({'CTk': {'fg_color': 'gray92'}}), encoding='utf-8')
+        theme_cache = file.ThemeCache()
+        data = theme_cache.load(fpath=fpath)
+        assert theme_cache.load(fpath=fpath) is data
+        assert theme_cache.stats == file.CacheStats(hits=1, disk_hits=0, misses=1)
+
+        fpath.write_text(json.dumps({'CTk': {'fg_color': 'gray14'}}), encoding='utf-8')
+        assert theme_cache.load(fpath=fpath) == {'CTk': {'fg_color': 'gray14'}}
+        assert theme_cache.stats.misses == 2
+
+    def test_lru(self, tmp_path):
+        """Tests that no errors are raised.
+
+        *   The least recently used file is removed from memory.
+        """
+        theme_cache = file.ThemeCache(maxsize=2)
+        fpaths = [Path(tmp_path, f'theme{i}.json') for i in range(3)]
+        for i, fpath in enumerate(fpaths):
+            fpath.write_text(json.dumps({'CTk': {'corner_radius': i}}), encoding='utf-8')
+            theme_cache.load(fpath=fpath)
+        assert list(theme_cache.items) == [str(fpath.resolve()) for fpath in fpaths[1:]]
+
+    def test_stat(self, tmp_path, mocker):
+        """Tests that no errors are raised.
+
+        *   A file with an old mtime and the same size is not read again.
+        *   A touched file with the same content is read but not parsed again.
+        """
+        fpath = Path(tmp_path, 'theme.json')
+        fpath.write_text(json.dumps({'CTk': {'fg_color': 'gray92'}}), encoding='utf-8')
+        mtime_ns = fpath.stat().st_mtime_ns - 10 * file.STAT_MARGIN_NS
+        os.utime(fpath, ns=(mtime_ns, mtime_ns))
+        theme_cache = file.ThemeCache()
+        data = theme_cache.load(fpath=fpath)
+
+        read_bytes = mocker.spy(Path, 'read_bytes')
+        assert theme_cache.load(fpath=fpath) is data
+        assert read_bytes.call_count == 0
+
+        os.utime(fpath)
+        assert theme_cache.load(fpath=fpath) is data
+        assert read_bytes.call_count == 1
+        assert theme_cache.stats == file.CacheStats(hits=2, disk_hits=0, misses=1)
+
+    def test_disk(self, tmp_path):
+        """Tests that no errors are raised.
+
+        *   The on-disk cache is reused by another instance.
+        """
+        fpath = Path(tmp_path, 'theme.json')
+        fpath.write_text(json.dumps({'CTk': {'fg_color': 'gray92'}}), encoding='utf-8')
+        cache_dir = Path(tmp_path, 'cache')
+        file.ThemeCache(cache_dir=cache_dir).load(fpath=fpath)
+
+        theme_cache = file.ThemeCache(cache_dir=cache_dir)
+        assert theme_cache.load(fpath=fpath) == {'CTk': {'fg_color': 'gray92'}}
+        assert theme_cache.stats.disk_hits == 1
+        assert theme_cache.stats.misses == 0
+        assert [path.suffix for path in cache_dir.iterdir()] == ['.marshal']
+
+    def test_disk_broken(self, tmp_path):
+        """Tests that no errors are raised.
+
+        *   A broken cache file is ignored, and the file is parsed again.
+        """
+        fpath = Path(tmp_path, 'theme.json')
+        fpath.write_text(json.dumps({'CTk': {'fg_color': 'gray92'}}), encoding='utf-8')
+        cache_dir = Path(tmp_path, 'cache')
+        file.ThemeCache(cache_dir=cache_dir).load(fpath=fpath)
+        for cache_path in cache_dir.iterdir():
+            cache_path.write_bytes(cache_path.read_bytes()[:5])
+
+        theme_cache = file.ThemeCache(cache_dir=cache_dir)
+        assert theme_cache.load(fpath=fpath) == {'CTk': {'fg_color': 'gray92'}}
+        assert theme_cache.stats.misses == 1
+
+    def test_disk_changed(self, tmp_path):
+        """Tests that no errors are raised.
+
+        *   A cache file whose marshal data does not match its hash is not loaded.
+        """
+        fpath = Path(tmp_path, 'theme.json')
+        fpath.write_text(json.dumps({'CTk': {'fg_color': 'gray92'}}), encoding='utf-8')
+        cache_dir = Path(tmp_path, 'cache')
+        file.ThemeCache(cache_dir=cache_dir).load(fpath=fpath)
+        for cache_path in cache_dir.iterdir():
+            raw = cache_path.read_bytes()
+            cache_path.write_bytes(
+                raw[:file.CACHE_DIGEST_SIZE] + marshal.dumps({'CTk': {}}),
+            )
+
+        theme_cache = file.ThemeCache(cache_dir=cache_dir)
+        assert theme_cache.load(fpath=fpath) == {'CTk': {'fg_color': 'gray92'}}
+        assert theme_cache.stats.misses == 1
+
+
+class TestJsonSerializer:
+    """Tests :func:`file.dumps_json` and :func:`file.loads_json`.
+    """
+    data = {
+        'CTkFont': {'Linux': {'family': 'ゴシック', 'size': 13, 'weight': 'normal'}},
+        'CTkButton': {'fg_color': ['#3a7ebf', '#1f538d'], 'corner_radius': 6},
+    }
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   All backends write the same text as the stdlib json and read it back.
+        *   The same text is written with and without an indent.
+        """
+        for indent in (2, None):
+            expected = json.dumps(
+                self.data,
+                indent=indent,
+                ensure_ascii=False,
+            ).encode('utf-8')
+            for backend in file.JSON_SERIALIZERS:
+                raw = file.dumps_json(data=self.data, indent=indent, backend=backend)
+                assert raw == expected
+                assert file.loads_json(raw=raw, backend=backend) == self.data
+
+    def test_fallback(self):
+        """Tests that no errors are raised.
+
+        *   Unsupported arguments fall back to the stdlib json.
+        """
+        raw = file.dumps_json(data={'b': 1, 'a': 2}, indent=4, sort_keys=True)
+        assert raw == json.dumps({'a': 2, 'b': 1}, indent=4).encode('utf-8')
+
+    def test_error(self):
+        """Tests that an error is raised.
+
+        *   ``ValueError`` is raised for an unregistered backend.
+        """
+        with pytest.raises(ValueError):
+            file.get_json_serializer(name='unknown')
+
+
+class TestWriteAtomic:
+    """Tests :func:`file.write_atomic`.
+    """
+    def test(self, tmp_path):
+        """Tests that no errors are raised.
+
+        *   The file is written only if the content is changed.
+        *   No temporary files are left.
+        """
+        fpath = Path(tmp_path, 'theme.json')
+        assert file.write_atomic(raw=b'{"a": 1}', fpath=fpath)
+        assert not file.write_atomic(raw=b'{"a": 1}', fpath=fpath)
+        assert file.write_atomic(raw=b'{"a": 2}', fpath=fpath)
+        assert fpath.read_bytes() == b'{"a": 2}'
+        assert list(tmp_path.iterdir()) == [fpath]
+
+    def test_error(self, tmp_path, mocker):
+        """Tests that an error is raised.
+
+        *   If renaming fails, the file is not changed and the temporary file is
+            removed.
+        """
+        fpath = Path(tmp_path, 'theme.json')
+        fpath.write_bytes(b'{"a": 1}')
+        mocker.patch('pathlib.Path.replace', side_effect=OSError)
+        with pytest.raises(OSError):
+            file.write_atomic(raw=b'{"a": 2}', fpath=fpath)
+        assert fpath.read_bytes() == b'{"a": 1}'
+        assert list(tmp_path.iterdir()) == [fpath]
@@ -0,0 +1,46 @@
+"""This is the module that tests metrics.py.
+"""
+
+from logging import getLogger
+
+from lib.common import metrics
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class TestLatencyHistogram:
+    """Tests :class:`metrics.LatencyHistogram`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The count, total, max and buckets match the added values.
+        """
+        hist = metrics.LatencyHistogram()
+        for val in [5e-5, 2e-3, 2e-3, 3.0]:
+            hist.add(value=val)
+
+        assert hist.count == 4
+        assert hist.max == 3.0
+        assert round(number=hist.total, ndigits=6) == round(number=3.00405, ndigits=6)
+        assert hist.buckets[0] == 1
+        assert hist.buckets[3] == 2
+        assert hist.buckets[-1] == 1
+        assert sum(hist.to_dict()['histogram'].values()) == 4
+
+
+class TestFormatTable:
+    """Tests :func:`metrics.format_table`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   All lines have the same width.
+        """
+        table = metrics.format_table(header=['a', 'bbb'], rows=[[1, 2], ['ccc', 4]])
+        print(table)
+        lines = table.split('\n')
+        assert len(lines) == 4
+        assert len({len(line.rstrip()) for line in lines[:2]}) == 1
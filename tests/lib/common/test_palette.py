@@ -0,0 +1,144 @@
+"""This is the module that tests palette.py.
+"""
+
+from logging import getLogger
+
+import pytest
+
+from lib.common import palette
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class TestAdjustHLS:
+    """Tests :func:`palette.adjust_hls`.
+    """
+    rgb = [0x3B8ED0, 0x1F6AA5, 0xDBDBDB, 0x000000, 0xFFFFFF, 0xFF0000]
+
+    @pytest.mark.parametrize('backend', ['numpy', 'python'])
+    def test(self, backend, monkeypatch):
+        """Tests that no errors are raised.
+
+        *   A full hue rotation and no change keep the colors.
+        *   Inverting the lightness twice keeps the colors.
+        *   Both backends give the same colors.
+        """
+        if backend == 'numpy' and palette.np is None:
+            pytest.skip('NumPy is not installed.')
+        if backend == 'python':
+            monkeypatch.setattr(palette, 'np', None)
+
+        assert palette.adjust_hls(rgb=self.rgb, hue=360) == self.rgb
+        inverted = palette.adjust_hls(rgb=self.rgb, invert=True)
+        assert inverted[3:5] == [0xFFFFFF, 0x000000]
+        assert palette.adjust_hls(rgb=inverted, invert=True) == self.rgb
+        assert palette.adjust_hls(rgb=[0xFF0000], hue=120) == [0x00FF00]
+        assert palette.map_to_palette(
+            rgb=self.rgb,
+            palette=[0x000000, 0xFFFFFF],
+        ) == [0xFFFFFF, 0x000000, 0xFFFFFF, 0x000000, 0xFFFFFF, 0x000000]
+
+    @pytest.mark.parametrize('backend', ['numpy', 'python'])
+    def test_many(self, backend, monkeypatch):
+        """Tests that no errors are raised.
+
+        *   The colors of many variants are the same as adjusted per variant.
+        *   The colors of the variants with no HLS changes are kept.
+        """
+        if backend == 'numpy' and palette.np is None:
+            pytest.skip('NumPy is not installed.')
+        if backend == 'python':
+            monkeypatch.setattr(palette, 'np', None)
+
+        variants = [
+            palette.Variant(name='a', hue=30, lightness=-0.1),
+            palette.Variant(name='b'),
+            palette.Variant(name='c', saturation=0.2),
+        ]
+        values = [self.rgb, self.rgb[:2], self.rgb[3:]]
+        assert palette.adjust_many(values=values, variants=variants) == [
+            palette.adjust_hls(rgb=self.rgb, hue=30, lightness=-0.1),
+            self.rgb[:2],
+            palette.adjust_hls(rgb=self.rgb[3:], saturation=0.2),
+        ]
+
+
+class TestPaletteTransformer:
+    """Tests :class:`palette.PaletteTransformer`.
+    """
+    data = {
+        'CTkButton': {
+            'fg_color': ['#3B8ED0', '#1F6AA5'],
+            'text_color': 'gray98',
+            'corner_radius': 6,
+        },
+        'CTkFrame': {'fg_color': 'transparent', 'border_color': ['#979DA2', '#565B5E']},
+    }
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Only the colors with hue are changed, and the rest is kept as it is.
+        """
+        transformer = palette.PaletteTransformer()
+        data = transformer.transform(data=self.data, variant=palette.Variant(
+            name='test',
+            hue=180,
+        ))
+        assert data['CTkButton']['fg_color'] == ['#D07D3B', '#A55A1F']
+        assert data['CTkButton']['text_color'] == 'gray98'
+        assert data['CTkButton']['corner_radius'] == 6
+        assert data['CTkFrame']['fg_color'] == 'transparent'
+        assert list(data) == list(self.data)
+
+    def test_dark_from_light(self):
+        """Tests that no errors are raised.
+
+        *   The dark mode colors are the light mode colors with inverted lightness.
+        """
+        transformer = palette.PaletteTransformer()
+        data = transformer.transform(
+            data=self.data,
+            variant=palette.PRESET_VARIANTS['dark_from_light'],
+        )
+        assert data['CTkButton']['text_color'] == ['gray98', '#050505']
+        assert data['CTkButton']['fg_color'][0] == '#3B8ED0'
+        assert data['CTkFrame']['fg_color'] == 'transparent'
+        assert transformer.transform(data=self.data, variant=palette.Variant(
+            name='test',
+        )) == self.data
+
+    def test_palette(self):
+        """Tests that no errors are raised.
+
+        *   All colors are mapped to the target palette.
+        """
+        transformer = palette.PaletteTransformer()
+        variants = palette.parse_variants(specs=[
+            'darken',
+            {'name': 'mono', 'palette': ['#000000', 'white']},
+        ])
+        results = dict(transformer.transform_many(data=self.data, variants=variants))
+        assert list(results) == ['darken', 'mono']
+        assert results['mono']['CTkButton']['fg_color'] == ['#FFFFFF', '#000000']
+        assert results['mono']['CTkButton']['text_color'] == '#FFFFFF'
+
+        with pytest.raises(ValueError):
+            palette.parse_variants(specs=['unknown'])
+
+    def test_many(self):
+        """Tests that no errors are raised.
+
+        *   The variants applied at once are the same as applied one by one.
+        """
+        transformer = palette.PaletteTransformer()
+        variants = palette.parse_variants(specs=[
+            *palette.PRESET_VARIANTS,
+            {'name': 'mono', 'palette': ['#000000', 'white'], 'hue': 90},
+        ])
+        assert dict(transformer.transform_many(data=self.data, variants=variants)) == {
+            variant.name: transformer.transform(data=self.data, variant=variant)
+            for variant in variants
+        }
@@ -56,3 +56,40 @@ class TestSecToHMS:
         assert minutes == mm
         assert seconds == ss
         assert miliseconds == round(number=ms, ndigits=3)
+
+
+class TestDiffTheme:
+    """Tests :func:`process.diff_theme`.
+    """
+    old = {
+        'CTkButton': {'fg_color': ['#3a7ebf', '#1f538d'], 'corner_radius': 6},
+        'CTkFont': {'Linux': {'family': 'Roboto', 'size': 13, 'weight': 'normal'}},
+    }
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Only the changed values are returned.
+        """
+        new = {
+            'CTkButton': {'fg_color': ['#3a7ebf', '#1f538d'], 'corner_radius': 8},
+            'CTkFont': {'Linux': {'family': 'Roboto', 'size': 14, 'weight': 'normal'}},
+        }
+        assert process.diff_theme(old=self.old, new=new) == {
+            'CTkButton': {'corner_radius': 8},
+            'CTkFont': {'Linux': {'family': 'Roboto', 'size': 14, 'weight': 'normal'}},
+        }
+        assert process.diff_theme(old=self.old, new=self.old) == {}
+
+    def test_shape(self):
+        """Tests that no errors are raised.
+
+        *   ``None`` is returned if the pages or keys are changed.
+        """
+        params = [
+            {'CTkButton': self.old['CTkButton']},
+            {**self.old, 'CTkButton': {'fg_color': 'gray', 'border_width': 0}},
+            {**self.old, 'CTkFont': {'Linux': {'family': 'Roboto', 'size': 13}}},
+        ]
+        for new in params:
+            assert process.diff_theme(old=self.old, new=new) is None
@@ -0,0 +1,131 @@
+"""This is the module that tests schema.py.
+"""
+
+from logging import getLogger
+
+import pytest
+
+from lib.common import schema
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class TestClassifyKey:
+    """Tests :func:`schema.classify_key`.
+    """
+    params = {
+        'fg_color': schema.Kind.COLOR,
+        'text_color_disabled': schema.Kind.COLOR,
+        'corner_radius': schema.Kind.NUMBER,
+        'border_width_checked': schema.Kind.NUMBER,
+        'button_length': schema.Kind.NUMBER,
+        'border_spacing': schema.Kind.NUMBER,
+        'macOS': schema.Kind.FONT,
+    }
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The keys are classified into the correct kinds.
+        """
+        for key, kind in self.params.items():
+            assert schema.classify_key(key=key) == kind
+
+    def test_error(self):
+        """Tests that an error is raised.
+
+        *   ``ValueError`` is raised for an unsupported key.
+        """
+        with pytest.raises(ValueError):
+            schema.classify_key(key='unknown')
+
+
+class TestParse:
+    """Tests the parsers and :func:`schema.split_value`.
+    """
+    params = [
+        ('fg_color', ['#000000', '#ffffff']),
+        ('fg_color', 'transparent'),
+        ('corner_radius', 6),
+        ('macOS', {'family': 'SF Display', 'size': 13, 'weight': 'normal'}),
+    ]
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Parsing the split raw values returns the original value.
+        """
+        for key, val in self.params:
+            spec = schema.get_key_spec(page_name='CTkButton', key=key)
+            raw = schema.split_value(kind=spec.kind, val=val)
+            raw = {k: '' if v is None else str(v) for k, v in raw.items()}
+            assert spec.parse(raw) == val
+
+    def test_color(self):
+        """Tests that no errors are raised.
+
+        *   The same light and dark colors are parsed into one color.
+        """
+        raw = {schema.Mode.LIGHT: 'gray10', schema.Mode.DARK: 'gray10'}
+        assert schema.parse_color(raw=raw) == 'gray10'
+
+
+class TestCompilePage:
+    """Tests :func:`schema.compile_page`.
+    """
+    values = {'corner_radius': 6, 'fg_color': 'gray90', 'top_fg_color': 'gray85'}
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The schema is cached per page shape.
+        *   The target widget properties are mapped.
+        """
+        page_schema = schema.compile_page(page_name='CTkFrame', keys=tuple(self.values))
+        assert page_schema is schema.compile_page(
+            page_name='CTkFrame',
+            keys=tuple(dict(self.values)),
+        )
+        assert page_schema.get(key='fg_color').prop == 'fg_color'
+        assert page_schema.get(key='top_fg_color').prop is None
+        assert page_schema.props == ('corner_radius', 'fg_color')
+        font_schema = schema.compile_page(page_name='CTkFont', keys=('Linux',))
+        assert font_schema.get(key='Linux').kind == schema.Kind.FONT
+
+    def test_error(self):
+        """Tests that an error is raised.
+
+        *   ``ValueError`` is raised for an unsupported key.
+        """
+        page_schema = schema.compile_page(page_name='CTkButton', keys=('unknown',))
+        assert not page_schema.specs
+        with pytest.raises(ValueError):
+            page_schema.get(key='unknown')
+
+
+class TestNormalizeTheme:
+    """Tests :func:`schema.normalize_theme`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The same light and dark colors are merged and numbers are kept.
+        *   Invalid settings are reported and kept as they are.
+        """
+        data = {
+            'CTkButton': {
+                'fg_color': ['#000000', '#000000'],
+                'corner_radius': 6,
+                'unknown': 1,
+            },
+            'CTkLabel': {'text_color': ['#000000', '#FFFFFF']},
+        }
+        normalized, errors = schema.normalize_theme(data=data)
+        assert normalized == {
+            'CTkButton': {'fg_color': '#000000', 'corner_radius': 6, 'unknown': 1},
+            'CTkLabel': {'text_color': ['#000000', '#FFFFFF']},
+        }
+        assert len(errors) == 1
+        assert errors[0].startswith('CTkButton.unknown')
@@ -0,0 +1,98 @@
+"""This is the module that tests store.py.
+"""
+
+import json
+from logging import getLogger
+
+from lib.common import store
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class TestThemeStore:
+    """Tests :class:`store.ThemeStore`.
+    """
+    data = {
+        'CTkButton': {'fg_color': ['#3a7ebf', '#1f538d'], 'corner_radius': 6},
+        'CTkFont': {'Linux': {'family': 'ロボト', 'size': 13, 'weight': 'normal'}},
+        'CTkLabel': {'text_color': ['gray14', 'gray84']},
+    }
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Only the changed pages are marked dirty.
+        *   The json text matches ``json.dumps`` after the changes.
+        """
+        theme_store = store.ThemeStore()
+        theme_store.load(data=self.data)
+        assert not theme_store.dirty
+        assert theme_store.to_json() == json.dumps(
+            self.data,
+            indent=2,
+            ensure_ascii=False,
+        )
+
+        assert not theme_store.set_value(
+            page_name='CTkButton',
+            key='corner_radius',
+            val=6,
+        )
+        assert theme_store.set_value(page_name='CTkButton', key='corner_radius', val=8)
+        assert theme_store.dirty == {'CTkButton'}
+        assert theme_store.update_page(
+            page_name='CTkLabel',
+            values={'text_color': ['gray10', 'gray90']},
+            dirty=False,
+        )
+        assert theme_store.dirty == {'CTkButton'}
+
+        data, _ = theme_store.snapshot()
+        assert data['CTkButton']['corner_radius'] == 8
+        assert self.data['CTkButton']['corner_radius'] == 6
+        assert theme_store.to_json() == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_mark_clean(self):
+        """Tests that no errors are raised.
+
+        *   Pages changed after the snapshot stay dirty.
+        *   All pages are dirty after loading a theme that is not saved yet.
+        """
+        theme_store = store.ThemeStore()
+        theme_store.load(data=self.data)
+        theme_store.set_value(page_name='CTkButton', key='corner_radius', val=8)
+        theme_store.set_value(page_name='CTkLabel', key='text_color', val='gray10')
+        _, versions = theme_store.snapshot()
+        theme_store.set_value(page_name='CTkButton', key='corner_radius', val=10)
+
+        theme_store.mark_clean(versions=versions)
+        assert theme_store.dirty == {'CTkButton'}
+        theme_store.mark_clean()
+        assert not theme_store.dirty
+
+        theme_store.load(data=self.data, dirty=True)
+        assert theme_store.dirty == set(self.data)
+
+    def test_pages(self):
+        """Tests that no errors are raised.
+
+        *   Only the set pages are replaced and formatted again.
+        *   The removed pages are not in the json text.
+        """
+        theme_store = store.ThemeStore()
+        theme_store.load(data=self.data)
+        theme_store.set_value(page_name='CTkButton', key='corner_radius', val=8)
+        theme_store.to_json()
+
+        theme_store.set_pages(data={'CTkButton': {'corner_radius': 6}})
+        assert theme_store.get_page(page_name='CTkButton') == {'corner_radius': 6}
+        assert not theme_store.dirty
+        assert set(theme_store.fragments) == {'CTkFont', 'CTkLabel'}
+
+        theme_store.remove_pages(page_names=['CTkFont'])
+        data, versions = theme_store.snapshot()
+        assert list(data) == ['CTkButton', 'CTkLabel']
+        assert list(versions) == ['CTkButton', 'CTkLabel']
+        assert theme_store.to_json() == json.dumps(data, indent=2, ensure_ascii=False)
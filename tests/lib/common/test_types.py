@@ -0,0 +1,77 @@
+"""This is the module that tests types.py.
+"""
+
+from logging import getLogger
+
+from lib.common import types
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class TestParseHex:
+    """Tests :func:`types.parse_hex`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The hex colors of all lengths are parsed as in Tk.
+        *   Other strings are not parsed.
+        """
+        assert types.parse_hex(name='#3B8ED0') == 0x3B8ED0
+        assert types.parse_hex(name='#fff') == 0xF0F0F0
+        assert types.parse_hex(name='#123456789') == 0x124578
+        assert types.parse_hex(name='#123412341234') == 0x121212
+        for name in ('3B8ED0', '#3B8ED', '#3B8ED0 ', '#12_456', '#GGGGGG', ''):
+            assert types.parse_hex(name=name) is None
+
+
+class TestThemeModel:
+    """Tests :class:`types.ThemeModel`.
+    """
+    data = {
+        'CTkButton': {
+            'fg_color': ['#3B8ED0', '#1F6AA5'],
+            'border_color': ['#3E454A', '#949A9F'],
+            'text_color': 'gray98',
+            'corner_radius': 6,
+            'text_color_disabled': ['gray74', 'gray60'],
+        },
+        'CTkFrame': {'fg_color': 'transparent', 'border_width': 0},
+        'CTkFont': {'Linux': {'family': 'Roboto', 'size': 13, 'weight': 'normal'}},
+    }
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The model round-trips to the same theme data, including the key order.
+        *   The hex colors are packed, and the others are not resolved.
+        """
+        model = types.ThemeModel.from_data(data=self.data)
+        data = model.to_data()
+        assert data == self.data
+        assert [list(page) for page in data.values()] == [
+            list(page) for page in self.data.values()
+        ]
+        assert model.get_rgb(page_name='CTkButton', key='fg_color') == (
+            0x3B8ED0,
+            0x1F6AA5,
+        )
+        assert model.get_rgb(page_name='CTkButton', key='text_color') == (-1, -1)
+
+    def test_copy(self):
+        """Tests that no errors are raised.
+
+        *   Changing a copy does not change the original, and the table is shared.
+        """
+        model = types.ThemeModel.from_data(data=self.data)
+        other = model.copy()
+        other.set_color(page_name='CTkFrame', key='fg_color', val=['#000000', 'black'])
+        other.sections['CTkFont'].values['Linux']['size'] = 20
+        assert model.to_data() == self.data
+        assert other.get_color(page_name='CTkFrame', key='fg_color') == [
+            '#000000',
+            'black',
+        ]
+        assert other.table is model.table
@@ -0,0 +1,338 @@
+"""This is the module that tests base.py.
+"""
+
+import functools
+import queue
+import threading
+from logging import getLogger
+
+import pytest
+
+from lib.common.types import EventName as E
+from lib.common.types import ParamLog
+from lib.components import base
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class FakeMaster:
+    """Imitates the Tk scheduling methods used by :class:`base.EventBus`.
+    """
+    def __init__(self):
+        self.idle_tasks = {}
+        self.count = 0
+
+    def after_idle(self, func):
+        self.count += 1
+        idx = f'after#{self.count}'
+        self.idle_tasks[idx] = func
+        return idx
+
+    def after(self, ms, func, *args):
+        return self.after_idle(lambda: func(*args))
+
+    def after_cancel(self, idx):
+        self.idle_tasks.pop(idx, None)
+
+    def run_idle(self):
+        tasks, self.idle_tasks = self.idle_tasks, {}
+        for func in tasks.values():
+            func()
+
+
+class TestEventBusCoalesce:
+    """Tests :meth:`base.EventBus.set_coalesce`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Emits are merged per key and the last keyword arguments are run once.
+        *   The counters match the number of emits.
+        """
+        master = FakeMaster()
+        event_bus = base.EventBus(master=master)
+        event_bus.set_coalesce(event_name='change', key='item_name')
+        received = []
+        event_bus.subscribe(
+            event_name='change',
+            callback=lambda item_name, values: received.append((item_name, values)),
+        )
+
+        for i in range(5):
+            event_bus.emit(event_name='change', item_name='a', values=i)
+        event_bus.emit(event_name='change', item_name='b', values=0)
+        assert not received
+
+        master.run_idle()
+        assert received == [('a', 4), ('b', 0)]
+        assert event_bus.coalesce_stats.emitted == 6
+        assert event_bus.coalesce_stats.merged == 4
+        assert event_bus.coalesce_stats.dispatched == 2
+        assert event_bus.coalesce_stats.flushed == 1
+
+    def test_merge(self):
+        """Tests that no errors are raised.
+
+        *   The keyword arguments are merged by the merge function.
+        """
+        master = FakeMaster()
+        event_bus = base.EventBus(master=master)
+        event_bus.set_coalesce(
+            event_name='change',
+            key='item_name',
+            merge=lambda old, new: {**new, 'values': old['values'] + new['values']},
+        )
+        received = []
+        event_bus.subscribe(
+            event_name='change',
+            callback=lambda item_name, values: received.append(values),
+        )
+
+        for i in range(3):
+            event_bus.emit(event_name='change', item_name='a', values=[i])
+        master.run_idle()
+        assert received == [[0, 1, 2]]
+
+    def test_no_master(self):
+        """Tests that no errors are raised.
+
+        *   Without a master, coalesced events are run immediately.
+        """
+        event_bus = base.EventBus()
+        event_bus.set_coalesce(event_name='change', key='item_name')
+        received = []
+        event_bus.subscribe(
+            event_name='change',
+            callback=lambda item_name: received.append(item_name),
+        )
+
+        event_bus.emit(event_name='change', item_name='a')
+        assert received == ['a']
+
+    def test_error(self):
+        """Tests that an error is raised.
+
+        *   ``TypeError`` is raised for positional arguments or a missing key, so
+            they are not dropped when emits are merged.
+        """
+        event_bus = base.EventBus(master=FakeMaster())
+        event_bus.set_coalesce(event_name='change', key='item_name')
+        with pytest.raises(TypeError):
+            event_bus.emit('change', 'a', item_name='a')
+        with pytest.raises(TypeError):
+            event_bus.emit(event_name='change', values=0)
+        assert not event_bus.pending
+
+
+class TestEventBusBatch:
+    """Tests :meth:`base.EventBus.batch`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Coalesced events are held until the outermost batch is committed.
+        *   The begin and commit events surround the held events.
+        """
+        master = FakeMaster()
+        event_bus = base.EventBus(master=master)
+        event_bus.set_coalesce(event_name='change', key='item_name')
+        received = []
+        event_bus.subscribe(
+            event_name='change',
+            callback=lambda item_name: received.append(item_name),
+        )
+        event_bus.subscribe(
+            event_name=E.BEGIN_BATCH,
+            callback=lambda: received.append(E.BEGIN_BATCH),
+        )
+        event_bus.subscribe(
+            event_name=E.COMMIT_BATCH,
+            callback=lambda: received.append(E.COMMIT_BATCH),
+        )
+
+        with event_bus.batch():
+            event_bus.emit(event_name='change', item_name='a')
+            with event_bus.batch():
+                event_bus.emit(event_name='change', item_name='b')
+            event_bus.emit(event_name='change', item_name='a')
+            assert received == [E.BEGIN_BATCH]
+            assert not master.idle_tasks
+        assert received == [E.BEGIN_BATCH, 'a', 'b', E.COMMIT_BATCH]
+        assert event_bus.coalesce_stats.flushed == 1
+
+    def test_no_master(self):
+        """Tests that no errors are raised.
+
+        *   Without a master, coalesced events are also held in a batch.
+        """
+        event_bus = base.EventBus()
+        event_bus.set_coalesce(event_name='change', key='item_name')
+        received = []
+        event_bus.subscribe(
+            event_name='change',
+            callback=lambda item_name: received.append(item_name),
+        )
+
+        with event_bus.batch():
+            event_bus.emit(event_name='change', item_name='a')
+            assert not received
+        assert received == ['a']
+
+
+class Listener:
+    """Receives events in :class:`TestEventBusWeakRef`.
+    """
+    def __init__(self):
+        self.count = 0
+
+    def on_event(self):
+        self.count += 1
+
+
+class TestEventBusWeakRef:
+    """Tests :meth:`base.EventBus.subscribe` and :meth:`base.EventBus.unsubscribe`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   An unsubscribed listener no longer receives events.
+        *   A garbage collected listener is removed on emit.
+        """
+        event_bus = base.EventBus()
+        listeners = [Listener() for _ in range(3)]
+        for i in range(3):
+            event_bus.subscribe(event_name='event', callback=listeners[i].on_event)
+
+        event_bus.unsubscribe(event_name='event', callback=listeners[0].on_event)
+        event_bus.emit(event_name='event')
+        assert [listener.count for listener in listeners] == [0, 1, 1]
+
+        del listeners[2]
+        event_bus.emit(event_name='event')
+        assert len(event_bus.listeners['event']) == 1
+        assert listeners[1].count == 2
+
+    def test_flat(self):
+        """Tests that no errors are raised.
+
+        *   The number of listeners stays flat across subscribe/unsubscribe cycles.
+        """
+        event_bus = base.EventBus()
+        for _ in range(300):
+            listener = Listener()
+            event_bus.subscribe(event_name='event', callback=listener.on_event)
+            event_bus.emit(event_name='event')
+            event_bus.unsubscribe(event_name='event', callback=listener.on_event)
+        assert 'event' not in event_bus.listeners
+
+
+class TestEventProfiler:
+    """Tests :class:`base.EventProfiler`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Events and callbacks are counted and the nesting depth is recorded.
+        """
+        event_bus = base.EventBus()
+        profiler = event_bus.enable_profiling()
+
+        def on_outer():
+            event_bus.emit(event_name='inner')
+
+        def on_inner(value):
+            return value
+
+        # [Attention]
+        # functools.partial does not have __qualname__, so it is recorded per repr.
+        on_partial = functools.partial(on_inner, 0)
+        event_bus.subscribe(event_name='outer', callback=on_outer)
+        event_bus.subscribe(event_name='inner', callback=on_partial)
+        event_bus.emit(event_name='outer')
+        event_bus.emit(event_name='outer')
+
+        assert profiler.events['outer'].count == 2
+        assert profiler.events['inner'].count == 2
+        assert profiler.depths == {'outer': 1, 'inner': 2}
+        assert profiler.chains == {'outer > inner': 2}
+        assert set(profiler.to_dict()['callbacks']) == {
+            on_outer.__qualname__,
+            repr(on_partial),
+        }
+        print(profiler.format_table())
+
+
+class TestEventBusPost:
+    """Tests :meth:`base.EventBus.post`.
+    """
+    def run_thread(self, func):
+        errors = []
+
+        def _target():
+            try:
+                func()
+            except queue.Full as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=_target)
+        thread.start()
+        thread.join()
+        return errors
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Events posted from another thread are run on the polling thread.
+        *   The queue metrics match the number of posted events.
+        """
+        master = FakeMaster()
+        event_bus = base.EventBus(master=master)
+        received = []
+        event_bus.subscribe(
+            event_name='event',
+            callback=lambda value: received.append((value, threading.get_ident())),
+        )
+        event_bus.start_polling()
+
+        errors = self.run_thread(
+            func=lambda: [event_bus.post('event', value=i) for i in range(3)],
+        )
+        assert not errors
+        assert not received
+
+        master.run_idle()
+        assert received == [(i, threading.get_ident()) for i in range(3)]
+        assert event_bus.queue_stats.posted == 3
+        assert event_bus.queue_stats.dispatched == 3
+        assert event_bus.queue_stats.max_depth == 3
+        assert event_bus.queue_stats.delay.count == 3
+        # polling is rescheduled.
+        assert len(master.idle_tasks) == 1
+
+        event_bus.stop_polling()
+        assert not master.idle_tasks
+
+    def test_full(self):
+        """Tests that an error is raised.
+
+        *   ``queue.Full`` is raised when the queue is full.
+        """
+        event_bus = base.EventBus(master=FakeMaster(), queue_size=2, post_timeout=0.01)
+
+        errors = self.run_thread(
+            func=lambda: [event_bus.post('event', value=i) for i in range(3)],
+        )
+        assert len(errors) == 1
+        assert isinstance(errors[0], queue.Full)
+        assert event_bus.queue_stats.posted == 2
+        assert event_bus.queue_stats.rejected == 1
+
+    def test_no_master(self):
+        """Tests that an error is raised.
+
+        *   ``ValueError`` is raised when polling without a master.
+        """
+        event_bus = base.EventBus(master=None)
+        with pytest.raises(ValueError):
+            event_bus.start_polling()
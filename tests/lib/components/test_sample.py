@@ -0,0 +1,134 @@
+"""This is the module that tests sample.py.
+"""
+
+from logging import getLogger
+
+from lib.common.color import ColorResolver
+from lib.common.types import ParamLog
+from lib.components import sample
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class TestDiffProps:
+    """Tests :func:`sample.diff_props`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Only the properties that differ from the applied values are returned.
+        """
+        applied = {'fg_color': ['#FFFFFF', '#000000'], 'corner_radius': 6}
+        diff = sample.diff_props(
+            applied=applied,
+            values={
+                'fg_color': ['#FFFFFF', '#000000'],
+                'corner_radius': 8,
+                'text_color': '#000000',
+            },
+        )
+        assert diff == {'corner_radius': 8, 'text_color': '#000000'}
+
+    def test_same(self):
+        """Tests that no errors are raised.
+
+        *   No properties are returned if all values are applied.
+        """
+        applied = {'fg_color': '#FFFFFF'}
+        assert not sample.diff_props(applied=applied, values=dict(applied))
+
+
+class TestGetOsName:
+    """Tests :func:`sample.get_os_name`.
+    """
+    def test(self, mocker):
+        """Tests that no errors are raised.
+
+        *   'Darwin' is converted to the 'macOS' key of the theme.
+        """
+        mocker.patch('platform.system', return_value='Darwin')
+        assert sample.get_os_name() == 'macOS'
+        mocker.patch('platform.system', return_value='Windows')
+        assert sample.get_os_name() == 'Windows'
+
+
+class TestResolveProps:
+    """Tests :func:`sample.resolve_props`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The [light, dark] values are resolved and single values are kept.
+        """
+        kwargs = {
+            'fg_color': ['#FFFFFF', '#000000'],
+            'text_color': '#808080',
+            'corner_radius': 6,
+        }
+        assert sample.resolve_props(kwargs=kwargs, mode='light') == {
+            'fg_color': '#FFFFFF',
+            'text_color': '#808080',
+            'corner_radius': 6,
+        }
+        assert sample.resolve_props(kwargs=kwargs, mode='dark') == {
+            'fg_color': '#000000',
+            'text_color': '#808080',
+            'corner_radius': 6,
+        }
+
+
+class TestGetFontProps:
+    """Tests :func:`sample.get_font_props`.
+    """
+    def test(self, mocker):
+        """Tests that no errors are raised.
+
+        *   The settings of this OS are returned as the ctk.CTkFont properties.
+        *   ``None`` is returned if the OS key or a property is missing, or the size
+            is not a number.
+        """
+        mocker.patch('platform.system', return_value='Linux')
+        font = {'family': 'Roboto', 'size': 13, 'weight': 'normal'}
+        assert sample.get_font_props(values={'Linux': font}) == font
+        assert sample.get_font_props(values={'Windows': font}) is None
+        assert sample.get_font_props(
+            values={'Linux': {'family': 'Roboto', 'size': 13}},
+        ) is None
+        assert sample.get_font_props(values={'Linux': {**font, 'size': '1'}}) is None
+
+
+class TestGetProps:
+    """Tests :func:`sample.get_props`.
+    """
+    values = {
+        'fg_color': ['#3B8ED0', 'not a color'],
+        'hover_color': ['#36719F', '#144870'],
+        'corner_radius': 6,
+        'text_color': ['#DCE4EE', '#DCE4EE'],
+    }
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The settings with invalid colors are dropped as the App does, and the
+            missing properties are skipped.
+        *   Only the changed properties are returned.
+        """
+        color_resolver = ColorResolver()
+        values = {
+            key: val for key, val in self.values.items()
+            if color_resolver.is_valid_value(key=key, val=val)
+        }
+        assert 'fg_color' not in values
+        props = sample.get_props(item_name='CTkButton', values=values)
+        assert props == {
+            key: val for key, val in self.values.items() if key != 'fg_color'
+        }
+        props = sample.get_props(
+            item_name='CTkButton',
+            values=values,
+            changed={'fg_color', 'corner_radius'},
+        )
+        assert props == {'corner_radius': 6}
+        assert not sample.get_props(item_name='Unknown', values=values)
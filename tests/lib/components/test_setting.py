@@ -0,0 +1,96 @@
+"""This is the module that tests setting.py.
+"""
+
+from logging import getLogger
+
+from lib.common.schema import Kind, compile_page
+from lib.common.types import ParamLog
+from lib.components import setting
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class TestMergeChangeConf:
+    """Tests :func:`setting.merge_change_conf`.
+    """
+    values = {'fg_color': '#000000', 'corner_radius': 6}
+
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   The changed keys are merged and the latest values are used.
+        """
+        kwargs = setting.merge_change_conf(
+            old={'item_name': 'a', 'values': {}, 'changed': {'fg_color'}},
+            new={'item_name': 'a', 'values': self.values, 'changed': {'corner_radius'}},
+        )
+        assert kwargs == {
+            'item_name': 'a',
+            'values': self.values,
+            'changed': {'fg_color', 'corner_radius'},
+        }
+
+    def test_all(self):
+        """Tests that no errors are raised.
+
+        *   If either event changes all keys, the merged event changes all keys.
+        """
+        kwargs = setting.merge_change_conf(
+            old={'item_name': 'a', 'values': self.values, 'changed': None},
+            new={'item_name': 'a', 'values': self.values, 'changed': {'fg_color'}},
+        )
+        assert kwargs['changed'] is None
+
+
+class TestIsReusable:
+    """Tests :func:`setting.is_reusable`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   'color' settings are reusable and 'font' settings only with the same items.
+        """
+        modes = ['family', 'size']
+        assert setting.is_reusable(kind=Kind.COLOR, modes=['light', 'dark'], val='red')
+        assert setting.is_reusable(
+            kind=Kind.FONT,
+            modes=modes,
+            val={'family': 'Roboto', 'size': 13},
+        )
+        assert not setting.is_reusable(kind=Kind.FONT, modes=modes, val={'size': 13})
+        assert not setting.is_reusable(kind=Kind.FONT, modes=modes, val='Roboto')
+
+
+class TestGetRows:
+    """Tests :meth:`setting.RowPool.get_rows`.
+    """
+    def test(self):
+        """Tests that no errors are raised.
+
+        *   Each setting is flattened into the rows of the virtualized list.
+        """
+        # [Attention]
+        # get_rows only reads the data model of the page, so the widgets are not
+        # built.
+        page = setting.SettingPage.__new__(setting.SettingPage)
+        row_pool = setting.RowPool.__new__(setting.RowPool)
+        row_pool.page = page
+        page.page_name = 'CTkButton'
+        page.var_modes = {
+            'fg_color': ['light', 'dark'],
+            'corner_radius': ['none'],
+        }
+        page.schema = compile_page(page_name=page.page_name, keys=tuple(page.var_modes))
+        assert row_pool.get_rows() == [
+            ('fg_color', '', 'CTkButton-fg_color-light', 'CTkButton-fg_color-dark'),
+            ('corner_radius', '', 'CTkButton-corner_radius-none', None),
+        ]
+
+        page.page_name = 'CTkFont'
+        page.var_modes = {'Linux': ['family', 'size']}
+        page.schema = compile_page(page_name=page.page_name, keys=tuple(page.var_modes))
+        assert row_pool.get_rows() == [
+            ('Linux', 'family', None, 'CTkFont-Linux-family'),
+            ('', 'size', None, 'CTkFont-Linux-size'),
+        ]
@@ -0,0 +1,65 @@
+"""This is the module that tests batch.py.
+"""
+
+import json
+from logging import getLogger
+
+import batch
+from lib.common.palette import parse_variants
+from lib.common.types import ParamLog
+
+PARAM_LOG = ParamLog()
+LOGGER = getLogger(name=PARAM_LOG.NAME)
+
+
+class TestProcessThemes:
+    """Tests :func:`batch.process_themes`.
+    """
+    data = {
+        'CTk': {'fg_color': ['gray92', 'gray14']},
+        'CTkButton': {
+            'fg_color': ['#3a7ebf', '#1f538d'],
+            'text_color': ['#000000', '#000000'],
+            'corner_radius': 6,
+        },
+    }
+
+    def test(self, tmp_path):
+        """Tests that no errors are raised.
+
+        *   The broken theme is reported, and the other theme is still processed.
+        *   Only the good theme and its variants are written.
+        """
+        in_dir = tmp_path / 'input'
+        out_dir = tmp_path / 'themes'
+        variant_dir = tmp_path / 'variants'
+        for path in (in_dir, out_dir, variant_dir):
+            path.mkdir()
+        (in_dir / 'good.json').write_text(json.dumps(self.data), encoding='utf-8')
+        (in_dir / 'broken.json').write_text('{"CTk": ', encoding='utf-8')
+
+        report = batch.process_themes(
+            fpaths=sorted(in_dir.glob('*.json')),
+            out_dir=out_dir,
+            workers=1,
+            variants=parse_variants(specs=['hue+30']),
+            variant_dir=variant_dir,
+        )
+        assert report['themes'] == 2
+        assert report['failed'] == 1
+        assert report['low_contrast'] == 1
+        assert report['settings'] == 4
+        assert report['variants'] == 1
+        assert report['workers'] == 1
+
+        broken, good = report['results']
+        assert broken['errors'][0].startswith('JSONDecodeError')
+        assert not good['errors']
+        assert {issue['mode'] for issue in good['contrast']} == {'dark'}
+
+        assert [path.name for path in out_dir.iterdir()] == ['good.json']
+        assert json.loads((out_dir / 'good.json').read_text(encoding='utf-8')) == {
+            **self.data,
+            'CTkButton': {**self.data['CTkButton'], 'text_color': '#000000'},
+        }
+        assert [path.name for path in variant_dir.iterdir()] == ['good_hue+30.json']